@@ -11,15 +11,21 @@ Per official requirements:
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.shared_filters import render_global_filters, apply_filters, get_continent
+from utils.shared_filters import render_global_filters
 from utils.style import apply_custom_style
+from utils.data_ingest import (
+    load_athletes, load_medals_total, load_medals, load_events, load_nocs, load_catalog, load_noc_dimension
+)
+from utils.medal_cube import load_medal_cube
+from utils.bitmap_index import load_bitmap_index
+from utils.validation import render_data_warnings
+from utils.result_cache import cached_result
+from utils.viz_helpers import create_medal_donut, create_top10_standings
 
 st.set_page_config(
     layout="wide",
@@ -29,60 +35,8 @@ st.set_page_config(
 )
 apply_custom_style()
 
-DATA_PATH = Path(__file__).parent / "data"
-
-
-@st.cache_data
-def load_athletes():
-    """Load athletes data."""
-    try:
-        df = pd.read_csv(DATA_PATH / "athletes.csv")
-        df = df.rename(columns={"country_code": "noc"})
-        return df
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_medals_total():
-    """Load medal totals by country."""
-    try:
-        df = pd.read_csv(DATA_PATH / "medals_total.csv")
-        df = df.rename(columns={"country_code": "noc"})
-        return df
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_medals():
-    """Load individual medals."""
-    try:
-        df = pd.read_csv(DATA_PATH / "medals.csv")
-        df = df.rename(columns={"country_code": "noc", "medal_type": "medal"})
-        df["medal"] = df["medal"].str.replace(" Medal", "", regex=False)
-        return df
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_events():
-    """Load events data."""
-    try:
-        return pd.read_csv(DATA_PATH / "events.csv")
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_nocs():
-    """Load NOCs data."""
-    try:
-        return pd.read_csv(DATA_PATH / "nocs.csv")
-    except:
-        return pd.DataFrame()
-
+# Every source, loaded concurrently once per process
+load_catalog()
 
 # Load all data
 athletes_df = load_athletes()
@@ -90,6 +44,7 @@ medals_total_df = load_medals_total()
 medals_df = load_medals()
 events_df = load_events()
 nocs_df = load_nocs()
+medal_cube = load_medal_cube()
 
 # =============================================================================
 # SIDEBAR - GLOBAL FILTERS
@@ -115,36 +70,17 @@ with st.sidebar:
 # =============================================================================
 # APPLY FILTERS
 # =============================================================================
-filtered_medals = apply_filters(medals_df, filters)
-filtered_athletes = apply_filters(athletes_df, filters)
-
-# Recalculate totals based on filtered medals
-
-if not filtered_medals.empty:
-    filtered_totals = filtered_medals.groupby("noc").agg(
-        Gold=("medal", lambda x: (x == "Gold").sum()),
-        Silver=("medal", lambda x: (x == "Silver").sum()),
-        Bronze=("medal", lambda x: (x == "Bronze").sum()),
-    ).reset_index()
-    filtered_totals["Total"] = filtered_totals["Gold"] + filtered_totals["Silver"] + filtered_totals["Bronze"]
-    
-    # Add country names
-    if not medals_total_df.empty:
-        country_map = medals_total_df.set_index("noc")["country"].to_dict()
-        filtered_totals["country"] = filtered_totals["noc"].map(country_map).fillna(filtered_totals["noc"])
-    else:
-        filtered_totals["country"] = filtered_totals["noc"]
-    
-    filtered_totals = filtered_totals.sort_values(["Gold", "Silver", "Bronze"], ascending=False)
-else:
-    filtered_totals = pd.DataFrame()
+def tally_with_country_names(filters: dict) -> pd.DataFrame:
+    """Medal tally from the pre-aggregated medal cube, with country names from the NOC dimension."""
+    totals = medal_cube.tally(filters)
+    if totals.empty:
+        return pd.DataFrame()
+    country = totals["noc"].map(load_noc_dimension()["country"])
+    return totals.assign(country=country.fillna(totals["noc"]))
 
-# Filter athletes by country/continent
-filtered_athletes = athletes_df.copy()
-if filters["countries"]:
-    filtered_athletes = filtered_athletes[filtered_athletes["noc"].isin(filters["countries"])]
-if filters["continents"]:
-    filtered_athletes = filtered_athletes[filtered_athletes["noc"].apply(get_continent).isin(filters["continents"])]
+
+# Shared by every session with the same filters
+filtered_totals = cached_result("overview.totals", filters, lambda: tally_with_country_names(filters))
 
 # =============================================================================
 # HEADER
@@ -205,6 +141,8 @@ if len(filters["medal_types"]) < 3:
 if active_filters:
     st.info(f"📌 Active filters: {' | '.join(active_filters)}")
 
+render_data_warnings("athletes.csv", "medals.csv", "medals_total.csv", "events.csv", "nocs.csv")
+
 st.divider()
 
 # =============================================================================
@@ -213,7 +151,7 @@ st.divider()
 st.subheader("📊 Key Performance Indicators")
 
 # Calculate KPIs
-total_athletes = len(filtered_athletes) if not filtered_athletes.empty else 0
+total_athletes = load_bitmap_index("athletes").count(filters)
 total_countries = len(nocs_df) if not nocs_df.empty else 0
 total_sports = events_df["sport"].nunique() if not events_df.empty else 0
 total_medals = int(filtered_totals["Total"].sum()) if not filtered_totals.empty else 0
@@ -262,98 +200,31 @@ st.divider()
 # =============================================================================
 # CHARTS ROW
 # =============================================================================
-# Create tabs
-tab1, tab2 = st.tabs(["🥇 Global Medal Distribution", "🏆 Top 10 Medal Standings"])
+# Section selector: unlike st.tabs, only the selected chart is built and sent to the browser
+chart_section = st.radio(
+    "Chart:",
+    options=["🥇 Global Medal Distribution", "🏆 Top 10 Medal Standings"],
+    horizontal=True,
+    label_visibility="collapsed",
+    key="overview_section"
+)
 
 # -------------------------------------------------------------------------
-# Tab 1: Global Medal Distribution
+# Section 1: Global Medal Distribution
 # -------------------------------------------------------------------------
-with tab1:
+if chart_section == "🥇 Global Medal Distribution":
     if not filtered_totals.empty:
-        gold_total = int(filtered_totals["Gold"].sum())
-        silver_total = int(filtered_totals["Silver"].sum())
-        bronze_total = int(filtered_totals["Bronze"].sum())
-        
-        medal_data = pd.DataFrame({
-            "Medal": ["Gold", "Silver", "Bronze"],
-            "Count": [gold_total, silver_total, bronze_total]
-        })
-        
-        fig = px.pie(
-            medal_data,
-            values="Count",
-            names="Medal",
-            hole=0.4,
-            color="Medal",
-            color_discrete_map={
-               "Gold": "#E50914",    # Rouge intense
-            "Silver": "#AFAFAF",  # Gris chic
-            "Bronze": "#8B4513"   # Marron profond
-            },
-        )
-        fig.update_traces(
-            textposition="inside",
-            textinfo="percent+label+value",
-            hovertemplate="<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>"
-        )
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=-0.2),
-            height=400,
-            margin=dict(t=20, b=60, l=20, r=20),
-        )
+        fig = cached_result("overview.donut", filters, lambda: create_medal_donut(filtered_totals))
         st.plotly_chart(fig, use_container_width=True, key="medal_donut")
     else:
         st.warning("No medal data available for selected filters.")
 
 # -------------------------------------------------------------------------
-# Tab 2: Top 10 Medal Standings
+# Section 2: Top 10 Medal Standings
 # -------------------------------------------------------------------------
-with tab2:
+else:
     if not filtered_totals.empty:
-        top10 = filtered_totals.head(10).copy()
-        top10 = top10.sort_values("Total", ascending=True)
-        
-        fig = go.Figure()
-        
-        # Add bars for each medal type
-        fig.add_trace(go.Bar(
-            y=top10["country"],
-            x=top10["Bronze"],
-            name="Bronze",
-            orientation="h",
-            marker_color="#8B4513",
-            text=top10["Bronze"],
-            textposition="inside",
-        ))
-        fig.add_trace(go.Bar(
-            y=top10["country"],
-            x=top10["Silver"],
-            name="Silver",
-            orientation="h",
-            marker_color="#AFAFAF",
-            text=top10["Silver"],
-            textposition="inside",
-        ))
-        fig.add_trace(go.Bar(
-            y=top10["country"],
-            x=top10["Gold"],
-            name="Gold",
-            orientation="h",
-            marker_color= "#E50914", 
-            text=top10["Gold"],
-            textposition="inside",
-        ))
-        
-        fig.update_layout(
-            barmode="stack",
-            height=400,
-            margin=dict(t=20, b=20, l=20, r=20),
-            xaxis_title="Total Medals",
-            yaxis_title="",
-            legend=dict(orientation="h", yanchor="bottom", y=-0.2),
-            hovermode="y unified",
-        )
+        fig = cached_result("overview.top10", filters, lambda: create_top10_standings(filtered_totals))
         st.plotly_chart(fig, use_container_width=True, key="top10_bar")
     else:
         st.warning("No data available for selected filters.")
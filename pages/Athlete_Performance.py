@@ -1,14 +1,22 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.shared_filters import render_global_filters, apply_filters, get_continent
+from utils.shared_filters import render_global_filters, apply_filters
 from utils.style import apply_custom_style
+from utils.data_ingest import load_athletes, load_medallists, load_medals, load_catalog, parse_list
+from utils.medal_cube import medal_counts
+from utils.bitmap_index import load_bitmap_index
+from utils.athlete_search import load_athlete_search_index
+from utils.coach_index import load_coach_index
+from utils.bridges import bridge_lookup, load_athlete_disciplines, load_athlete_events
+from utils.validation import render_data_warnings
+from utils.result_cache import cached_result, versioned_cache
+from utils.viz_helpers import create_age_box, create_age_violin, create_top_athletes_bar
 
 # PAGE CONFIG
 st.set_page_config(
@@ -19,116 +27,13 @@ st.set_page_config(
 )
 apply_custom_style()
 
-# DATA LOADING
-DATA_PATH = Path(__file__).parent.parent / "data"
-
-
-@st.cache_data
-def load_athletes():
-    """Load athletes data."""
-    try:
-        df = pd.read_csv(DATA_PATH / "athletes.csv")
-        df = df.rename(columns={"country_code": "noc"})
-        # Calculate age from birth_date
-        df["birth_date"] = pd.to_datetime(df["birth_date"], errors="coerce")
-        df["age"] = ((pd.Timestamp("2024-07-26") - df["birth_date"]).dt.days / 365.25).astype(float)
-        return df
-    except Exception as e:
-        st.error(f"Error loading athletes: {e}")
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_medallists():
-    """Load medallists data."""
-    try:
-        df = pd.read_csv(DATA_PATH / "medallists.csv")
-        df = df.rename(columns={"country_code": "noc", "medal_type": "medal"})
-        df["medal"] = df["medal"].str.replace(" Medal", "", regex=False)
-        return df
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_medals():
-    """Load medals data."""
-    try:
-        df = pd.read_csv(DATA_PATH / "medals.csv")
-        df = df.rename(columns={"country_code": "noc", "medal_type": "medal"})
-        df["medal"] = df["medal"].str.replace(" Medal", "", regex=False)
-        return df
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_coaches():
-    """Load coaches data."""
-    try:
-        return pd.read_csv(DATA_PATH / "coaches.csv")
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_teams():
-    """Load teams data."""
-    try:
-        return pd.read_csv(DATA_PATH / "teams.csv")
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def get_coaches_for_athlete(athlete_row, teams_df):
-    """Get coaches for an athlete based on their discipline."""
-    coaches_list = []
-    athlete_disciplines = athlete_row.get("disciplines", "")
-    
-    if pd.notna(athlete_disciplines) and athlete_disciplines and not teams_df.empty:
-        # Parse disciplines
-        disciplines = str(athlete_disciplines).replace("[", "").replace("]", "").replace("'", "").split(",")
-        disciplines = [d.strip() for d in disciplines if d.strip()]
-        
-        # Look for teams with matching discipline
-        for discipline in disciplines[:2]:  # Check first 2 disciplines
-            matching_teams = teams_df[teams_df["discipline"] == discipline]
-            
-            for _, team in matching_teams.iterrows():
-                team_coaches = team.get("coaches", "")
-                if pd.notna(team_coaches) and team_coaches:
-                    # Parse coaches
-                    coaches_str = str(team_coaches).replace("[", "").replace("]", "").replace("'", "")
-                    team_coaches_list = [c.strip() for c in coaches_str.split(",") if c.strip()]
-                    
-                    for coach_name in team_coaches_list[:3]:  # Get first 3 coaches
-                        if coach_name:
-                            coaches_list.append({
-                                "name": coach_name,
-                                "team": team.get("team", "N/A"),
-                                "country": team.get("country", "N/A"),
-                                "discipline": team.get("discipline", "N/A"),
-                                "team_gender": team.get("team_gender", "N/A")
-                            })
-    
-    # Remove duplicates
-    unique_coaches = []
-    seen_names = set()
-    for coach in coaches_list:
-        if coach["name"] not in seen_names:
-            seen_names.add(coach["name"])
-            unique_coaches.append(coach)
-    
-    return unique_coaches[:3]  # Keep only 3 coaches
-
+# Every source, loaded concurrently once per process
+load_catalog()
 
 # Load all data
 athletes_df = load_athletes()
 medallists_df = load_medallists()
 medals_df = load_medals()
-coaches_df = load_coaches()
-teams_df = load_teams()
 
 # SIDEBAR - GLOBAL FILTERS
 with st.sidebar:
@@ -137,7 +42,6 @@ with st.sidebar:
     st.divider()
     
     all_countries = sorted(athletes_df["noc"].dropna().unique().tolist()) if not athletes_df.empty else []
-    all_sports = sorted(athletes_df["disciplines"].dropna().astype(str).str.replace(r"[\[\]']", "", regex=True).unique().tolist()) if not athletes_df.empty else []
     
     filters = render_global_filters(countries=all_countries, sports=[])
     
@@ -145,41 +49,60 @@ with st.sidebar:
     st.caption("LA28 Volunteer Selection Challenge")
 
 # APPLY FILTERS
-filtered_athletes = athletes_df.copy()
-if filters["countries"]:
-    filtered_athletes = filtered_athletes[filtered_athletes["noc"].isin(filters["countries"])]
-if filters["continents"]:
-    filtered_athletes = filtered_athletes[filtered_athletes["noc"].apply(get_continent).isin(filters["continents"])]
-
-filtered_medallists = apply_filters(medallists_df, filters)
+filtered_athletes = apply_filters(athletes_df, filters, index=load_bitmap_index("athletes"))
+filtered_medallists = apply_filters(medallists_df, filters, index=load_bitmap_index("medallists"))
 
 # HEADER
 st.title("👤 Athlete Performance Analysis")
 st.markdown("Explore individual athlete statistics, demographics, and achievements.")
+render_data_warnings("athletes.csv", "medallists.csv", "medals.csv", "teams.csv", "coaches.csv")
 st.divider()
 
 # 1. ATHLETE PROFILE CARD
 st.subheader("🔍 Athlete Profile Card")
 
+
+@versioned_cache
+def athlete_profile(row: int) -> tuple:
+    """Disciplines, events and coaches of the athlete at ``row`` of the athletes frame."""
+    # Disciplines and events come from the pre-exploded bridge tables; coaches from the coach index
+    disciplines = bridge_lookup(load_athlete_disciplines(), row)
+    events = bridge_lookup(load_athlete_events(), row)
+    return disciplines, events, load_coach_index().for_disciplines(disciplines)
+
+
 if not filtered_athletes.empty:
-    # Search box
-    athlete_names = sorted(filtered_athletes["name"].dropna().unique().tolist())
+    # Typeahead search over the prebuilt name index (only the top matches reach the browser)
+    search_index = load_athlete_search_index()
+    athlete_mask = load_bitmap_index("athletes").mask(filters)
     
-    selected_athlete = st.selectbox(
+    query = st.text_input(
         "Search for an athlete by name:",
-        options=[""] + athlete_names,
-        format_func=lambda x: "Type to search..." if x == "" else x,
-        key="athlete_search"
+        placeholder="Type to search...",
+        key="athlete_query",
     )
+    matches = search_index.search(query, limit=25, within=athlete_mask)
     
-    if selected_athlete:
-        athlete_row = filtered_athletes[filtered_athletes["name"] == selected_athlete].iloc[0]
+    selected_row = None
+    if matches:
+        selected_row = st.selectbox(
+            "Matching athletes:",
+            options=matches,
+            format_func=lambda row: search_index.names[row],
+            key="athlete_search"
+        )
+    elif query:
+        st.info("No athlete matches this search.")
+    
+    if selected_row is not None:
+        athlete_row = athletes_df.iloc[selected_row]
+        selected_athlete = athlete_row["name"]
         
-        # Get coaches for this athlete
-        coaches_list = get_coaches_for_athlete(athlete_row, teams_df)
+        # Keyed on the row number only, shared by every session looking at this athlete
+        athlete_disciplines, athlete_events, coaches_list = athlete_profile(selected_row)
         
-        # Get athlete's medals
-        athlete_medals = filtered_medallists[filtered_medallists["name"] == selected_athlete] if not filtered_medallists.empty else pd.DataFrame()
+        # Get athlete's medals (only their own rows, then the global filters)
+        athlete_medals = apply_filters(medallists_df.iloc[search_index.medal_positions(selected_row)], filters)
         
         # Create profile card
         st.markdown("---")
@@ -228,17 +151,12 @@ if not filtered_athletes.empty:
                 category = athlete_row.get("category", "N/A")
                 st.markdown(f"**{category}**")
             
-            # Clean and display disciplines
-            disciplines = str(athlete_row.get("disciplines", "N/A"))
-            if "[" in disciplines:
-                disciplines = disciplines.replace("[", "").replace("]", "").replace("'", "")
+            # Display disciplines and events
+            disciplines = ", ".join(athlete_disciplines) or "N/A"
             st.markdown("##### 🏆 Disciplines")
             st.markdown(f"**{disciplines}**")
             
-            # Clean and display events
-            events = str(athlete_row.get("events", "N/A"))
-            if "[" in events:
-                events = events.replace("[", "").replace("]", "").replace("'", "")
+            events = ", ".join(athlete_events) or "N/A"
             st.markdown("##### 📅 Events")
             st.markdown(f"**{events}**")
 
@@ -274,6 +192,9 @@ if not filtered_athletes.empty:
             if coaches_list:
                 for i, coach_info in enumerate(coaches_list):
                     with st.expander(f"👤 {coach_info.get('name', 'Coach')}", expanded=(i == 0)):
+                        if coach_info.get("function") and coach_info["function"] != "N/A":
+                            st.markdown(f"**Function:** {coach_info['function']}")
+                        
                         # Display team information
                         if coach_info.get("team") and coach_info["team"] != "N/A":
                             st.markdown(f"**Team:** {coach_info['team']}")
@@ -288,10 +209,9 @@ if not filtered_athletes.empty:
                             st.markdown(f"**Team Gender:** {coach_info['team_gender']}")
             else:
                 # Show raw coach data if available
-                coach_data = athlete_row.get("coach", "")
-                if pd.notna(coach_data) and coach_data:
-                    coach_display = str(coach_data).replace("[", "").replace("]", "").replace("'", "")
-                    st.markdown(f"**Coach(s):** {coach_display}")
+                coach_names = parse_list(athlete_row.get("coach", ""))
+                if coach_names:
+                    st.markdown(f"**Coach(s):** {', '.join(coach_names)}")
                 else:
                     st.info("No coach information available")
 
@@ -299,9 +219,10 @@ if not filtered_athletes.empty:
         st.markdown("---")
         
         if not athlete_medals.empty:
-            gold = len(athlete_medals[athlete_medals["medal"] == "Gold"])
-            silver = len(athlete_medals[athlete_medals["medal"] == "Silver"])
-            bronze = len(athlete_medals[athlete_medals["medal"] == "Bronze"])
+            medal_totals = athlete_medals["medal"].value_counts()
+            gold = int(medal_totals.get("Gold", 0))
+            silver = int(medal_totals.get("Silver", 0))
+            bronze = int(medal_totals.get("Bronze", 0))
             total = gold + silver + bronze
             
             medal_col1, medal_col2, medal_col3, medal_col4 = st.columns(4)
@@ -350,7 +271,7 @@ if not filtered_athletes.empty:
         
         st.markdown("---")
     else:
-        st.info("👆 Select an athlete from the dropdown above to view their profile.")
+        st.info("👆 Search for an athlete above to view their profile.")
 else:
     st.warning("No athletes data available.")
 
@@ -360,9 +281,7 @@ st.divider()
 st.subheader("📊 Athlete Age Distribution")
 
 if not filtered_athletes.empty and "age" in filtered_athletes.columns:
-    # Add continent for grouping
-    plot_athletes = filtered_athletes.copy()
-    plot_athletes["Continent"] = plot_athletes["noc"].apply(get_continent)
+    plot_athletes = filtered_athletes.rename(columns={"continent": "Continent"})
     plot_athletes = plot_athletes.dropna(subset=["age"])
     plot_athletes = plot_athletes[plot_athletes["age"] > 0]
     
@@ -371,28 +290,12 @@ if not filtered_athletes.empty and "age" in filtered_athletes.columns:
     with col1:
         st.markdown("**By Gender**")
         if "gender" in plot_athletes.columns:
-            fig = px.box(
-                plot_athletes,
-                x="gender",
-                y="age",
-                color="gender",
-                color_discrete_map={"Male": "#3498db", "Female": "#e74c3c"},
-                title="Age Distribution by Gender"
-            )
-            fig.update_layout(height=400, showlegend=False, xaxis_title="", yaxis_title="Age")
+            fig = cached_result("athletes.age_box", filters, lambda: create_age_box(plot_athletes))
             st.plotly_chart(fig, width='stretch', key="age_gender_box")
     
     with col2:
         st.markdown("**By Continent**")
-        fig = px.violin(
-            plot_athletes,
-            x="Continent",
-            y="age",
-            color="Continent",
-            box=True,
-            title="Age Distribution by Continent"
-        )
-        fig.update_layout(height=400, showlegend=False, xaxis_title="", yaxis_title="Age")
+        fig = cached_result("athletes.age_violin", filters, lambda: create_age_violin(plot_athletes))
         st.plotly_chart(fig, width='stretch', key="age_continent_violin")
 else:
     st.warning("Age data not available.")
@@ -403,9 +306,7 @@ st.divider()
 st.subheader("👫 Gender Distribution")
 
 if not filtered_athletes.empty and "gender" in filtered_athletes.columns:
-    # Add continent
-    gender_df = filtered_athletes.copy()
-    gender_df["Continent"] = gender_df["noc"].apply(get_continent)
+    gender_df = filtered_athletes.rename(columns={"continent": "Continent"})
     
     # View selector
     view_option = st.radio(
@@ -433,7 +334,7 @@ if not filtered_athletes.empty and "gender" in filtered_athletes.columns:
         st.plotly_chart(fig, width='stretch', key="gender_world")
     
     elif view_option == "Continent":
-        continent_gender = gender_df.groupby(["Continent", "gender"]).size().reset_index(name="Count")
+        continent_gender = gender_df.groupby(["Continent", "gender"], observed=True).size().reset_index(name="Count")
         
         fig = px.bar(
             continent_gender,
@@ -452,7 +353,12 @@ if not filtered_athletes.empty and "gender" in filtered_athletes.columns:
     else:  # Country
         # Top 20 countries
         top_countries = gender_df["noc"].value_counts().head(20).index.tolist()
-        country_gender = gender_df[gender_df["noc"].isin(top_countries)].groupby(["noc", "gender"]).size().reset_index(name="Count")
+        country_gender = (
+            gender_df[gender_df["noc"].isin(top_countries)]
+            .groupby(["noc", "gender"], observed=True)
+            .size()
+            .reset_index(name="Count")
+        )
         
         fig = px.bar(
             country_gender,
@@ -474,57 +380,14 @@ st.divider()
 # 4. TOP ATHLETES BY MEDALS (Bar Chart)
 st.subheader("🏆 Top Athletes by Medals")
 
+def top_athletes(medallists: pd.DataFrame) -> pd.DataFrame:
+    return medal_counts(medallists, ["name", "noc"]).sort_values(["Gold", "Total"], ascending=False).head(10)
+
+
 if not filtered_medallists.empty:
-    # Count medals per athlete
-    athlete_medals = filtered_medallists.groupby(["name", "noc"]).agg(
-        Total=("medal", "count"),
-        Gold=("medal", lambda x: (x == "Gold").sum()),
-        Silver=("medal", lambda x: (x == "Silver").sum()),
-        Bronze=("medal", lambda x: (x == "Bronze").sum()),
-    ).reset_index()
-    
-    athlete_medals = athlete_medals.sort_values(["Gold", "Total"], ascending=False).head(10)
-    
-    # Create stacked bar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        y=athlete_medals["name"],
-        x=athlete_medals["Bronze"],
-        name="Bronze",
-        orientation="h",
-        marker_color="#CD7F32",
-        text=athlete_medals["Bronze"],
-        textposition="inside",
-    ))
-    fig.add_trace(go.Bar(
-        y=athlete_medals["name"],
-        x=athlete_medals["Silver"],
-        name="Silver",
-        orientation="h",
-        marker_color="#C0C0C0",
-        text=athlete_medals["Silver"],
-        textposition="inside",
-    ))
-    fig.add_trace(go.Bar(
-        y=athlete_medals["name"],
-        x=athlete_medals["Gold"],
-        name="Gold",
-        orientation="h",
-        marker_color="#FFD700",
-        text=athlete_medals["Gold"],
-        textposition="inside",
-    ))
-    
-    fig.update_layout(
-        barmode="stack",
-        height=450,
-        xaxis_title="Total Medals",
-        yaxis_title="",
-        yaxis=dict(categoryorder="total ascending"),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02),
-        title="Top 10 Athletes by Medal Count"
-    )
+    # Count medals per athlete, top 10
+    athlete_medals = cached_result("athletes.top10", filters, lambda: top_athletes(filtered_medallists))
+    fig = cached_result("athletes.top10_bar", filters, lambda: create_top_athletes_bar(athlete_medals))
     st.plotly_chart(fig, width='stretch', key="top_athletes_bar")
     
     # Also show as table
@@ -0,0 +1,118 @@
+import streamlit as st
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.style import apply_custom_style
+from utils.data_ingest import load_catalog, memory_report
+from utils.validation import load_ingest_report
+from utils.result_cache import load_result_cache
+
+# PAGE CONFIG
+st.set_page_config(
+    layout="wide",
+    page_title="Diagnostics | LA28 Dashboard",
+    page_icon="🩺",
+    initial_sidebar_state="expanded",
+)
+apply_custom_style()
+
+# Every source, loaded concurrently once per process
+catalog_timings = load_catalog()
+
+# Built once per data version
+report = load_ingest_report()
+
+# SIDEBAR
+with st.sidebar:
+    st.image("https://upload.wikimedia.org/wikipedia/commons/5/5c/Olympic_rings_without_rims.svg", width=150)
+    st.title("🩺 Diagnostics")
+    st.divider()
+    st.caption(f"Data version `{report.version}`")
+    st.caption("LA28 Volunteer Selection Challenge")
+
+# HEADER
+st.title("🩺 Data Diagnostics")
+st.markdown(
+    "Ingest validation of the files in `data/`: schema drift, null rates, orphan NOC codes and duplicate medals."
+)
+st.divider()
+
+# 1. SUMMARY
+files = report.files
+severity_counts = report.issues["severity"].value_counts()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Sources OK", f"{(files['status'] == 'ok').sum()} / {len(files)}")
+col2.metric("Missing / Unusable", int(files["status"].isin(["missing", "error", "empty"]).sum()))
+col3.metric("Errors", int(severity_counts.get("error", 0)))
+col4.metric("Warnings", int(severity_counts.get("warning", 0)))
+
+if report.has_errors:
+    st.error("Some sources failed validation; pages depending on them show empty charts.")
+else:
+    st.success("All sources loaded without errors.")
+
+# 2. FILES
+st.subheader("📁 Sources")
+st.dataframe(files, hide_index=True, use_container_width=True)
+
+# 3. ISSUES
+st.subheader("⚠️ Issues")
+if report.issues.empty:
+    st.info("No issues found.")
+else:
+    severities = st.multiselect(
+        "Severity",
+        ["error", "warning", "info"],
+        default=["error", "warning"],
+        key="diagnostics_severity",
+    )
+    st.dataframe(report.issues[report.issues["severity"].isin(severities)], hide_index=True, use_container_width=True)
+
+# 4. NULL RATES
+st.subheader("🕳️ Null Rates")
+threshold = st.slider("Show columns with at least this share of nulls", 0.0, 1.0, 0.05, 0.05, key="null_threshold")
+null_rates = report.null_rates[report.null_rates["null_rate"] >= threshold]
+st.dataframe(
+    null_rates.sort_values("null_rate", ascending=False),
+    hide_index=True,
+    use_container_width=True,
+    column_config={"null_rate": st.column_config.ProgressColumn("null_rate", min_value=0.0, max_value=1.0)},
+)
+
+# 5. REFERENTIAL CHECKS
+col1, col2 = st.columns(2)
+with col1:
+    st.subheader("🏳️ Orphan NOC Codes")
+    if report.orphan_nocs.empty:
+        st.info("Every NOC code is listed in nocs.csv.")
+    else:
+        st.dataframe(report.orphan_nocs, hide_index=True, use_container_width=True)
+with col2:
+    st.subheader("🥇 Duplicate Medals")
+    if report.duplicate_medals.empty:
+        st.info("No medal is awarded twice.")
+    else:
+        st.dataframe(report.duplicate_medals, hide_index=True, use_container_width=True)
+
+# 6. LOAD TIMES
+st.subheader("⏱️ Load Times")
+st.caption(
+    f"Sources loaded in parallel at startup: {catalog_timings['seconds'].max():.2f}s for the slowest, "
+    f"{catalog_timings['seconds'].sum():.2f}s summed over all sources."
+)
+st.dataframe(catalog_timings, hide_index=True, use_container_width=True)
+
+# 7. MEMORY
+st.subheader("💾 Memory Footprint")
+st.dataframe(memory_report(), hide_index=True, use_container_width=True)
+
+# 8. RESULT CACHE
+st.subheader("🗃️ Shared Result Cache")
+cache_stats = load_result_cache().stats()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Hit Rate", f"{cache_stats['hit_rate']:.0%}")
+col2.metric("Entries", cache_stats["entries"])
+col3.metric("Size", f"{cache_stats['size_mb']} / {cache_stats['budget_mb']} MB")
+col4.metric("Evictions", cache_stats["evictions"])
@@ -19,6 +19,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.shared_filters import render_global_filters, apply_filters, get_continent
 from utils.style import apply_custom_style
+from utils.data_ingest import load_schedules, load_medals, load_venues, load_events, load_teams, load_catalog
+from utils.bridges import athletes_in_team, venues_for_sport
+from utils.medal_cube import load_medal_cube
+from utils.bitmap_index import load_bitmap_index
+from utils.schedule_index import load_schedule_index
+from utils.medal_race import load_medal_race_figures
+from utils.schedule_gantt import DETAIL_MAX_SESSIONS, band_figure, load_schedule_bands, session_figure
+from utils.venue_occupancy import load_venue_occupancy
+from utils.validation import render_data_warnings
+from utils.result_cache import cached_result, versioned_cache
+from utils.viz_helpers import create_sport_treemap
 
 # =============================================================================
 # PAGE CONFIG
@@ -34,56 +45,16 @@ apply_custom_style()
 # =============================================================================
 # DATA LOADING
 # =============================================================================
-DATA_PATH = Path(__file__).parent.parent / "data"
-
-
-@st.cache_data
-def load_schedules():
-    """Load schedules data."""
-    try:
-        df = pd.read_csv(DATA_PATH / "schedules.csv")
-        df["start_date"] = pd.to_datetime(df["start_date"], errors="coerce")
-        df["end_date"] = pd.to_datetime(df["end_date"], errors="coerce")
-        return df
-    except Exception as e:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_medals():
-    """Load medals data."""
-    try:
-        df = pd.read_csv(DATA_PATH / "medals.csv")
-        df = df.rename(columns={"country_code": "noc", "medal_type": "medal"})
-        df["medal"] = df["medal"].str.replace(" Medal", "", regex=False)
-        return df
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_venues():
-    """Load venues data."""
-    try:
-        return pd.read_csv(DATA_PATH / "venues.csv")
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_events():
-    """Load events data."""
-    try:
-        return pd.read_csv(DATA_PATH / "events.csv")
-    except:
-        return pd.DataFrame()
-
+# Every source, loaded concurrently once per process
+load_catalog()
 
 # Load data
 schedules_df = load_schedules()
 medals_df = load_medals()
 venues_df = load_venues()
 events_df = load_events()
+medal_cube = load_medal_cube()
+schedule_index = load_schedule_index()
 
 # =============================================================================
 # SIDEBAR - GLOBAL FILTERS
@@ -103,17 +74,16 @@ with st.sidebar:
 # =============================================================================
 # APPLY FILTERS
 # =============================================================================
-filtered_medals = medals_df.copy()
-if filters["sports"]:
-    filtered_medals = filtered_medals[filtered_medals["discipline"].isin(filters["sports"])]
-if filters["medal_types"]:
-    filtered_medals = filtered_medals[filtered_medals["medal"].isin(filters["medal_types"])]
+# The page filters medals by sport and medal type only
+sport_filters = {**filters, "countries": [], "continents": []}
+filtered_medals = apply_filters(medals_df, sport_filters, index=load_bitmap_index("medals"))
 
 # =============================================================================
 # HEADER
 # =============================================================================
 st.title("🏟️ Sports & Events Analysis")
 st.markdown("Explore Olympic sports, event schedules, and competition venues.")
+render_data_warnings("schedules.csv", "medals.csv", "venues.csv", "events.csv")
 st.divider()
 
 # =============================================================================
@@ -134,11 +104,9 @@ st.subheader("📅 Who Won the Day?")
 st.markdown("Select a date to see the daily medal tally and key events.")
 
 if not medals_df.empty and "medal_date" in medals_df.columns:
-    # Convert dates
-    medals_df["medal_date"] = pd.to_datetime(medals_df["medal_date"], errors="coerce")
-    valid_dates = sorted(medals_df["medal_date"].dropna().unique())
+    valid_dates = medal_cube.days
     
-    if valid_dates:
+    if len(valid_dates):
         # Date Slider
         min_date = valid_dates[0].date()
         max_date = valid_dates[-1].date()
@@ -151,37 +119,43 @@ if not medals_df.empty and "medal_date" in medals_df.columns:
             format="MMM DD"
         )
         
-        # Filter data for selected date
-        day_medals = medals_df[medals_df["medal_date"].dt.date == selected_date]
+        standings_view = st.radio(
+            "Standings",
+            options=["On this day", "Overall after this day"],
+            horizontal=True,
+            key="standings_view",
+        )
+        
+        # Both views are row lookups into the cube's precomputed daily counts / prefix sums
+        day_tally = medal_cube.daily_standings(selected_date)
         
-        if not day_medals.empty:
+        if not day_tally.empty:
             # Daily Stats
-            daily_total = len(day_medals)
-            daily_gold = len(day_medals[day_medals["medal"] == "Gold"])
+            daily_total = int(day_tally["Total"].sum())
+            daily_gold = int(day_tally["Gold"].sum())
             
             col_d1, col_d2, col_d3 = st.columns(3)
             col_d1.metric("Medals Awarded Today", daily_total)
             col_d2.metric("🥇 Gold Medals", daily_gold)
-            col_d3.metric("Countries on Podium", day_medals["noc"].nunique())
+            col_d3.metric("Countries on Podium", len(day_tally))
             
             # Daily Medal Table
-            st.markdown(f"**Medal Standings for {selected_date.strftime('%B %d')}**")
-            daily_standings = day_medals.groupby("noc").agg(
-                Gold=("medal", lambda x: (x == "Gold").sum()),
-                Silver=("medal", lambda x: (x == "Silver").sum()),
-                Bronze=("medal", lambda x: (x == "Bronze").sum()),
-                Total=("medal", "count")
-            ).sort_values(["Gold", "Total"], ascending=False).head(10)
+            if standings_view == "On this day":
+                st.markdown(f"**Medal Standings for {selected_date.strftime('%B %d')}**")
+                standings = day_tally
+            else:
+                st.markdown(f"**Overall Medal Standings after {selected_date.strftime('%B %d')}**")
+                standings = medal_cube.standings_as_of(selected_date)
             
-            st.dataframe(daily_standings, use_container_width=True)
+            st.dataframe(standings.set_index("noc").head(10), use_container_width=True)
             
-            # Events on this day
-            if not schedules_df.empty:
-                day_events = schedules_df[pd.to_datetime(schedules_df["start_date"]).dt.date == selected_date]
+            # Events on this day (a contiguous, start-ordered block of the schedule)
+            if len(schedule_index):
+                day_events = schedule_index.sessions_on(selected_date)
                 if not day_events.empty:
                     st.markdown(f"**Key Events on {selected_date.strftime('%B %d')}**")
                     st.dataframe(
-                        day_events[["start_date", "discipline", "event", "venue", "status"]].sort_values("start_date").head(10),
+                        day_events[["start_date", "discipline", "event", "venue", "status"]].head(10),
                         use_container_width=True,
                         hide_index=True
                     )
@@ -194,14 +168,54 @@ else:
 
 st.divider()
 
+# =============================================================================
+# 0b. MEDAL RACE (Animated)
+# =============================================================================
+st.subheader("🏁 Medal Race")
+st.markdown("Press play to replay the Games day by day. The animation runs in your browser.")
+
+if len(medal_cube.days):
+    race_figures = load_medal_race_figures()
+    race_view = st.radio(
+        "Race View",
+        options=["Bar Chart Race", "Rank Bump Chart"],
+        horizontal=True,
+        key="race_view",
+    )
+    if race_view == "Bar Chart Race":
+        st.plotly_chart(race_figures["bar"], use_container_width=True, key="medal_race_bar")
+    else:
+        st.plotly_chart(race_figures["bump"], use_container_width=True, key="medal_race_bump")
+else:
+    st.warning("Date information not available.")
+
+st.divider()
+
 # =============================================================================
 # 1. EVENT SCHEDULE (Gantt/Timeline Chart)
 # =============================================================================
 st.subheader("📅 Event Schedule")
 
+
+@versioned_cache
+def schedule_figure(sport, first_day, last_day) -> tuple:
+    """Gantt chart of one sport (``None`` for all) between two days, and the number of sessions in it."""
+    window_t0 = pd.Timestamp(first_day)
+    window_t1 = pd.Timestamp(last_day) + pd.Timedelta(days=1)
+    sessions = load_schedule_index().overlapping(window_t0, window_t1, discipline=sport)
+    if sessions.empty:
+        return None, 0
+    # Level of detail: day bands per sport when zoomed out, individual sessions otherwise
+    if sport is None and len(sessions) > DETAIL_MAX_SESSIONS:
+        bands = load_schedule_bands()
+        return band_figure(bands[(bands["day"] >= window_t0) & (bands["day"] < window_t1)]), len(sessions)
+    y_col = "event" if sport and "event" in sessions.columns else "discipline"
+    return session_figure(sessions, y_col), len(sessions)
+
+
 if not schedules_df.empty:
-    # Filter for valid dates
-    schedule_valid = schedules_df.dropna(subset=["start_date", "end_date"]).copy()
+    # Sessions with valid dates, in start order
+    schedule_valid = schedule_index.sessions
     
     if not schedule_valid.empty:
         # Sport selector for schedule
@@ -212,30 +226,24 @@ if not schedules_df.empty:
             key="schedule_sport"
         )
         
-        if selected_schedule_sport != "All Sports":
-            schedule_filtered = schedule_valid[schedule_valid["discipline"] == selected_schedule_sport]
-        else:
-            # Show top events by discipline
-            schedule_filtered = schedule_valid.head(50)
+        schedule_days = [day.date() for day in schedule_index.days]
+        window_start, window_end = st.select_slider(
+            "Schedule Window:",
+            options=schedule_days,
+            value=(schedule_days[0], schedule_days[-1]),
+            format_func=lambda day: day.strftime("%b %d"),
+            key="schedule_window"
+        )
         
-        if not schedule_filtered.empty:
-            # Create Gantt chart
-            fig = px.timeline(
-                schedule_filtered,
-                x_start="start_date",
-                x_end="end_date",
-                y="event" if "event" in schedule_filtered.columns else "discipline",
-                color="discipline",
-                hover_data=["venue"] if "venue" in schedule_filtered.columns else None,
-            )
-            fig.update_layout(
-                height=450,
-                xaxis_title="Date",
-                yaxis_title="",
-                showlegend=True,
-                legend=dict(orientation="h", yanchor="bottom", y=-0.3),
-            )
-            fig.update_yaxes(categoryorder="category ascending")
+        schedule_sport = None if selected_schedule_sport == "All Sports" else selected_schedule_sport
+        fig, session_count = schedule_figure(schedule_sport, window_start, window_end)
+        
+        if fig is not None:
+            if schedule_sport is None and session_count > DETAIL_MAX_SESSIONS:
+                st.caption(
+                    f"{session_count:,} sessions shown as one band per sport and day. "
+                    "Narrow the window or select a sport to see individual sessions."
+                )
             st.plotly_chart(fig, use_container_width=True, key="schedule_gantt")
         else:
             st.info("No schedule data available for the selected sport.")
@@ -251,38 +259,17 @@ st.divider()
 # =============================================================================
 st.subheader("🏅 Medal Count by Sport")
 
-if not filtered_medals.empty:
-    # Aggregate medals by sport and medal type
-    sport_medals = filtered_medals.groupby(["discipline", "medal"]).size().reset_index(name="Count")
-    
-    fig = px.treemap(
-        sport_medals,
-        path=["discipline", "medal"],
-        values="Count",
-        color="medal",
-        color_discrete_map={
-            "Gold": "#FFD700",
-            "Silver": "#C0C0C0",
-            "Bronze": "#CD7F32"
-        },
-    )
-    fig.update_layout(
-        height=500,
-        margin=dict(t=20, b=20, l=20, r=20),
-    )
-    fig.update_traces(
-        textinfo="label+value",
-        hovertemplate="<b>%{label}</b><br>Count: %{value}<extra></extra>"
-    )
+sport_medals = cached_result("sports.medal_counts", sport_filters, lambda: medal_cube.sport_medal_counts(sport_filters))
+
+if not sport_medals.empty:
+    fig = cached_result("sports.treemap", sport_filters, lambda: create_sport_treemap(sport_medals))
     st.plotly_chart(fig, use_container_width=True, key="sport_treemap")
     
     # Also show as table
-    sport_summary = filtered_medals.groupby("discipline").agg(
-        Total=("medal", "count"),
-        Gold=("medal", lambda x: (x == "Gold").sum()),
-        Silver=("medal", lambda x: (x == "Silver").sum()),
-        Bronze=("medal", lambda x: (x == "Bronze").sum()),
-    ).reset_index().sort_values("Total", ascending=False)
+    sport_summary = cached_result("sports.summary", sport_filters, lambda: medal_cube.sport_summary(sport_filters))
+    sport_summary = sport_summary[["discipline", "Total", "Gold", "Silver", "Bronze"]].sort_values(
+        "Total", ascending=False
+    )
     
     sport_summary.columns = ["Sport", "Total", "🥇", "🥈", "🥉"]
     st.dataframe(sport_summary, use_container_width=True, hide_index=True)
@@ -393,6 +380,80 @@ else:
 
 st.divider()
 
+# =============================================================================
+# 3b. VENUE OCCUPANCY (Heatmap)
+# =============================================================================
+st.subheader("🕒 Venue Occupancy")
+st.markdown("How busy each venue is, hour by hour. Useful for staffing volunteers and operations crews.")
+
+
+@versioned_cache
+def occupancy_heatmap(day, metric: str):
+    """Venue x hour heatmap for one day (``None`` for the hour-of-day profile), busiest venues first."""
+    venue_occupancy = load_venue_occupancy()
+    if day is None:
+        occupancy = venue_occupancy.hour_of_day_profile(metric)
+        occupancy_note = "average per day in use" if metric == "busy_minutes" else "maximum over the Games"
+    else:
+        occupancy = venue_occupancy.day_matrix(day, metric)
+        occupancy_note = day.strftime("%B %d")
+    
+    # Busiest venues first; venues idle on the selected day are left out
+    in_use = occupancy.sum(axis=1) > 0
+    order = [position for position in occupancy.sum(axis=1).argsort()[::-1] if in_use[position]]
+    if not order:
+        return None
+    venue_sports = venue_occupancy.venue_info["sports"].to_numpy()
+    fig = go.Figure(
+        go.Heatmap(
+            z=occupancy[order],
+            x=[f"{hour:02d}:00" for hour in range(24)],
+            y=venue_occupancy.venues[order],
+            customdata=[[venue_sports[position]] * 24 for position in order],
+            colorscale="Blues",
+            colorbar=dict(title="Minutes" if metric == "busy_minutes" else "Sessions"),
+            hovertemplate="<b>%{y}</b> %{x}<br>%{z:.0f}<br>%{customdata}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        height=max(400, 22 * len(order)),
+        xaxis_title=f"Hour (local time, {occupancy_note})",
+        yaxis=dict(autorange="reversed"),
+    )
+    return fig
+
+
+venue_occupancy = load_venue_occupancy()
+
+if len(venue_occupancy.venues):
+    col_o1, col_o2 = st.columns(2)
+    with col_o1:
+        occupancy_days = sorted({hour.date() for hour in venue_occupancy.hours})
+        occupancy_day = st.selectbox(
+            "Day:",
+            options=["All Days"] + occupancy_days,
+            format_func=lambda day: day if day == "All Days" else day.strftime("%B %d"),
+            key="occupancy_day"
+        )
+    with col_o2:
+        occupancy_metric = st.radio(
+            "Measure:",
+            options=["Busy Minutes", "Concurrent Sessions"],
+            horizontal=True,
+            key="occupancy_metric"
+        )
+    
+    metric = "busy_minutes" if occupancy_metric == "Busy Minutes" else "peak_sessions"
+    fig = occupancy_heatmap(None if occupancy_day == "All Days" else occupancy_day, metric)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True, key="venue_occupancy")
+    else:
+        st.info("No sessions scheduled on the selected day.")
+else:
+    st.warning("Schedule data not available.")
+
+st.divider()
+
 # =============================================================================
 # 4. EVENTS BY SPORT
 # =============================================================================
@@ -409,8 +470,26 @@ if not events_df.empty:
         display_events = events_df[events_df["sport"] == sport_select]
     else:
         display_events = events_df
-    
+
     st.dataframe(display_events, use_container_width=True, hide_index=True)
+
+    if sport_select != "All":
+        sport_venues = venues_for_sport(sport_select)
+        if not sport_venues.empty:
+            st.caption("🏟️ Venues: " + ", ".join(sport_venues["venue"]))
+
+        teams_df = load_teams()
+        if not teams_df.empty:
+            disciplines = teams_df["discipline"]
+            team_ids = [team_id for team_id, discipline in enumerate(disciplines) if discipline == sport_select]
+            if team_ids:
+                with st.expander(f"👥 Teams ({len(team_ids)})"):
+                    rosters = pd.DataFrame({
+                        "Team": teams_df["team"].iloc[team_ids].tolist(),
+                        "NOC": teams_df["noc"].iloc[team_ids].tolist(),
+                        "Athletes": [", ".join(athletes_in_team(team_id, "athlete")) for team_id in team_ids],
+                    })
+                    st.dataframe(rosters, use_container_width=True, hide_index=True)
 else:
     st.warning("Events data not available.")
 
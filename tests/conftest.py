@@ -0,0 +1,46 @@
+"""Synthetic frames shared by the index and cube tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.synthetic import DISCIPLINES, FILTER_COMBINATIONS, FIRST_DAY, MEDAL_TYPES, NOCS, VENUES
+
+
+@pytest.fixture(params=list(FILTER_COMBINATIONS.values()), ids=list(FILTER_COMBINATIONS))
+def filters(request) -> dict:
+    return request.param
+
+
+@pytest.fixture
+def medals() -> pd.DataFrame:
+    """400 random medal rows over ten days."""
+    rng = np.random.default_rng(28)
+    n_rows = 400
+    return pd.DataFrame(
+        {
+            "noc": rng.choice(NOCS, n_rows),
+            "discipline": rng.choice(DISCIPLINES, n_rows),
+            "medal": rng.choice(MEDAL_TYPES, n_rows),
+            "medal_date": FIRST_DAY + pd.to_timedelta(rng.integers(0, 10, n_rows), unit="D"),
+        }
+    )
+
+
+@pytest.fixture
+def schedules() -> pd.DataFrame:
+    """300 random sessions in Paris time, minute-aligned, some zero-length or overlapping at one venue."""
+    rng = np.random.default_rng(2024)
+    n_rows = 300
+    starts = FIRST_DAY + pd.to_timedelta(rng.integers(0, 5 * 24 * 60, n_rows), unit="min")
+    durations = pd.to_timedelta(rng.choice([0, 15, 45, 90, 150, 400], n_rows), unit="min")
+    return pd.DataFrame(
+        {
+            "session": np.arange(n_rows),
+            "start_date": starts.tz_localize("Europe/Paris"),
+            "end_date": (starts + durations).tz_localize("Europe/Paris"),
+            "venue": rng.choice(VENUES, n_rows),
+            "discipline": rng.choice(DISCIPLINES, n_rows),
+            "event_medal": rng.choice([0, 0, 0, 1], n_rows),
+        }
+    )
@@ -0,0 +1,36 @@
+"""Synthetic values and filter states shared by the tests."""
+
+import pandas as pd
+
+# "ZZZ" is in no continent and falls under "Other"
+NOCS = ["USA", "CHN", "FRA", "GBR", "KEN", "BRA", "AUS", "ZZZ"]
+DISCIPLINES = ["Athletics", "Swimming", "Judo", "Rowing"]
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]
+VENUES = ["Stade de France", "Paris La Defense Arena", "Bercy Arena"]
+FIRST_DAY = pd.Timestamp("2024-07-27")
+
+
+def make_filters(countries=(), continents=(), sports=(), medal_types=()) -> dict:
+    """A filter dict shaped like ``render_global_filters``'s."""
+    return {
+        "countries": list(countries),
+        "continents": list(continents),
+        "sports": list(sports),
+        "medal_types": list(medal_types),
+    }
+
+
+FILTER_COMBINATIONS = {
+    "none": make_filters(),
+    "countries": make_filters(countries=["USA", "FRA"]),
+    "continent": make_filters(continents=["Europe"]),
+    "other_continent": make_filters(continents=["Other"]),
+    "continent_and_country": make_filters(countries=["USA", "FRA"], continents=["Europe"]),
+    "sport": make_filters(sports=["Swimming", "Judo"]),
+    "medal_type": make_filters(medal_types=["Gold"]),
+    "all_medal_types": make_filters(medal_types=MEDAL_TYPES),
+    "everything": make_filters(
+        countries=["USA", "CHN", "KEN"], continents=["Asia", "Africa"], sports=["Athletics"], medal_types=["Silver"]
+    ),
+    "unknown_values": make_filters(countries=["XYZ"], sports=["Curling"]),
+}
@@ -0,0 +1,101 @@
+"""AthleteSearchIndex typeahead and code lookups."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.athlete_search import AthleteSearchIndex, fold_name, name_key
+
+NAMES = [
+    "EVENEPOEL Remco",
+    "MARCHAND Léon",
+    "BILES Simone",
+    "MANUEL Simone",
+    "DUPONT Jean-Luc",
+    "SIMONSEN Anna",
+    "LEON Maria",
+    "KIPYEGON Faith",
+    "ANDRIAMAMONJISOA Tiana",
+]
+
+
+@pytest.fixture
+def index() -> AthleteSearchIndex:
+    athletes = pd.DataFrame({"name": NAMES, "code": [1000 + row for row in range(len(NAMES))]})
+    medallists = pd.DataFrame(
+        {
+            "name": ["Remco Evenepoel", "Remco Evenepoel", "Simone Biles", "Faith Kipyegon"],
+            "code_athlete": [1000, 1000.0, "1002", None],
+        }
+    )
+    return AthleteSearchIndex(athletes, medallists)
+
+
+def names(index, rows) -> list:
+    return [index.names[row] for row in rows]
+
+
+def test_fold_name_strips_accents_case_and_punctuation():
+    assert fold_name("MARCHAND Léon") == ["marchand", "leon"]
+    assert fold_name("DUPONT Jean-Luc") == ["dupont", "jean", "luc"]
+    assert name_key("Remco EVENEPOEL") == name_key("EVENEPOEL Remco")
+
+
+def test_prefix_query(index):
+    assert set(names(index, index.search("sim"))) == {"BILES Simone", "MANUEL Simone", "SIMONSEN Anna"}
+    assert names(index, index.search("EVEN")) == ["EVENEPOEL Remco"]
+
+
+def test_accent_folded_query(index):
+    assert set(names(index, index.search("léon"))) == {"MARCHAND Léon", "LEON Maria"}
+    assert names(index, index.search("marchand leon")) == ["MARCHAND Léon"]
+
+
+def test_every_query_token_must_match(index):
+    assert names(index, index.search("simone bil")) == ["BILES Simone"]
+    assert names(index, index.search("bil simone")) == ["BILES Simone"]
+    assert names(index, index.search("jean luc")) == ["DUPONT Jean-Luc"]
+    assert index.search("simone evenepoel") == []
+
+
+def test_exact_name_ranks_first(index):
+    assert names(index, index.search("leon maria"))[0] == "LEON Maria"
+    assert names(index, index.search("simone"))[:2] == ["BILES Simone", "MANUEL Simone"]
+
+
+def test_limit(index):
+    assert len(index.search("s", limit=2)) == 2
+    assert index.search("simone", limit=1) == index.search("simone")[:1]
+
+
+def test_within_mask(index):
+    within = np.zeros(len(NAMES), dtype=bool)
+    within[3] = True
+    assert names(index, index.search("simone", within=within)) == ["MANUEL Simone"]
+    assert index.search("biles", within=within) == []
+
+
+def test_token_longer_than_the_stored_prefix(index):
+    # Both queries share the stored 12-character prefix; only the first matches the full token
+    assert names(index, index.search("andriamamonjis")) == ["ANDRIAMAMONJISOA Tiana"]
+    assert index.search("andriamamonjix") == []
+
+
+def test_empty_and_unknown_queries(index):
+    assert index.search("") == []
+    assert index.search("  -  ") == []
+    assert index.search("zzz") == []
+
+
+def test_code_and_name_lookups(index):
+    assert index.row_for_code("1001.0") == 1
+    assert index.row_for_name("Léon Marchand") == 1
+    assert index.row_for_code(9999) is None
+
+
+def test_medal_positions_by_code_then_name(index):
+    np.testing.assert_array_equal(index.medal_positions(0), [0, 1])
+    np.testing.assert_array_equal(index.medal_positions(2), [2])
+    # No code on the medallist row: matched on the name key
+    np.testing.assert_array_equal(index.medal_positions(7), [3])
+    assert len(index.medal_positions(4)) == 0
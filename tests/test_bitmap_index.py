@@ -0,0 +1,51 @@
+"""BitmapIndex masks and counts against shared_filters.filter_mask."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.synthetic import make_filters
+from utils.bitmap_index import BitmapIndex
+from utils.shared_filters import filter_mask
+
+
+@pytest.fixture(params=["object", "category"])
+def frame(request, medals) -> pd.DataFrame:
+    """Synthetic medals with a few missing NOCs, as plain strings or as categoricals."""
+    df = medals.drop(columns="medal_date")
+    df.loc[::37, "noc"] = None
+    return df.astype(request.param)
+
+
+def test_mask_matches_filter_mask(frame, filters):
+    expected = filter_mask(frame, filters)
+    mask = BitmapIndex(frame).mask(filters)
+    if expected is None:
+        assert mask is None
+    else:
+        np.testing.assert_array_equal(mask, expected)
+
+
+def test_count_matches_filter_mask(frame, filters):
+    expected = filter_mask(frame, filters)
+    assert BitmapIndex(frame).count(filters) == (len(frame) if expected is None else int(expected.sum()))
+
+
+def test_positions_are_the_mask_rows(frame, filters):
+    index = BitmapIndex(frame)
+    mask = index.mask(filters)
+    expected = np.arange(len(frame)) if mask is None else np.flatnonzero(mask)
+    np.testing.assert_array_equal(index.positions(filters), expected)
+
+
+def test_sport_falls_back_to_sport_column():
+    df = pd.DataFrame({"noc": ["USA", "FRA", "USA"], "sport": ["Judo", "Judo", "Rowing"]})
+    filters = make_filters(sports=["Judo"])
+    np.testing.assert_array_equal(BitmapIndex(df).mask(filters), filter_mask(df, filters))
+
+
+def test_row_count_not_a_multiple_of_eight():
+    df = pd.DataFrame({"noc": ["USA"] * 13, "medal": ["Gold"] * 13})
+    index = BitmapIndex(df)
+    assert index.count(make_filters(countries=["USA"])) == 13
+    assert len(index.mask(make_filters(medal_types=["Gold"]))) == 13
@@ -0,0 +1,101 @@
+"""Bridge tables for list-encoded columns against the render-time string parse they replace."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import bridges
+from utils.bridges import bridge_lookup, explode_list_column
+
+VALUES = ["Athletics", "Swimming", "Judo", "Rowing", "Artistic Swimming", "3x3 Basketball"]
+
+
+def naive_parse(value) -> list:
+    """The pages' former parse of a list-encoded cell."""
+    if pd.isna(value) or not value:
+        return []
+    return [v.strip() for v in str(value).replace("[", "").replace("]", "").replace("'", "").split(",") if v.strip()]
+
+
+def encode(values: list) -> str:
+    return "[" + ", ".join(f"'{value}'" for value in values) + "]"
+
+
+@pytest.fixture(scope="module")
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(9)
+    cells = []
+    for _ in range(200):
+        size = rng.integers(0, 4)
+        cells.append(encode([VALUES[pick] for pick in rng.choice(len(VALUES), size=size, replace=False)]))
+    # Missing values, empty strings and a plain string alongside the list-encoded cells
+    cells[:4] = [np.nan, None, "", "Judo"]
+    return pd.DataFrame({"sports": cells})
+
+
+@pytest.fixture(scope="module")
+def bridge(frame) -> pd.DataFrame:
+    return explode_list_column(frame, "sports", "venue_id", "sport")
+
+
+def test_explode_matches_naive_parse(frame, bridge):
+    expected = [(row, value) for row, cell in enumerate(frame["sports"]) for value in naive_parse(cell)]
+    assert list(zip(bridge["venue_id"], bridge["sport"])) == expected
+
+
+def test_keys_sorted_by_row_position(frame, bridge):
+    assert bridge["venue_id"].dtype == "int64"
+    assert bridge["venue_id"].is_monotonic_increasing
+    assert set(bridge["venue_id"]) <= set(range(len(frame)))
+    assert isinstance(bridge["sport"].dtype, pd.CategoricalDtype)
+
+
+def test_bridge_lookup_matches_naive_parse(frame, bridge):
+    for row, cell in enumerate(frame["sports"]):
+        assert bridge_lookup(bridge, row) == naive_parse(cell)
+    assert bridge_lookup(bridge, len(frame)) == []
+    assert bridge_lookup(bridge, None) == []
+    assert bridge_lookup(bridge, np.nan) == []
+
+
+def test_missing_and_empty_cells(frame, bridge):
+    assert bridge_lookup(bridge, 0) == bridge_lookup(bridge, 1) == bridge_lookup(bridge, 2) == []
+    assert bridge_lookup(bridge, 3) == ["Judo"]
+    assert explode_list_column(pd.DataFrame({"sports": ["[]", np.nan]}), "sports", "venue_id", "sport").empty
+
+    empty = explode_list_column(pd.DataFrame(), "sports", "venue_id", "sport", "int64")
+    assert list(empty.columns) == ["venue_id", "sport"] and empty.empty
+    assert empty["venue_id"].dtype == "int64" and empty["sport"].dtype == "int64"
+    assert bridge_lookup(empty, 0) == []
+
+
+def test_team_athletes_keep_codes_and_names_aligned(monkeypatch):
+    teams = pd.DataFrame(
+        {
+            "athletes": [encode(["KAO Wenchao", "D'ALMEIDA Marcus", "LI Zhongyuan"]), np.nan, encode(["SMITH Ann"])],
+            "athletes_codes": [encode(["1913366", "A12345", "1913367"]), np.nan, encode(["1000001"])],
+        }
+    )
+    monkeypatch.setattr(bridges, "load_teams", lambda: teams)
+    bridges.load_team_athletes.clear()
+    try:
+        team_athletes = bridges.load_team_athletes()
+        assert team_athletes["team_id"].tolist() == [0, 0, 0, 2]
+        assert bridge_lookup(team_athletes, 0) == ["1913366", "A12345", "1913367"]
+        assert bridge_lookup(team_athletes, 0, "athlete") == ["KAO Wenchao", "D'ALMEIDA Marcus", "LI Zhongyuan"]
+        assert bridge_lookup(team_athletes, 1, "athlete") == []
+        assert bridges.athletes_in_team(2, "athlete") == ["SMITH Ann"]
+    finally:
+        bridges.load_team_athletes.clear()
+
+
+def test_venues_for_sport(monkeypatch, frame):
+    venues = pd.DataFrame({"venue": [f"Venue {row}" for row in range(len(frame))], "sports": frame["sports"]})
+    monkeypatch.setattr(bridges, "load_venues", lambda: venues)
+    bridges.load_venue_sports.clear()
+    try:
+        for sport in VALUES + ["Curling"]:
+            hosts = [row for row, cell in enumerate(frame["sports"]) if sport in naive_parse(cell)]
+            assert bridges.venues_for_sport(sport)["venue"].tolist() == [f"Venue {row}" for row in hosts]
+    finally:
+        bridges.load_venue_sports.clear()
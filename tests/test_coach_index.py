@@ -0,0 +1,130 @@
+"""CoachIndex lookups against the per-call teams scan they replace."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.synthetic import DISCIPLINES, NOCS
+from utils.coach_index import CoachIndex
+
+COACH_NAMES = [f"COACH{number:02d} Name" for number in range(12)]
+
+
+def encode(values: list) -> str:
+    return "[" + ", ".join(f"'{value}'" for value in values) + "]"
+
+
+@pytest.fixture(scope="module")
+def teams() -> pd.DataFrame:
+    rng = np.random.default_rng(8)
+    rows = []
+    for position in range(60):
+        discipline = DISCIPLINES[rng.integers(len(DISCIPLINES))]
+        noc = NOCS[rng.integers(len(NOCS))]
+        # Up to 5 coaches per team, drawn from a small pool so names repeat across teams
+        picked = list(rng.choice(len(COACH_NAMES), size=rng.integers(0, 6), replace=False))
+        rows.append(
+            {
+                "code": f"TEAM{position:03d}",
+                "team": f"{noc} {discipline}",
+                "noc": noc,
+                "country": f"Country {noc}",
+                "discipline": discipline,
+                "team_gender": "MW"[position % 2],
+                "coaches": encode([COACH_NAMES[pick] for pick in picked]) if picked else np.nan,
+                "coaches_codes": encode([f"C{pick:02d}" for pick in picked]) if picked else np.nan,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(scope="module")
+def coaches() -> pd.DataFrame:
+    # The last coach has no row in coaches.csv
+    numbers = range(len(COACH_NAMES) - 1)
+    return pd.DataFrame(
+        {"code": [f"C{number:02d}" for number in numbers], "function": ["Coach", "Head Coach"] * 5 + ["Assistant"]}
+    )
+
+
+@pytest.fixture(scope="module")
+def index(teams, coaches) -> CoachIndex:
+    return CoachIndex(teams, coaches)
+
+
+def reference_coaches(disciplines: list, teams: pd.DataFrame) -> list:
+    """The page's former lookup: scan the teams of the first 2 disciplines on every call."""
+    coaches_list = []
+    for discipline in disciplines[:2]:
+        for _, team in teams[teams["discipline"] == discipline].iterrows():
+            team_coaches = team.get("coaches", "")
+            if pd.notna(team_coaches) and team_coaches:
+                coaches_str = str(team_coaches).replace("[", "").replace("]", "").replace("'", "")
+                for coach_name in [c.strip() for c in coaches_str.split(",") if c.strip()][:3]:
+                    coaches_list.append(
+                        {
+                            "name": coach_name,
+                            "team": team["team"],
+                            "country": team["country"],
+                            "discipline": team["discipline"],
+                            "team_gender": team["team_gender"],
+                        }
+                    )
+    unique_coaches, seen_names = [], set()
+    for coach in coaches_list:
+        if coach["name"] not in seen_names:
+            seen_names.add(coach["name"])
+            unique_coaches.append(coach)
+    return unique_coaches[:3]
+
+
+DISCIPLINE_LISTS = [
+    [],
+    ["Athletics"],
+    ["Rowing"],
+    ["Swimming", "Judo"],
+    ["Judo", "Swimming"],
+    # Only the first two disciplines count
+    ["Curling", "Athletics", "Swimming"],
+    DISCIPLINES,
+]
+
+
+@pytest.mark.parametrize("disciplines", DISCIPLINE_LISTS)
+def test_for_disciplines_matches_teams_scan(index, teams, disciplines):
+    fields = ["name", "team", "country", "discipline", "team_gender"]
+    found = [{field: coach[field] for field in fields} for coach in index.for_disciplines(disciplines)]
+    assert found == reference_coaches(disciplines, teams)
+
+
+def test_for_disciplines_rules(index, teams):
+    coaches = index.for_disciplines(DISCIPLINES)
+    assert len(coaches) <= 3
+    assert len({coach["name"] for coach in coaches}) == len(coaches)
+    assert {coach["discipline"] for coach in coaches} <= set(DISCIPLINES[:2])
+    assert index.for_disciplines(DISCIPLINES, limit=20) == index.for_disciplines(DISCIPLINES[:2], limit=20)
+    for team in teams.itertuples():
+        assert len(index.for_team(team.code)) <= 3
+
+
+def test_for_disciplines_by_country(index, teams):
+    for (discipline, noc), group in teams.groupby(["discipline", "noc"]):
+        found = [coach["name"] for coach in index.for_disciplines([discipline], noc=noc)]
+        assert found == [coach["name"] for coach in reference_coaches([discipline], group)]
+
+
+def test_coach_function_from_coaches_csv(index, teams, coaches):
+    functions = dict(zip(coaches["code"], coaches["function"]))
+    seen = 0
+    for team in teams.itertuples():
+        for coach in index.for_team(team.code):
+            seen += 1
+            assert coach["function"] == functions.get(coach["code"], "N/A")
+            assert coach["code"] == f"C{COACH_NAMES.index(coach['name']):02d}"
+    assert seen
+
+
+def test_missing_sources():
+    assert CoachIndex(pd.DataFrame(), pd.DataFrame()).for_disciplines(DISCIPLINES) == []
+    teams = pd.DataFrame({"code": ["T1"], "discipline": ["Judo"], "coaches": ["['A B']"]})
+    assert [coach["function"] for coach in CoachIndex(teams, pd.DataFrame()).for_team("T1")] == ["N/A"]
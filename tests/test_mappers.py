@@ -0,0 +1,41 @@
+"""NOC dimension lookups for the codes whose continent or ISO3 mapping changed."""
+
+import pandas as pd
+import pytest
+
+from utils.mappers import OTHER_CONTINENT, build_noc_dimension, continent_codes
+
+# NOC -> (continent, ISO3); IRI, MAW and GEQ were keyed by their ISO codes before
+CHANGED = {
+    "IRI": ("Asia", "IRN"),
+    "MAW": ("Africa", "MWI"),
+    "GEQ": ("Africa", "GNQ"),
+    "RUS": ("Europe", "RUS"),
+    "TUR": ("Europe", "TUR"),
+    "BDI": ("Africa", "BDI"),
+    "MTN": ("Africa", "MRT"),
+}
+
+
+@pytest.fixture
+def dimension() -> pd.DataFrame:
+    nocs = pd.DataFrame({"code": list(CHANGED), "country": list(CHANGED), "country_long": list(CHANGED)})
+    return build_noc_dimension(nocs).set_index("noc")
+
+
+@pytest.mark.parametrize("noc", list(CHANGED))
+def test_dimension_continent_and_iso3(dimension, noc):
+    continent, iso3 = CHANGED[noc]
+    assert dimension.loc[noc, "continent"] == continent
+    assert dimension.loc[noc, "iso3"] == iso3
+
+
+def test_continent_codes_match_dimension(dimension):
+    nocs = pd.Series(list(CHANGED) * 2 + [None])
+    continents = continent_codes(nocs)
+    assert list(continents) == list(dimension["continent"]) * 2 + [OTHER_CONTINENT]
+    assert list(continent_codes(nocs.astype("category"))) == list(continents)
+
+
+def test_iso_codes_are_not_noc_codes():
+    assert list(continent_codes(pd.Series(["IRN", "MWI", "EQG"]))) == [OTHER_CONTINENT] * 3
@@ -0,0 +1,79 @@
+"""MedalCube tallies against the groupby over raw medal rows they replace."""
+
+import pandas as pd
+import pytest
+
+from tests.synthetic import FIRST_DAY, MEDAL_TYPES, make_filters
+from utils.medal_cube import MedalCube, medal_counts
+from utils.shared_filters import filter_mask
+
+TALLY_COLUMNS = ["noc"] + MEDAL_TYPES + ["Total"]
+
+
+def groupby_tally(medals: pd.DataFrame) -> pd.DataFrame:
+    """Gold/Silver/Bronze/Total per NOC with a plain groupby, sorted by NOC."""
+    counts = medals.groupby(["noc", "medal"]).size().unstack("medal", fill_value=0)
+    counts = counts.reindex(columns=MEDAL_TYPES, fill_value=0)
+    counts["Total"] = counts.sum(axis=1)
+    return counts.reset_index().rename_axis(columns=None)[TALLY_COLUMNS]
+
+
+def by_noc(tally: pd.DataFrame) -> pd.DataFrame:
+    return tally[TALLY_COLUMNS].sort_values("noc", ignore_index=True).astype({m: "int64" for m in TALLY_COLUMNS[1:]})
+
+
+def filtered(medals: pd.DataFrame, filters: dict) -> pd.DataFrame:
+    mask = filter_mask(medals, filters)
+    return medals if mask is None else medals[mask]
+
+
+def test_tally_matches_groupby(medals, filters):
+    expected = by_noc(groupby_tally(filtered(medals, filters)))
+    pd.testing.assert_frame_equal(by_noc(MedalCube(medals).tally(filters)), expected)
+
+
+def test_tally_is_ranked_gold_first(medals):
+    tally = MedalCube(medals).tally(make_filters())
+    ranked = tally.sort_values(["Gold", "Silver", "Bronze"], ascending=False, ignore_index=True)
+    pd.testing.assert_frame_equal(tally[MEDAL_TYPES], ranked[MEDAL_TYPES])
+
+
+@pytest.mark.parametrize("offset", [0, 3, 9])
+def test_daily_standings_match_groupby(medals, offset):
+    day = FIRST_DAY + pd.Timedelta(days=offset)
+    expected = by_noc(groupby_tally(medals[medals["medal_date"] == day]))
+    standings = MedalCube(medals).daily_standings(day)
+    pd.testing.assert_frame_equal(by_noc(standings), expected)
+    assert standings["Gold"].is_monotonic_decreasing
+
+
+@pytest.mark.parametrize("offset", [0, 4, 9])
+def test_standings_as_of_match_groupby(medals, offset):
+    day = FIRST_DAY + pd.Timedelta(days=offset)
+    expected = by_noc(groupby_tally(medals[medals["medal_date"] <= day]))
+    pd.testing.assert_frame_equal(by_noc(MedalCube(medals).standings_as_of(day)), expected)
+
+
+def test_days_without_medals_are_empty(medals):
+    cube = MedalCube(medals)
+    assert cube.daily_standings(FIRST_DAY - pd.Timedelta(days=1)).empty
+    assert cube.standings_as_of(FIRST_DAY - pd.Timedelta(days=1)).empty
+    assert cube.daily_standings(FIRST_DAY + pd.Timedelta(days=30)).empty
+
+
+def test_sport_summary_matches_groupby(medals, filters):
+    rows = filtered(medals, filters)
+    expected = rows.groupby("discipline").size()
+    summary = MedalCube(medals).sport_summary(filters).set_index("discipline")["Total"]
+    pd.testing.assert_series_equal(summary.sort_index().astype("int64"), expected, check_names=False)
+
+
+def test_medal_counts_matches_groupby(medals):
+    expected = by_noc(groupby_tally(medals))
+    pd.testing.assert_frame_equal(by_noc(medal_counts(medals, "noc")), expected)
+
+
+def test_empty_medals():
+    cube = MedalCube(pd.DataFrame(columns=["noc", "discipline", "medal", "medal_date"]))
+    assert cube.tally(make_filters()).empty
+    assert cube.daily_standings(FIRST_DAY).empty
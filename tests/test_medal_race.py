@@ -0,0 +1,48 @@
+"""Medal race standings against a cumulative groupby over raw medal rows."""
+
+import pandas as pd
+
+from tests.synthetic import MEDAL_TYPES
+from utils.medal_cube import MedalCube
+from utils.medal_race import cumulative_rankings, medal_race_bar, medal_race_bump
+
+COLUMNS = ["day", "noc"] + MEDAL_TYPES + ["Total", "rank"]
+
+
+def groupby_rankings(medals: pd.DataFrame) -> pd.DataFrame:
+    """Standings after each medal day with a groupby cumsum, ranked gold, silver, bronze (ties by NOC)."""
+    days = medals["medal_date"].dt.normalize()
+    counts = medals.groupby([days, "noc", "medal"]).size().unstack("medal", fill_value=0)
+    grid = pd.MultiIndex.from_product([sorted(days.unique()), sorted(medals["noc"].unique())], names=["day", "noc"])
+    counts = counts.reindex(index=grid, columns=MEDAL_TYPES, fill_value=0).groupby(level="noc").cumsum()
+    counts["Total"] = counts.sum(axis=1)
+
+    standings = counts.reset_index().sort_values(
+        ["day", "Gold", "Silver", "Bronze", "noc"], ascending=[True, False, False, False, True]
+    )
+    standings["rank"] = standings.groupby("day").cumcount() + 1
+    standings["day"] = standings["day"].dt.strftime("%b %d")
+    return standings[standings["Total"] > 0]
+
+
+def in_order(rankings: pd.DataFrame) -> pd.DataFrame:
+    rankings = rankings[COLUMNS].sort_values(["day", "rank"], ignore_index=True)
+    return rankings.astype({column: "int64" for column in COLUMNS[2:]}).rename_axis(columns=None)
+
+
+def test_rankings_match_groupby_cumsum(medals):
+    pd.testing.assert_frame_equal(in_order(cumulative_rankings(MedalCube(medals))), in_order(groupby_rankings(medals)))
+
+
+def test_rankings_are_dense_per_day(medals):
+    rankings = cumulative_rankings(MedalCube(medals))
+    for _, day in rankings.groupby("day"):
+        assert sorted(day["rank"]) == list(range(1, len(day) + 1))
+
+
+def test_no_medals():
+    rankings = cumulative_rankings(MedalCube(pd.DataFrame()))
+    assert rankings.empty and list(rankings.columns) == COLUMNS
+    # Both figures still build, without frames
+    medal_race_bar(rankings)
+    medal_race_bump(rankings)
@@ -0,0 +1,134 @@
+"""ResultCache eviction and expiry, and the keys of cached_result / versioned_cache."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils.result_cache as result_cache
+from tests.synthetic import make_filters
+from utils.readonly import ReadOnlyFrameError
+from utils.result_cache import ResultCache, cached_result, canonical_filters, versioned_cache
+
+
+def block(nbytes: int) -> np.ndarray:
+    return np.zeros(nbytes, dtype=np.uint8)
+
+
+@pytest.fixture
+def cache(monkeypatch) -> ResultCache:
+    """A fresh process cache under a dataset token the test can change."""
+    cache = ResultCache(max_bytes=10_000, ttl=60)
+    monkeypatch.setattr(result_cache, "load_result_cache", lambda: cache)
+    monkeypatch.setattr(result_cache, "dataset_token", lambda: "dataset-a")
+    return cache
+
+
+def counted():
+    """A compute function recording how often it ran (in its ``calls`` list)."""
+    calls = []
+
+    def compute(*args, **kwargs):
+        calls.append(args)
+        return ("result", args, tuple(sorted(kwargs.items())), len(calls))
+
+    compute.calls = calls
+    return compute
+
+
+def test_evicts_least_recently_used_by_bytes():
+    cache = ResultCache(max_bytes=250, ttl=60)
+    cache.put("a", block(100))
+    cache.put("b", block(100))
+    cache.get("a")
+    cache.put("c", block(100))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.nbytes == 200
+    assert cache.evictions == 1
+
+
+def test_values_over_budget_are_not_stored():
+    cache = ResultCache(max_bytes=50, ttl=60)
+    cache.put("big", block(100))
+    assert cache.get("big") is None
+    assert cache.nbytes == 0
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ResultCache(max_bytes=1000, ttl=30)
+    cache.put("a", block(10))
+    now[0] += 29
+    assert cache.get("a") is not None
+    now[0] += 2
+    assert cache.get("a") is None
+    assert cache.nbytes == 0
+
+
+def test_cached_frames_are_read_only():
+    cache = ResultCache(max_bytes=10_000, ttl=60)
+    df = cache.get_or_compute("frame", lambda: pd.DataFrame({"x": [1, 2]}))
+    with pytest.raises(ReadOnlyFrameError):
+        df.loc[0, "x"] = 5
+
+
+def test_canonical_filters_ignores_order():
+    a = {"countries": ["USA", "FRA"], "sports": ["Judo"], "medal_types": [], "continents": []}
+    b = {"continents": [], "medal_types": [], "sports": ["Judo"], "countries": ["FRA", "USA"]}
+    assert canonical_filters(a) == canonical_filters(b)
+    assert canonical_filters(a) != canonical_filters(make_filters(countries=["USA"]))
+
+
+def test_cached_result_computes_once_per_filters_and_dataset(cache, monkeypatch):
+    compute = counted()
+    filters = make_filters(countries=["USA"])
+    first = cached_result("test.tally", filters, compute)
+    assert cached_result("test.tally", make_filters(countries=["USA"]), compute) == first
+    assert len(compute.calls) == 1
+
+    cached_result("test.tally", make_filters(countries=["FRA"]), compute)
+    cached_result("test.tally", filters, compute, "per-day")
+    assert len(compute.calls) == 3
+
+    monkeypatch.setattr(result_cache, "dataset_token", lambda: "dataset-b")
+    assert cached_result("test.tally", filters, compute) != first
+    assert len(compute.calls) == 4
+
+
+def test_versioned_cache_keys_on_arguments_and_dataset(cache, monkeypatch):
+    compute = counted()
+    lookup = versioned_cache(compute)
+    assert lookup("Judo", 3) == lookup("Judo", 3)
+    assert len(compute.calls) == 1
+    lookup("Judo", 4)
+    lookup(day=datetime.date(2024, 7, 27))
+    assert len(compute.calls) == 3
+
+    monkeypatch.setattr(result_cache, "dataset_token", lambda: "dataset-b")
+    lookup("Judo", 3)
+    assert len(compute.calls) == 4
+
+
+@pytest.mark.parametrize(
+    "argument", [pd.DataFrame({"x": [1]}), pd.Series([1]), np.arange(3), ["Judo"], {"sport": "Judo"}, ("a", ["b"])]
+)
+def test_versioned_cache_rejects_non_scalar_arguments(cache, argument):
+    lookup = versioned_cache(counted())
+    with pytest.raises(TypeError):
+        lookup(argument)
+    with pytest.raises(TypeError):
+        lookup(value=argument)
+
+
+@pytest.mark.parametrize(
+    "argument", [None, "Judo", 3, 2.5, True, np.int64(7), datetime.date(2024, 7, 27), pd.Timestamp("2024-07-27")]
+)
+def test_versioned_cache_accepts_scalar_arguments(cache, argument):
+    compute = counted()
+    lookup = versioned_cache(compute)
+    assert lookup(argument) == lookup(argument)
+    assert lookup(("Judo", argument)) == lookup(("Judo", argument))
+    assert len(compute.calls) == 2
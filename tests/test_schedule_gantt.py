@@ -0,0 +1,47 @@
+"""Gantt day bands against a groupby over the raw sessions."""
+
+import pandas as pd
+
+from utils.schedule_gantt import band_figure, discipline_day_bands
+from utils.schedule_index import ScheduleIndex
+
+COLUMNS = ["discipline", "day", "start", "end", "sessions", "medal_sessions"]
+
+
+def groupby_bands(schedules: pd.DataFrame) -> pd.DataFrame:
+    """First start, last end, session and medal-session counts per (discipline, local start day)."""
+    frame = schedules.assign(
+        start=schedules["start_date"].dt.tz_localize(None),
+        end=schedules["end_date"].dt.tz_localize(None),
+        medal=schedules["event_medal"] > 0,
+    )
+    frame["day"] = frame["start"].dt.normalize()
+    bands = frame.groupby(["discipline", "day"]).agg(
+        start=("start", "min"), end=("end", "max"), sessions=("session", "count"), medal_sessions=("medal", "sum")
+    )
+    return bands.reset_index()
+
+
+def in_order(bands: pd.DataFrame) -> pd.DataFrame:
+    bands = bands[COLUMNS].sort_values(["discipline", "day"], ignore_index=True)
+    return bands.astype({"discipline": str, "sessions": "int64", "medal_sessions": "int64"})
+
+
+def test_bands_match_groupby(schedules):
+    bands = discipline_day_bands(ScheduleIndex(schedules))
+    pd.testing.assert_frame_equal(in_order(bands), in_order(groupby_bands(schedules)), check_dtype=False)
+    assert bands["sessions"].sum() == len(schedules)
+
+
+def test_bands_cover_their_sessions(schedules):
+    bands = discipline_day_bands(ScheduleIndex(schedules)).set_index(["discipline", "day"])
+    for session in schedules.itertuples():
+        start = session.start_date.tz_localize(None)
+        band = bands.loc[(session.discipline, start.normalize())]
+        assert band["start"] <= start and session.end_date.tz_localize(None) <= band["end"]
+
+
+def test_no_sessions():
+    bands = discipline_day_bands(ScheduleIndex(pd.DataFrame()))
+    assert bands.empty and list(bands.columns) == COLUMNS
+    band_figure(bands)
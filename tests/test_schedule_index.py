@@ -0,0 +1,101 @@
+"""ScheduleIndex lookups against brute-force scans of the schedule."""
+
+import pandas as pd
+import pytest
+
+from tests.synthetic import FIRST_DAY
+from utils.schedule_index import ScheduleIndex
+
+
+def sessions(frame: pd.DataFrame) -> list:
+    return sorted(frame["session"].tolist())
+
+
+def test_sessions_are_in_start_order(schedules):
+    index = ScheduleIndex(schedules)
+    assert len(index) == len(schedules)
+    assert index.sessions["start_date"].is_monotonic_increasing
+
+
+@pytest.mark.parametrize("offset", [-1, 0, 2, 4, 6])
+def test_sessions_on_matches_date_comparison(schedules, offset):
+    day = FIRST_DAY + pd.Timedelta(days=offset)
+    expected = schedules[schedules["start_date"].dt.date == day.date()]
+    assert sessions(ScheduleIndex(schedules).sessions_on(day)) == sessions(expected)
+
+
+def test_days_are_the_start_dates(schedules):
+    index = ScheduleIndex(schedules)
+    assert [day.date() for day in index.days] == sorted(schedules["start_date"].dt.date.unique())
+
+
+def test_empty_schedule():
+    index = ScheduleIndex(pd.DataFrame(columns=["start_date", "end_date"]))
+    assert len(index) == 0
+    assert index.sessions_on(FIRST_DAY).empty
+
+
+def brute_overlapping(schedules, t0, t1, venue=None, discipline=None) -> pd.DataFrame:
+    rows = schedules[(schedules["start_date"] < t1) & (schedules["end_date"] > t0)]
+    if venue is not None:
+        rows = rows[rows["venue"] == venue]
+    if discipline is not None:
+        rows = rows[rows["discipline"] == discipline]
+    return rows
+
+
+WINDOWS = [
+    (FIRST_DAY + pd.Timedelta(hours=10), FIRST_DAY + pd.Timedelta(hours=11)),
+    (FIRST_DAY + pd.Timedelta(days=1), FIRST_DAY + pd.Timedelta(days=2)),
+    (FIRST_DAY + pd.Timedelta(days=2, minutes=7), FIRST_DAY + pd.Timedelta(days=2, minutes=8)),
+    (FIRST_DAY - pd.Timedelta(days=3), FIRST_DAY + pd.Timedelta(days=10)),
+    (FIRST_DAY + pd.Timedelta(days=8), FIRST_DAY + pd.Timedelta(days=9)),
+]
+
+
+@pytest.mark.parametrize("t0, t1", WINDOWS)
+@pytest.mark.parametrize(
+    "venue, discipline", [(None, None), ("Bercy Arena", None), (None, "Judo"), ("Stade de France", "Rowing")]
+)
+def test_overlapping_matches_interval_scan(schedules, t0, t1, venue, discipline):
+    local_t0, local_t1 = t0.tz_localize("Europe/Paris"), t1.tz_localize("Europe/Paris")
+    expected = sessions(brute_overlapping(schedules, local_t0, local_t1, venue, discipline))
+    index = ScheduleIndex(schedules)
+    # Naive bounds are local venue time; aware bounds in any zone are converted
+    assert sessions(index.overlapping(t0, t1, venue=venue, discipline=discipline)) == expected
+    utc_t0, utc_t1 = local_t0.tz_convert("UTC"), local_t1.tz_convert("UTC")
+    assert sessions(index.overlapping(utc_t0, utc_t1, venue=venue, discipline=discipline)) == expected
+
+
+@pytest.mark.parametrize("minutes", [0, 600, 725, 1440 * 2 + 61, 1440 * 4 + 999])
+def test_on_now_matches_interval_scan(schedules, minutes):
+    now = (FIRST_DAY + pd.Timedelta(minutes=minutes)).tz_localize("Europe/Paris")
+    expected = schedules[(schedules["start_date"] <= now) & (schedules["end_date"] > now)]
+    index = ScheduleIndex(schedules)
+    assert sessions(index.on_now(now)) == sessions(expected)
+    judo = expected[expected["discipline"] == "Judo"]
+    assert sessions(index.on_now(now, discipline="Judo")) == sessions(judo)
+
+
+@pytest.mark.parametrize("minutes", [-60, 0, 1440 + 30, 1440 * 3 + 300, 1440 * 6])
+@pytest.mark.parametrize("discipline", [None, "Swimming"])
+def test_next_medal_session_matches_scan(schedules, minutes, discipline):
+    after = (FIRST_DAY + pd.Timedelta(minutes=minutes)).tz_localize("Europe/Paris")
+    candidates = schedules[(schedules["event_medal"] > 0) & (schedules["start_date"] >= after)]
+    if discipline is not None:
+        candidates = candidates[candidates["discipline"] == discipline]
+
+    found = ScheduleIndex(schedules).next_medal_session(after, discipline=discipline)
+    if candidates.empty:
+        assert found is None
+    else:
+        assert found["start_date"] == candidates["start_date"].min()
+        assert found["event_medal"] > 0
+        assert discipline is None or found["discipline"] == discipline
+
+
+@pytest.mark.parametrize("offset", [0, 3])
+def test_at_venue_matches_scan(schedules, offset):
+    day = FIRST_DAY + pd.Timedelta(days=offset)
+    expected = schedules[(schedules["venue"] == "Bercy Arena") & (schedules["start_date"].dt.date == day.date())]
+    assert sessions(ScheduleIndex(schedules).at_venue("Bercy Arena", day)) == sessions(expected)
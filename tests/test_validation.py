@@ -0,0 +1,84 @@
+"""IngestReport findings and file statuses on a synthetic catalog."""
+
+import pandas as pd
+import pytest
+
+from utils.validation import IngestReport
+
+
+@pytest.fixture
+def report() -> IngestReport:
+    frames = {
+        "nocs": pd.DataFrame({"code": ["USA", "FRA", "KEN"], "country": ["United States", "France", "Kenya"]}),
+        "medals": pd.DataFrame(
+            {
+                "noc": ["USA", "FRA", "XYZ", "USA", "XYZ"],
+                "discipline": ["Judo", "Judo", "Rowing", "Judo", "Rowing"],
+                "event": ["-60 kg", "-66 kg", "Single Sculls", "-60 kg", "Pair"],
+                "medal": ["Gold", "Gold", "Silver", "Gold", "Bronze"],
+                "code": [1, 2, 3, 1, 4],
+            }
+        ),
+        "teams": pd.DataFrame({"noc": ["KEN", "ABC", "ABC"], "discipline": ["Rowing"] * 3}),
+        # athletes.csv is missing: the loader served an empty frame
+        "athletes": pd.DataFrame(),
+        "venues": pd.DataFrame(),
+        "schedules": pd.DataFrame({"discipline": ["Judo"], "venue": [None]}),
+        "coaches": pd.DataFrame({"noc": ["FRA"], "disciplines": ["['Judo']"]}),
+    }
+    issues = {
+        "athletes.csv": [("error", "athletes.csv: file not found in data/")],
+        "coaches.csv": [("error", "coaches.csv: missing required column 'code'")],
+        "schedules.csv": [("warning", "schedules.csv: 1 unparseable start_date")],
+        "events.csv": [],
+    }
+    return IngestReport(frames, issues, "test")
+
+
+def test_orphan_nocs(report):
+    orphans = report.orphan_nocs.sort_values(["source", "noc"], ignore_index=True)
+    assert orphans.to_dict("records") == [
+        {"source": "medals", "noc": "XYZ", "rows": 2},
+        {"source": "teams", "noc": "ABC", "rows": 2},
+    ]
+
+
+def test_duplicate_medals(report):
+    duplicates = report.duplicate_medals
+    assert duplicates[["source", "discipline", "event", "medal", "code", "copies"]].to_dict("records") == [
+        {"source": "medals", "discipline": "Judo", "event": "-60 kg", "medal": "Gold", "code": 1, "copies": 2}
+    ]
+
+
+def test_findings_are_warnings_after_errors(report):
+    assert report.has_errors
+    assert report.issues["severity"].tolist() == ["error", "error", "warning", "warning", "warning", "warning"]
+    messages = report.issues["message"].tolist()
+    assert "medals.csv: 1 NOC code(s) not in nocs.csv (XYZ)" in messages
+    assert "medals.csv: 1 duplicate medal award(s)" in messages
+
+
+def test_file_statuses(report):
+    statuses = dict(zip(report.files["source"], report.files["status"]))
+    assert statuses["athletes.csv"] == "missing"
+    assert statuses["coaches.csv"] == "error"
+    assert statuses["venues.csv"] == statuses["events.csv"] == "empty"
+    assert statuses["medals.csv"] == statuses["teams.csv"] == statuses["schedules.csv"] == "warning"
+    assert statuses["nocs.csv"] == "ok"
+
+
+def test_unusable(report):
+    unusable = report.unusable(["athletes.csv", "coaches.csv", "venues.csv", "medals.csv", "nocs.csv"])
+    assert dict(zip(unusable["source"], unusable["status"])) == {
+        "athletes.csv": "missing",
+        "coaches.csv": "error",
+        "venues.csv": "empty",
+    }
+    assert report.unusable(["nocs.csv", "schedules.csv"]).empty
+
+
+def test_null_rates(report):
+    rates = report.null_rates.set_index(["source", "column"])["null_rate"]
+    assert rates[("schedules", "venue")] == 1.0
+    assert rates[("medals", "noc")] == 0.0
+    assert "athletes" not in set(report.null_rates["source"])
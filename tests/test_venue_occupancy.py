@@ -0,0 +1,78 @@
+"""VenueOccupancy sweep-line against a minute-by-minute scan of the sessions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.synthetic import FIRST_DAY
+from utils.schedule_index import ScheduleIndex
+from utils.venue_occupancy import VenueOccupancy
+
+
+def minute_scan(schedules: pd.DataFrame, venues, hours: pd.DatetimeIndex) -> tuple:
+    """(busy minutes, peak concurrent sessions) per venue and hour, counting sessions in progress each minute."""
+    minutes = pd.date_range(hours[0], hours[-1] + pd.Timedelta(minutes=59), freq="min").as_unit("ns")
+    minute_ns = minutes.asi8
+    starts = schedules["start_date"].dt.tz_localize(None).astype("datetime64[ns]").to_numpy().view(np.int64)
+    ends = schedules["end_date"].dt.tz_localize(None).astype("datetime64[ns]").to_numpy().view(np.int64)
+
+    busy = np.zeros((len(venues), len(hours)))
+    peak = np.zeros((len(venues), len(hours)), dtype=np.int64)
+    for position, venue in enumerate(venues):
+        at_venue = (schedules["venue"] == venue).to_numpy()
+        active = (
+            (starts[at_venue][None, :] <= minute_ns[:, None]) & (ends[at_venue][None, :] > minute_ns[:, None])
+        ).sum(axis=1)
+        per_hour = active.reshape(len(hours), 60)
+        busy[position] = (per_hour > 0).sum(axis=1)
+        peak[position] = per_hour.max(axis=1)
+    return busy, peak
+
+
+@pytest.fixture
+def occupancy(schedules) -> VenueOccupancy:
+    return VenueOccupancy(ScheduleIndex(schedules), pd.DataFrame())
+
+
+def test_hour_grid_covers_every_session(schedules, occupancy):
+    local_starts = schedules["start_date"].dt.tz_localize(None)
+    local_ends = schedules["end_date"].dt.tz_localize(None)
+    assert occupancy.hours[0] == local_starts.min().floor("h")
+    assert occupancy.hours[-1] + pd.Timedelta(hours=1) >= local_ends.max()
+    assert list(occupancy.venues) == sorted(schedules["venue"].unique())
+
+
+def test_busy_minutes_and_peak_sessions_match_minute_scan(schedules, occupancy):
+    busy, peak = minute_scan(schedules, occupancy.venues, occupancy.hours)
+    np.testing.assert_allclose(occupancy.busy_minutes, busy)
+    np.testing.assert_array_equal(occupancy.peak_sessions, peak)
+
+
+def test_back_to_back_sessions_are_not_concurrent():
+    start = FIRST_DAY + pd.Timedelta(hours=9)
+    minutes = pd.to_timedelta([0, 30, 10, 30, 90, 10], unit="min")
+    schedules = pd.DataFrame(
+        {
+            "start_date": start + minutes[:3],
+            "end_date": start + minutes[3:],
+            "venue": ["Bercy Arena"] * 3,
+            "discipline": ["Judo"] * 3,
+        }
+    )
+    occupancy = VenueOccupancy(ScheduleIndex(schedules), pd.DataFrame())
+    np.testing.assert_allclose(occupancy.busy_minutes, [[60, 30]])
+    np.testing.assert_array_equal(occupancy.peak_sessions, [[1, 1]])
+
+
+def test_day_matrix_places_hours_of_the_day(schedules, occupancy):
+    day = FIRST_DAY + pd.Timedelta(days=1)
+    matrix = occupancy.day_matrix(day, "busy_minutes")
+    on_day = occupancy.hours.normalize() == day
+    for hour, values in zip(occupancy.hours[on_day].hour, occupancy.busy_minutes[:, on_day].T):
+        np.testing.assert_allclose(matrix[:, hour], values)
+
+
+def test_empty_schedule():
+    occupancy = VenueOccupancy(ScheduleIndex(pd.DataFrame(columns=["start_date", "end_date"])), pd.DataFrame())
+    assert len(occupancy.venues) == 0
+    assert occupancy.busy_minutes.shape == (0, 0)
@@ -0,0 +1,147 @@
+"""
+Athlete name search index for the Athlete Profile Card.
+
+Names are folded once (accents stripped, case-folded, tokens sorted) so that
+"EVENEPOEL Remco" (medallists.csv) and "Remco Evenepoel" (medals.csv) resolve
+to the same key. A token-prefix map answers typeahead queries with a handful of
+set intersections, and athlete codes map straight to their profile row and
+medal rows, so the page never scans the full frames.
+"""
+
+import unicodedata
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import load_athletes, load_medallists
+
+# Longest token prefix stored in the typeahead map; longer query tokens are
+# matched on this prefix and then verified against the full token
+MAX_PREFIX = 12
+
+
+def fold_name(name: str) -> list:
+    """Split a name into accent-free, case-folded tokens."""
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    for sep in "-'.,":
+        text = text.replace(sep, " ")
+    return text.split()
+
+
+def name_key(name: str) -> str:
+    """Order-insensitive key: 'SURNAME Given' and 'Given SURNAME' share a key."""
+    return " ".join(sorted(fold_name(name)))
+
+
+def _code_key(code) -> str:
+    """Normalise an athlete code read as int, float or string."""
+    if pd.isna(code):
+        return ""
+    try:
+        return str(int(float(code)))
+    except (TypeError, ValueError):
+        return str(code)
+
+
+class AthleteSearchIndex:
+    """Typeahead over athlete names plus O(1) code -> row lookups."""
+
+    def __init__(self, athletes: pd.DataFrame, medallists: pd.DataFrame):
+        names = athletes["name"].astype(object).to_numpy() if "name" in athletes.columns else np.array([])
+        codes = athletes["code"].to_numpy() if "code" in athletes.columns else np.full(len(names), np.nan)
+
+        self.names = names
+        self.tokens = [fold_name(name) if pd.notna(name) else [] for name in names]
+        self.keys = [" ".join(sorted(tokens)) for tokens in self.tokens]
+
+        # Athlete code -> profile row position, and name key -> row position
+        self.code_to_row = {}
+        self.key_to_row = {}
+        for row, (code, key) in enumerate(zip(codes, self.keys)):
+            if _code_key(code):
+                self.code_to_row.setdefault(_code_key(code), row)
+            if key:
+                self.key_to_row.setdefault(key, row)
+        self.row_codes = [_code_key(code) for code in codes]
+
+        # Token prefix -> sorted row positions
+        prefixes = {}
+        for row, tokens in enumerate(self.tokens):
+            for token in tokens:
+                for length in range(1, min(len(token), MAX_PREFIX) + 1):
+                    prefixes.setdefault(token[:length], set()).add(row)
+        self.prefixes = {prefix: np.fromiter(rows, dtype=np.int64) for prefix, rows in prefixes.items()}
+        for rows in self.prefixes.values():
+            rows.sort()
+
+        # Athlete code (and, as a fallback, name key) -> medallist row positions
+        self.medal_rows = {}
+        self.medal_rows_by_key = {}
+        if "code_athlete" in medallists.columns:
+            medal_codes = [_code_key(code) for code in medallists["code_athlete"].to_numpy()]
+            for code, positions in pd.Series(medal_codes).groupby(medal_codes).indices.items():
+                if code:
+                    self.medal_rows[code] = positions
+        if "name" in medallists.columns:
+            medal_keys = [name_key(name) if pd.notna(name) else "" for name in medallists["name"].to_numpy()]
+            for key, positions in pd.Series(medal_keys).groupby(medal_keys).indices.items():
+                if key:
+                    self.medal_rows_by_key[key] = positions
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, limit: int = 20, within: np.ndarray = None) -> list:
+        """
+        Return up to ``limit`` athlete row positions whose name tokens start with every query token.
+
+        ``within`` is an optional boolean mask over athlete rows (e.g. the global
+        filters). Exact name matches rank first, then shorter names.
+        """
+        query_tokens = fold_name(query)
+        if not query_tokens:
+            return []
+
+        candidates = None
+        for token in query_tokens:
+            rows = self.prefixes.get(token[:MAX_PREFIX])
+            if rows is None:
+                return []
+            if len(token) > MAX_PREFIX:
+                rows = np.array([r for r in rows if any(t.startswith(token) for t in self.tokens[r])], dtype=np.int64)
+            candidates = rows if candidates is None else np.intersect1d(candidates, rows, assume_unique=True)
+            if not len(candidates):
+                return []
+
+        if within is not None:
+            candidates = candidates[within[candidates]]
+
+        query_key = " ".join(sorted(query_tokens))
+        ranked = sorted(
+            candidates.tolist(),
+            key=lambda row: (self.keys[row] != query_key, len(self.keys[row]), self.keys[row]),
+        )
+        return ranked[:limit]
+
+    def row_for_code(self, code) -> int:
+        """Profile row position for an athlete code, or None."""
+        return self.code_to_row.get(_code_key(code))
+
+    def row_for_name(self, name: str) -> int:
+        """Profile row position for a name in either 'SURNAME Given' or 'Given SURNAME' order, or None."""
+        return self.key_to_row.get(name_key(name))
+
+    def medal_positions(self, row: int) -> np.ndarray:
+        """Medallist row positions for the athlete at a profile row."""
+        positions = self.medal_rows.get(self.row_codes[row])
+        if positions is None:
+            positions = self.medal_rows_by_key.get(self.keys[row], np.array([], dtype=np.int64))
+        return positions
+
+
+@st.cache_resource
+def load_athlete_search_index() -> AthleteSearchIndex:
+    """Build the athlete search index once per server process."""
+    return AthleteSearchIndex(load_athletes(), load_medallists())
@@ -0,0 +1,109 @@
+"""
+Bitmap inverted indexes for the global filter dimensions.
+
+Each indexed frame gets, per filter dimension (country, continent, sport,
+medal type), a map from value to a packed row bitset. Any combination of the
+global filters is then answered with bitwise OR inside a dimension, AND across
+dimensions and a popcount - without touching the frame itself. KPI cards can
+read counts straight from ``BitmapIndex.count``.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import CATALOG
+from utils.mappers import OTHER_CONTINENT, get_continent_from_noc
+
+# Number of set bits for every byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# Frames that are indexed, with the column holding their NOC code
+INDEXED_FRAMES = {"medals": "noc", "medallists": "noc", "athletes": "noc", "teams": "noc"}
+
+
+def _bitmaps_for(column: pd.Series) -> dict:
+    """Return ``value -> packed bitset`` for every non-null value of a column."""
+    bitmaps = {}
+    values = column.astype(object).to_numpy()
+    n_rows = len(values)
+    for value, positions in pd.Series(values).groupby(values, sort=False).indices.items():
+        bits = np.zeros(n_rows, dtype=bool)
+        bits[positions] = True
+        bitmaps[value] = np.packbits(bits)
+    return bitmaps
+
+
+class BitmapIndex:
+    """Value -> row bitset index over the filter dimensions of one frame."""
+
+    def __init__(self, df: pd.DataFrame, noc_col: str = "noc"):
+        self.n_rows = len(df)
+        self.n_bytes = (self.n_rows + 7) // 8
+        self.dimensions = {}
+
+        if noc_col in df.columns:
+            self.dimensions["countries"] = _bitmaps_for(df[noc_col])
+            # Continent bitmaps are unions of their NOC bitmaps
+            continents = {}
+            for noc, bits in self.dimensions["countries"].items():
+                continent = get_continent_from_noc(noc)
+                continents[continent] = continents[continent] | bits if continent in continents else bits.copy()
+            # Rows without a NOC count as "Other", as in shared_filters.filter_mask
+            missing = df[noc_col].isna().to_numpy()
+            if missing.any():
+                other = continents.get(OTHER_CONTINENT, np.zeros(self.n_bytes, dtype=np.uint8))
+                continents[OTHER_CONTINENT] = other | np.packbits(missing)
+            self.dimensions["continents"] = continents
+
+        # Same precedence as shared_filters.filter_mask
+        if "discipline" in df.columns:
+            self.dimensions["sports"] = _bitmaps_for(df["discipline"])
+        elif "sport" in df.columns:
+            self.dimensions["sports"] = _bitmaps_for(df["sport"])
+
+        if "medal" in df.columns:
+            self.dimensions["medal_types"] = _bitmaps_for(df["medal"])
+
+    def _union(self, dimension: str, values) -> np.ndarray:
+        """OR together the bitmaps of the selected values of one dimension."""
+        bits = np.zeros(self.n_bytes, dtype=np.uint8)
+        bitmaps = self.dimensions[dimension]
+        for value in values:
+            if value in bitmaps:
+                bits |= bitmaps[value]
+        return bits
+
+    def bits(self, filters: dict) -> np.ndarray:
+        """Packed bitset of the rows matching the filters, or None when nothing is filtered."""
+        result = None
+        for dimension in ("countries", "continents", "sports", "medal_types"):
+            if filters.get(dimension) and dimension in self.dimensions:
+                selected = self._union(dimension, filters[dimension])
+                result = selected if result is None else result & selected
+        return result
+
+    def mask(self, filters: dict) -> np.ndarray:
+        """Boolean row mask for the filters, or None when nothing is filtered."""
+        bits = self.bits(filters)
+        if bits is None:
+            return None
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
+
+    def count(self, filters: dict) -> int:
+        """Number of rows matching the filters, computed with a popcount."""
+        bits = self.bits(filters)
+        if bits is None:
+            return self.n_rows
+        return int(_POPCOUNT[bits].sum(dtype=np.int64))
+
+    def positions(self, filters: dict) -> np.ndarray:
+        """Integer row positions matching the filters."""
+        mask = self.mask(filters)
+        return np.arange(self.n_rows) if mask is None else np.flatnonzero(mask)
+
+
+@st.cache_resource
+def load_bitmap_index(name: str) -> BitmapIndex:
+    """Build the bitmap index of a catalog frame once per server process."""
+    return BitmapIndex(CATALOG[name](), INDEXED_FRAMES.get(name, "noc"))
@@ -0,0 +1,94 @@
+"""
+Normalised bridge tables for list-encoded CSV columns.
+
+Several sources store many-to-many relations as Python-list strings
+(``teams.athletes_codes``, ``venues.sports``, athletes' ``disciplines``/``events``...).
+The ones the pages read are exploded once per process into two-column bridge
+frames sorted by an integer key, so render code never does string surgery and
+joins such as "all athletes in this team" or "all venues hosting this sport"
+are a binary search or an ``isin``.
+
+Keys are integer row positions in the catalog frame (``team_id``,
+``venue_id``, ``athlete_id``), so ``frame.iloc[key]`` resolves the entity.
+Source codes are kept as values where they are not all numeric (about one in
+ten team athlete codes is alphanumeric).
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import load_athletes, load_teams, load_venues, parse_list
+from utils.readonly import freeze
+
+
+def explode_list_column(
+    df: pd.DataFrame, list_col: str, key_name: str, value_name: str, value_dtype: str = "category"
+) -> pd.DataFrame:
+    """Explode a list-encoded column into a read-only ``(row position, value)`` bridge sorted by key."""
+    if df.empty or list_col not in df.columns:
+        return freeze(pd.DataFrame({key_name: pd.Series(dtype="int64"), value_name: pd.Series(dtype=value_dtype)}))
+
+    bridge = pd.DataFrame({key_name: np.arange(len(df), dtype="int64"), value_name: df[list_col].map(parse_list)})
+    bridge = bridge.explode(value_name).dropna()
+    bridge[key_name] = bridge[key_name].astype("int64")
+    bridge[value_name] = bridge[value_name].astype(value_dtype)
+    return freeze(bridge.reset_index(drop=True))
+
+
+def bridge_lookup(bridge: pd.DataFrame, key, value_col: str = None) -> list:
+    """Return the values linked to ``key`` using a binary search on the sorted key column."""
+    if bridge.empty or key is None or pd.isna(key):
+        return []
+    key_col, default_value_col = bridge.columns[:2]
+    keys = bridge[key_col].to_numpy()
+    start, stop = np.searchsorted(keys, key, side="left"), np.searchsorted(keys, key, side="right")
+    return bridge[value_col or default_value_col].iloc[start:stop].tolist()
+
+
+@st.cache_resource
+def load_team_athletes() -> pd.DataFrame:
+    """team_id -> athlete_code, with the athlete name as listed on the team."""
+    teams = load_teams()
+    if teams.empty or not {"athletes", "athletes_codes"} <= set(teams.columns):
+        columns = {"team_id": "int64", "athlete_code": "object", "athlete": "object"}
+        return freeze(pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in columns.items()}))
+    # Codes and names are parallel lists: explode them together to keep them aligned
+    rows = [
+        (team_id, code, name)
+        for team_id, (codes, names) in enumerate(
+            zip(teams["athletes_codes"].map(parse_list), teams["athletes"].map(parse_list))
+        )
+        for code, name in zip(codes, names)
+    ]
+    return freeze(pd.DataFrame(rows, columns=["team_id", "athlete_code", "athlete"]))
+
+
+@st.cache_resource
+def load_venue_sports() -> pd.DataFrame:
+    """venue_id -> sport."""
+    return explode_list_column(load_venues(), "sports", "venue_id", "sport")
+
+
+@st.cache_resource
+def load_athlete_disciplines() -> pd.DataFrame:
+    """athlete_id -> discipline."""
+    return explode_list_column(load_athletes(), "disciplines", "athlete_id", "discipline")
+
+
+@st.cache_resource
+def load_athlete_events() -> pd.DataFrame:
+    """athlete_id -> event."""
+    return explode_list_column(load_athletes(), "events", "athlete_id", "event")
+
+
+def athletes_in_team(team_id: int, value_col: str = "athlete_code") -> list:
+    """Athlete codes (or ``"athlete"`` names) of the team at row ``team_id``."""
+    return bridge_lookup(load_team_athletes(), team_id, value_col)
+
+
+def venues_for_sport(sport: str) -> pd.DataFrame:
+    """Venue rows hosting a sport."""
+    venue_sports = load_venue_sports()
+    venue_ids = venue_sports.loc[venue_sports["sport"] == sport, "venue_id"].unique()
+    return load_venues().iloc[np.sort(venue_ids)]
@@ -0,0 +1,105 @@
+"""
+Build step for the memory-mapped dataset bundle.
+
+    python -m utils.bundle build
+
+loads every catalog frame through the normal ingest path (schemas, builders,
+shared categoricals) and writes each one as an uncompressed Arrow IPC file
+under ``data/.cache/bundle-<data version>/``, with a manifest holding row
+counts and ingest issues. ``utils.data_ingest`` maps these files read-only in
+every server process, so workers start without parsing and share the numeric
+columns through the OS page cache instead of each holding its own copy (see
+``utils.data_ingest`` for which columns stay mapped).
+
+The bundle directory is assembled under a temporary name and renamed into
+place, so concurrent builds and running readers never see a partial bundle.
+Bundles of older data versions are removed; processes still mapping them keep
+their (unlinked) files until they exit. Building is a no-op when the bundle
+for the current data already exists.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from utils.data_ingest import CACHE_PATH, CATALOG, bundle_path, data_version, ingest_issues
+
+logger = logging.getLogger(__name__)
+
+
+def _write_frame(df: pd.DataFrame, path: Path) -> None:
+    table = pa.Table.from_pandas(pd.DataFrame(df), preserve_index=False)
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _remove_stale_bundles(keep: Path) -> None:
+    for path in CACHE_PATH.glob("bundle-*"):
+        if path != keep and path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def build_bundle(force: bool = False) -> Path:
+    """Write the bundle for the current data version (unless it exists) and return its directory."""
+    version = data_version()
+    target = bundle_path(version)
+    if (target / "manifest.json").exists() and not force:
+        logger.info("Bundle %s is up to date", target.name)
+        return target
+
+    started = time.perf_counter()
+    frames = {f"{name}.csv": loader() for name, loader in CATALOG.items()}
+    issues = ingest_issues()
+
+    CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    staging = CACHE_PATH / f".{target.name}.{os.getpid()}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    sources = {}
+    for filename, df in frames.items():
+        file = None
+        if not df.empty:
+            file = f"{Path(filename).stem}.arrow"
+            _write_frame(df, staging / file)
+        sources[filename] = {"file": file, "rows": len(df), "issues": issues.get(filename, [])}
+    manifest = {"version": version, "sources": sources}
+    # Written last: a bundle without a manifest is never read
+    (staging / "manifest.json").write_text(json.dumps(manifest))
+
+    if force and target.exists():
+        shutil.rmtree(target, ignore_errors=True)
+    try:
+        os.rename(staging, target)
+    except OSError:
+        # Another process published the same version first
+        shutil.rmtree(staging, ignore_errors=True)
+    _remove_stale_bundles(keep=target)
+
+    size_mb = sum(path.stat().st_size for path in target.iterdir()) / 1e6
+    logger.info("Built bundle %s (%.1f MB) in %.1fs", target.name, size_mb, time.perf_counter() - started)
+    return target
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.bundle", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="compile data/ into the memory-mapped bundle")
+    build.add_argument("--force", action="store_true", help="rebuild even if the bundle is up to date")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    if args.command == "build":
+        build_bundle(force=args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Coach lookup index built from teams.csv and coaches.csv.
+
+Team rows carry their coaches as list-encoded strings. They are parsed once
+per process into coach records keyed by discipline, by (discipline, noc) and by
+team code, and enriched with the coach's function from coaches.csv. Resolving
+the coaches shown on an athlete profile is then a dictionary lookup instead of
+a scan over every team row.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import load_coaches, load_teams, parse_list
+
+# Disciplines and coaches per team considered for a profile, as shown on the page
+MAX_DISCIPLINES = 2
+MAX_COACHES_PER_TEAM = 3
+MAX_COACHES = 3
+
+
+def _text(value, default: str = "N/A") -> str:
+    """Return a display string, substituting ``default`` for missing values."""
+    return default if value is None or pd.isna(value) else str(value)
+
+
+class CoachIndex:
+    """Coach records keyed by discipline, (discipline, noc) and team code."""
+
+    def __init__(self, teams: pd.DataFrame, coaches: pd.DataFrame):
+        self.by_discipline = {}
+        self.by_discipline_noc = {}
+        self.by_team = {}
+
+        # Coach code -> function (Head Coach, Coach, ...)
+        functions = {}
+        if {"code", "function"} <= set(coaches.columns):
+            functions = {str(code): _text(function) for code, function in zip(coaches["code"], coaches["function"])}
+
+        if teams.empty or "coaches" not in teams.columns:
+            return
+
+        columns = ["code", "team", "noc", "country", "discipline", "team_gender", "coaches", "coaches_codes"]
+        team_rows = teams.reindex(columns=columns)
+        for team in team_rows.itertuples(index=False):
+            names = parse_list(team.coaches)[:MAX_COACHES_PER_TEAM]
+            if not names:
+                continue
+            codes = parse_list(team.coaches_codes)
+            records = []
+            for position, name in enumerate(names):
+                code = codes[position] if position < len(codes) else ""
+                records.append(
+                    {
+                        "name": name,
+                        "code": code,
+                        "function": functions.get(code, "N/A"),
+                        "team": _text(team.team),
+                        "country": _text(team.country),
+                        "discipline": _text(team.discipline),
+                        "team_gender": _text(team.team_gender),
+                    }
+                )
+            discipline = _text(team.discipline, "")
+            self.by_discipline.setdefault(discipline, []).extend(records)
+            self.by_discipline_noc.setdefault((discipline, _text(team.noc, "")), []).extend(records)
+            self.by_team[_text(team.code, "")] = records
+
+    @staticmethod
+    def _unique(records: list, limit: int) -> list:
+        """Keep the first record per coach name, up to ``limit`` records."""
+        unique, seen = [], set()
+        for record in records:
+            if record["name"] not in seen:
+                seen.add(record["name"])
+                unique.append(record)
+                if len(unique) == limit:
+                    break
+        return unique
+
+    def for_disciplines(self, disciplines: list, noc: str = None, limit: int = MAX_COACHES) -> list:
+        """Coaches of teams in the given disciplines (optionally one country), de-duplicated by name."""
+        records = []
+        for discipline in disciplines[:MAX_DISCIPLINES]:
+            if noc:
+                records.extend(self.by_discipline_noc.get((discipline, noc), []))
+            else:
+                records.extend(self.by_discipline.get(discipline, []))
+        return self._unique(records, limit)
+
+    def for_team(self, team_code: str) -> list:
+        """Coaches of one team."""
+        return self.by_team.get(team_code, [])
+
+    def for_athlete(self, athlete_row: pd.Series, limit: int = MAX_COACHES) -> list:
+        """Coaches for an athlete, based on the teams of their disciplines."""
+        return self.for_disciplines(parse_list(athlete_row.get("disciplines", "")), limit=limit)
+
+
+@st.cache_resource
+def load_coach_index() -> CoachIndex:
+    """Build the coach index once per server process."""
+    return CoachIndex(load_teams(), load_coaches())
@@ -0,0 +1,656 @@
+"""
+Process-wide data catalog.
+
+Every page reads its frames from here instead of declaring its own loaders.
+Each CSV in ``data/`` is read through its schema in ``utils.schemas`` (declared
+columns only, fixed dtypes, pyarrow engine when available, header validated),
+parsed once per server process and normalised once
+(``country_code`` -> ``noc``, ``medal_type`` -> ``medal``, " Medal" stripped).
+Loaders are wrapped in ``st.cache_resource`` so every session receives the
+*same* DataFrame object rather than a per-call copy: treat the returned frames
+as read-only and derive new frames instead of assigning columns in place.
+
+Normalised frames are also persisted as Parquet under ``data/.cache`` so a cold
+process reads typed columnar files instead of re-parsing CSVs. A cache entry is
+rebuilt whenever its source CSV changes (size/mtime first, content hash to
+confirm).
+
+For deployment, ``python -m utils.bundle build`` compiles every catalog frame
+into an Arrow IPC bundle for the current ``data_version``. When a bundle
+matching the data is present, loaders memory-map it instead of touching the CSV
+or Parquet files, and a new worker starts without parsing anything. Numeric
+column buffers stay in the mapped files, so several server processes on one
+host share a single copy of them through the OS page cache. String columns
+only stay mapped where pandas keeps them Arrow-backed (the default string
+dtype of pandas 3); with pandas 2 they are copied into Python objects per
+process. Categorical columns get their own codes and categories either way.
+
+Dimension columns are stored as pandas categoricals. ``noc``, ``country``,
+``discipline``, ``event``, ``medal``, ``gender``... share one category
+dictionary across the people/medal frames so codes line up between them.
+Every frame with a ``noc`` column also gets a categorical ``continent`` column,
+resolved once per NOC (``utils.mappers``); ``load_noc_dimension`` has the rest
+of the country metadata (names, flag, ISO3) keyed by NOC.
+Long URL columns that no page renders are left out of the main frames and can
+be read on demand with ``load_deferred_columns``.
+
+Timestamps are parsed here, once, with the explicit format the schema declares
+for each column instead of pandas format inference.
+Clock times are stored as UTC nanoseconds and exposed in Paris local time
+(``LOCAL_TZ``); ``utc_ns`` gives the raw int64 view. Calendar dates (medal
+days, birth dates) stay naive. Pages never re-parse dates.
+
+``load_catalog`` reads every registered source concurrently in a thread pool
+(file reads, the pyarrow parser and Parquet/Arrow decoding release the GIL),
+once per process, and reports how long each source took and where it was
+served from. Pages call it first so the first visitor after a restart waits
+for the slowest source rather than for the sum of all of them. It also fixes
+``dataset_token``, the content hash of the loaded sources that keys every
+result derived from them.
+
+pandas Copy-on-Write is enabled, and every catalog frame is returned as a
+``ReadOnlyFrame`` (see ``utils.readonly``): pages slice and derive without
+defensive copies, and an accidental in-place write raises
+instead of silently changing the frame for every other session.
+"""
+
+import ast
+import csv
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import streamlit as st
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from typing import Callable
+
+from utils.mappers import build_noc_dimension, continent_codes
+from utils.readonly import enable_copy_on_write, freeze
+from utils.schemas import DATE_FORMAT, SCHEMAS, SHARED_DIMENSION_SOURCES, SHARED_DIMENSIONS, TEXT, validate_header
+
+try:
+    import pyarrow as pa  # Parquet, CSV engine and the memory-mapped bundle
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+enable_copy_on_write()
+
+DATA_PATH = Path(__file__).parent.parent / "data"
+CACHE_PATH = DATA_PATH / ".cache"
+
+# Bump when the normalisation applied by the builders changes
+CACHE_FORMAT_VERSION = 6
+
+# Opening day of the Paris 2024 Games, used as the reference date for ages
+GAMES_START = pd.Timestamp("2024-07-26")
+
+# Timezone clock times are presented in
+LOCAL_TZ = "Europe/Paris"
+
+logger = logging.getLogger(__name__)
+
+# (severity, message) issues found while ingesting, per source; severity is error, warning or info
+_INGEST_ISSUES = {}
+_LOG_LEVELS = {"error": logging.ERROR, "warning": logging.WARNING, "info": logging.INFO}
+
+# Where each source's frame came from on its last load: bundle, parquet, csv or missing
+_LOAD_SOURCES = {}
+
+# Upper bound on loader threads for ``load_catalog``
+CATALOG_WORKERS = 8
+
+
+def _record_issues(filename: str, issues: list) -> None:
+    """Remember (and log) the ingest issues of a source."""
+    _INGEST_ISSUES[filename] = [tuple(issue) for issue in issues]
+    for severity, message in _INGEST_ISSUES[filename]:
+        logger.log(_LOG_LEVELS.get(severity, logging.WARNING), message)
+
+
+def ingest_issues() -> dict:
+    """Missing files, schema drift and parse issues per source, for the sources loaded so far."""
+    return {filename: list(issues) for filename, issues in _INGEST_ISSUES.items() if issues}
+
+
+def _read_header(filename: str) -> list:
+    """Return the column names of a source CSV (empty if it cannot be read)."""
+    try:
+        with open(DATA_PATH / filename, newline="", encoding="utf-8") as fh:
+            return next(csv.reader(fh), [])
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+def _read_csv(filename: str, columns: dict, issues: list = None) -> pd.DataFrame:
+    """
+    Read ``columns`` (name -> dtype) of a source CSV with fixed dtypes.
+
+    Declared columns missing from the file are skipped. If a value does not fit
+    its declared dtype the columns are re-read with type inference and the
+    mismatch is added to ``issues``. Returns an empty frame (and adds an error
+    to ``issues``) if the file cannot be read.
+    """
+    issues = issues if issues is not None else []
+    header = _read_header(filename)
+    dtypes = {column: columns[column] for column in header if column in columns}
+    if not dtypes:
+        return pd.DataFrame()
+    path = DATA_PATH / filename
+    try:
+        return pd.read_csv(path, usecols=list(dtypes), dtype=dtypes, engine="pyarrow" if HAS_PYARROW else "c")
+    except (ValueError, TypeError) as exc:
+        issues.append(("warning", f"{filename}: values do not match the schema dtypes, types inferred ({exc})"))
+    except Exception as exc:
+        issues.append(("error", f"{filename}: could not be read ({exc})"))
+        return pd.DataFrame()
+    try:
+        return pd.read_csv(path, usecols=list(dtypes))
+    except Exception as exc:
+        issues.append(("error", f"{filename}: could not be read ({exc})"))
+        return pd.DataFrame()
+
+
+def parse_list(value) -> list:
+    """
+    Parse a Python-list-encoded CSV cell (e.g. "['KAO Wenchao', "D'ALMEIDA Marcus"]").
+
+    Plain strings become a one-item list; missing values an empty list.
+    """
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return []
+    text = str(value).strip()
+    if not text:
+        return []
+    if text.startswith("["):
+        try:
+            return [str(v).strip() for v in ast.literal_eval(text) if str(v).strip()]
+        except (ValueError, SyntaxError):
+            text = text.strip("[]")
+            return [v.strip().strip("'\"").strip() for v in text.split(",") if v.strip().strip("'\"").strip()]
+    return [text]
+
+
+def parse_timestamps(values: pd.Series, fmt: str) -> pd.Series:
+    """Parse clock times with an exact format into ``LOCAL_TZ`` (stored as UTC nanoseconds)."""
+    parsed = pd.to_datetime(values, format=fmt, utc=True, errors="coerce")
+    return parsed.dt.as_unit("ns").dt.tz_convert(LOCAL_TZ)
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Parse calendar dates (``DATE_FORMAT``) into naive timestamps at midnight."""
+    return pd.to_datetime(values, format=DATE_FORMAT, errors="coerce").dt.as_unit("ns")
+
+
+def utc_ns(values: pd.Series):
+    """Int64 UTC nanoseconds of a parsed timestamp column (a view, no conversion)."""
+    return values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy().view("int64")
+
+
+def _normalize_timestamps(filename: str, df: pd.DataFrame, issues: list) -> pd.DataFrame:
+    """Parse the timestamp and date columns of a source with their declared formats."""
+    schema = SCHEMAS[filename]
+    formats = {**schema.timestamps, **{column: DATE_FORMAT for column in schema.dates}}
+    for column, fmt in formats.items():
+        if column not in df.columns:
+            continue
+        raw = df[column]
+        if pd.api.types.is_datetime64_any_dtype(raw):
+            # Already parsed by the pyarrow reader
+            if column in schema.timestamps:
+                df[column] = raw.dt.as_unit("ns").dt.tz_convert(LOCAL_TZ)
+            continue
+        df[column] = parse_timestamps(raw, fmt) if column in schema.timestamps else parse_dates(raw)
+        unparsed = int((df[column].isna() & raw.notna()).sum())
+        if unparsed:
+            issues.append(("warning", f"{filename}: {unparsed} value(s) in {column} do not match {fmt}"))
+    return df
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_fingerprint(filename: str) -> dict:
+    """Return size/mtime of a source CSV (empty dict if the file is missing)."""
+    path = DATA_PATH / filename
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "format": CACHE_FORMAT_VERSION,
+        "schema": hashlib.sha1(repr(SCHEMAS[filename]).encode()).hexdigest(),
+    }
+
+
+def data_version() -> str:
+    """Short token identifying the current state of ``data/`` (every source's size, mtime and schema)."""
+    digest = hashlib.sha1()
+    for filename in SCHEMAS:
+        digest.update(json.dumps([filename, source_fingerprint(filename)], sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+@st.cache_resource
+def dataset_token() -> str:
+    """
+    Content hash of every source, computed once per process.
+
+    Frames are loaded once per process too, so the token always describes the
+    data being served and costs nothing after the first call: use it to key
+    results derived from the catalog (``utils.result_cache``). ``data_version``
+    re-stats ``data/`` on every call and names on-disk artefacts instead.
+    """
+    digest = hashlib.sha1(str(CACHE_FORMAT_VERSION).encode())
+    for filename in SCHEMAS:
+        path = DATA_PATH / filename
+        digest.update(filename.encode())
+        digest.update(repr(SCHEMAS[filename]).encode())
+        digest.update(_file_digest(path).encode() if path.exists() else b"-")
+    return digest.hexdigest()[:16]
+
+
+@st.cache_resource
+def _shared_dimensions_digest() -> str:
+    """Digest of every source sharing the dimension dictionaries."""
+    digest = hashlib.sha1()
+    for filename in SHARED_DIMENSION_SOURCES:
+        path = DATA_PATH / filename
+        digest.update(filename.encode())
+        digest.update(_file_digest(path).encode() if path.exists() else b"-")
+    return digest.hexdigest()
+
+
+def _cache_key(filename: str) -> dict:
+    """Return the fingerprint a cache entry must match, including shared dictionaries."""
+    fingerprint = source_fingerprint(filename)
+    if fingerprint and filename in SHARED_DIMENSION_SOURCES:
+        fingerprint["dimensions"] = _shared_dimensions_digest()
+    return fingerprint
+
+
+def _cache_files(filename: str) -> tuple:
+    """Return the (parquet, manifest) paths for a source CSV."""
+    stem = Path(filename).stem
+    return CACHE_PATH / f"{stem}.parquet", CACHE_PATH / f"{stem}.json"
+
+
+def _cache_is_fresh(filename: str, fingerprint: dict) -> bool:
+    """Check a cache entry against the current source fingerprint."""
+    parquet_path, manifest_path = _cache_files(filename)
+    if not parquet_path.exists() or not manifest_path.exists():
+        return False
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return False
+    if manifest.get("format") != fingerprint["format"] or manifest.get("schema") != fingerprint["schema"]:
+        return False
+    if manifest.get("dimensions") != fingerprint.get("dimensions"):
+        return False
+    if manifest.get("size") == fingerprint["size"] and manifest.get("mtime_ns") == fingerprint["mtime_ns"]:
+        return True
+    # Touched but possibly unchanged (e.g. fresh checkout): confirm with the content hash
+    if manifest.get("size") != fingerprint["size"]:
+        return False
+    if manifest.get("sha1") != _file_digest(DATA_PATH / filename):
+        return False
+    _write_manifest(manifest_path, {**manifest, **fingerprint})
+    return True
+
+
+def _write_manifest(manifest_path: Path, manifest: dict) -> None:
+    """Atomically write a cache manifest."""
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(manifest))
+    os.replace(tmp_path, manifest_path)
+
+
+def _write_cache(filename: str, df: pd.DataFrame, fingerprint: dict, issues: list) -> None:
+    """Persist a normalised frame and its manifest (with its ingest issues); failures only cost the cache."""
+    parquet_path, manifest_path = _cache_files(filename)
+    try:
+        CACHE_PATH.mkdir(exist_ok=True)
+        tmp_path = parquet_path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+        _write_manifest(manifest_path, {**fingerprint, "sha1": _file_digest(DATA_PATH / filename), "issues": issues})
+    except (OSError, ValueError, pa.ArrowException) as exc:
+        logger.warning("%s: Parquet cache not written (%s)", filename, exc)
+
+
+def _load_cached(filename: str, builder: Callable[[pd.DataFrame], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Return the normalised frame for a source CSV.
+
+    Maps the frame from the bundle when one matches the data, reads the Parquet
+    cache when it is fresh, otherwise validates the CSV header
+    against its schema, parses the declared columns, applies ``builder`` and
+    refreshes the cache. Issues found on ingest are kept with the cache entry
+    and reported through ``ingest_issues``. The result is read-only.
+    """
+    fingerprint = _cache_key(filename)
+    if not fingerprint:
+        _record_issues(filename, [("error", f"{filename}: file not found in {DATA_PATH.name}/")])
+        _LOAD_SOURCES[filename] = "missing"
+        return freeze(pd.DataFrame())
+
+    bundled = _read_bundle(filename)
+    if bundled is not None:
+        _LOAD_SOURCES[filename] = "bundle"
+        return freeze(bundled)
+
+    if HAS_PYARROW and _cache_is_fresh(filename, fingerprint):
+        try:
+            df = pd.read_parquet(_cache_files(filename)[0])
+            _record_issues(filename, json.loads(_cache_files(filename)[1].read_text()).get("issues", []))
+            _LOAD_SOURCES[filename] = "parquet"
+            return freeze(df)
+        except (OSError, ValueError, pa.ArrowException) as exc:
+            logger.warning("%s: Parquet cache unreadable, re-reading the CSV (%s)", filename, exc)
+
+    _LOAD_SOURCES[filename] = "csv"
+    issues, missing_required = validate_header(filename, _read_header(filename))
+    if missing_required:
+        _record_issues(filename, issues)
+        return freeze(pd.DataFrame())
+
+    df = _read_csv(filename, SCHEMAS[filename].dtypes(native_datetimes=HAS_PYARROW), issues)
+    if df.empty:
+        if not any(severity == "error" for severity, _ in issues):
+            issues.append(("warning", f"{filename}: no rows"))
+        _record_issues(filename, issues)
+        return freeze(df)
+    df = _encode_dimensions(filename, builder(_normalize_timestamps(filename, df, issues)))
+    _record_issues(filename, issues)
+    if HAS_PYARROW:
+        _write_cache(filename, df, fingerprint, issues)
+    return freeze(df)
+
+
+def bundle_path(version: str) -> Path:
+    """Directory of the memory-mapped bundle built for a data version."""
+    return CACHE_PATH / f"bundle-{version}"
+
+
+@st.cache_resource
+def _bundle_manifest(version: str) -> dict:
+    """Manifest of the bundle for ``version``; empty when no complete bundle was built for it."""
+    try:
+        return json.loads((bundle_path(version) / "manifest.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _read_bundle(filename: str):
+    """Memory-map a source's frame from the bundle, or None when there is no bundle for the current data."""
+    if not HAS_PYARROW:
+        return None
+    version = data_version()
+    entry = _bundle_manifest(version).get("sources", {}).get(filename)
+    if entry is None:
+        return None
+    try:
+        if entry["file"] is None:
+            df = pd.DataFrame()
+        else:
+            source = pa.memory_map(str(bundle_path(version) / entry["file"]), "r")
+            # split_blocks: one block per column, so numeric columns are not consolidated into a copy.
+            # Strings stay in the map only as Arrow-backed pandas strings (pandas 3); pandas 2 copies them.
+            df = pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+    except Exception:
+        return None
+    _record_issues(filename, entry.get("issues", []))
+    return df
+
+
+def _rename_noc(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename ``country_code`` to ``noc``."""
+    return df.rename(columns={"country_code": "noc"})
+
+
+def _strip_medal_suffix(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename ``medal_type`` to ``medal`` and strip the ' Medal' suffix."""
+    df = df.rename(columns={"medal_type": "medal"})
+    if "medal" in df.columns:
+        df["medal"] = df["medal"].str.replace(" Medal", "", regex=False)
+    return df
+
+
+@st.cache_resource
+def shared_dimension_dtypes() -> dict:
+    """
+    Build the category dictionaries shared by the people/medal frames.
+
+    Only the dimension columns of each source are read, so this stays cheap even
+    when every Parquet entry has to be rebuilt.
+    """
+    raw_columns = {column: TEXT for column in set(SHARED_DIMENSIONS) | {"country_code", "medal_type"}}
+    values = {column: set() for column in SHARED_DIMENSIONS}
+    for filename in SHARED_DIMENSION_SOURCES:
+        df = _read_csv(filename, raw_columns)
+        if df.empty:
+            continue
+        df = _strip_medal_suffix(_rename_noc(df))
+        for column in values:
+            if column in df.columns:
+                values[column].update(df[column].dropna().astype(str).unique())
+    return {column: pd.CategoricalDtype(sorted(v)) for column, v in values.items()}
+
+
+def _encode_dimensions(filename: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Convert dimension columns of a normalised frame to categoricals and add ``continent``."""
+    if filename in SHARED_DIMENSION_SOURCES:
+        for column, dtype in shared_dimension_dtypes().items():
+            if column in df.columns:
+                df[column] = df[column].astype(dtype)
+    # Normally already categorical from the parser; re-applied after a type-inference fallback
+    for column in SCHEMAS[filename].categoricals:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+    if "noc" in df.columns:
+        df["continent"] = continent_codes(df["noc"])
+    return df
+
+
+def _normalize_medal_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename country/medal columns and strip the ' Medal' suffix."""
+    return _strip_medal_suffix(_rename_noc(df))
+
+
+def _unchanged(df: pd.DataFrame) -> pd.DataFrame:
+    """Identity builder for sources that need no normalisation."""
+    return df
+
+
+def _build_athletes(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalise athletes and add an ``age`` column at the start of the Games."""
+    df = _rename_noc(df)
+    if "birth_date" in df.columns:
+        df["age"] = ((GAMES_START - df["birth_date"]).dt.days / 365.25).astype(float)
+    return df
+
+
+@st.cache_resource
+def load_athletes() -> pd.DataFrame:
+    """Load athletes data with an ``age`` column at the start of the Games."""
+    return _load_cached("athletes.csv", _build_athletes)
+
+
+@st.cache_resource
+def load_medals() -> pd.DataFrame:
+    """Load individual medals."""
+    return _load_cached("medals.csv", _normalize_medal_columns)
+
+
+@st.cache_resource
+def load_medals_total() -> pd.DataFrame:
+    """Load medal totals by country."""
+    return _load_cached("medals_total.csv", _rename_noc)
+
+
+@st.cache_resource
+def load_medallists() -> pd.DataFrame:
+    """Load medallists data."""
+    return _load_cached("medallists.csv", _normalize_medal_columns)
+
+
+@st.cache_resource
+def load_events() -> pd.DataFrame:
+    """Load events data."""
+    return _load_cached("events.csv", _unchanged)
+
+
+@st.cache_resource
+def load_nocs() -> pd.DataFrame:
+    """Load NOCs data."""
+    return _load_cached("nocs.csv", _unchanged)
+
+
+@st.cache_resource
+def load_noc_dimension() -> pd.DataFrame:
+    """Country metadata per NOC code (country, country_long, continent, flag, iso3), indexed by NOC."""
+    return freeze(build_noc_dimension(load_nocs()).set_index("noc"))
+
+
+@st.cache_resource
+def load_coaches() -> pd.DataFrame:
+    """Load coaches data."""
+    return _load_cached("coaches.csv", _rename_noc)
+
+
+@st.cache_resource
+def load_teams() -> pd.DataFrame:
+    """Load teams data."""
+    return _load_cached("teams.csv", _rename_noc)
+
+
+@st.cache_resource
+def load_schedules() -> pd.DataFrame:
+    """Load schedules data with start/end timestamps in Paris time."""
+    return _load_cached("schedules.csv", _unchanged)
+
+
+@st.cache_resource
+def load_schedules_preliminary() -> pd.DataFrame:
+    """Load the preliminary schedule with UTC start/end timestamps shown in Paris time."""
+    return _load_cached("schedules_preliminary.csv", _unchanged)
+
+
+@st.cache_resource
+def load_venues() -> pd.DataFrame:
+    """Load venues data with opening/closing timestamps in Paris time."""
+    return _load_cached("venues.csv", _unchanged)
+
+
+@st.cache_resource
+def load_technical_officials() -> pd.DataFrame:
+    """Load technical officials data."""
+    return _load_cached("technical_officials.csv", _unchanged)
+
+
+@st.cache_resource
+def load_torch_route() -> pd.DataFrame:
+    """Load torch relay stages with start/end timestamps in Paris time."""
+    return _load_cached("torch_route.csv", _unchanged)
+
+
+@st.cache_resource
+def load_deferred_columns(filename: str) -> pd.DataFrame:
+    """Read the columns left out of a source's main frame (row-aligned with it)."""
+    columns = SCHEMAS[filename].deferred
+    return freeze(_read_csv(filename, columns) if columns else pd.DataFrame())
+
+
+CATALOG = {
+    "athletes": load_athletes,
+    "medals": load_medals,
+    "medals_total": load_medals_total,
+    "medallists": load_medallists,
+    "events": load_events,
+    "nocs": load_nocs,
+    "coaches": load_coaches,
+    "teams": load_teams,
+    "schedules": load_schedules,
+    "schedules_preliminary": load_schedules_preliminary,
+    "venues": load_venues,
+    "technical_officials": load_technical_officials,
+    "torch_route": load_torch_route,
+}
+
+
+@st.cache_resource
+def load_catalog() -> pd.DataFrame:
+    """
+    Load every catalog source concurrently, once per process.
+
+    Returns per-source timings (frame, rows, served_from, seconds), slowest
+    first; loaders are cached, so pages calling them afterwards get the frames
+    loaded here.
+    """
+    # Worker threads share the calling script's context so cached loaders behave as on the main thread
+    ctx = get_script_run_ctx(suppress_warning=True)
+    token = dataset_token()
+
+    def timed_load(name):
+        started = time.perf_counter()
+        df = CATALOG[name]()
+        return name, len(df), _LOAD_SOURCES.get(f"{name}.csv", ""), time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=min(CATALOG_WORKERS, len(CATALOG)),
+        thread_name_prefix="catalog",
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as pool:
+        rows = list(pool.map(timed_load, CATALOG))
+    elapsed = time.perf_counter() - started
+
+    timings = pd.DataFrame(rows, columns=["frame", "rows", "served_from", "seconds"])
+    timings = timings.sort_values("seconds", ascending=False, ignore_index=True)
+    logger.info(
+        "Loaded %d catalog sources (dataset %s) in %.2fs (%.2fs summed over sources)",
+        len(timings),
+        token,
+        elapsed,
+        timings["seconds"].sum(),
+    )
+    for row in timings.itertuples(index=False):
+        logger.info("  %s: %d rows from %s in %.3fs", row.frame, row.rows, row.served_from, row.seconds)
+    return freeze(timings)
+
+
+def memory_report() -> pd.DataFrame:
+    """Return the in-memory footprint of every catalog frame, largest first."""
+    rows = []
+    for name, loader in CATALOG.items():
+        df = loader()
+        usage = df.memory_usage(deep=True)
+        categorical = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+        rows.append(
+            {
+                "frame": name,
+                "rows": len(df),
+                "columns": len(df.columns),
+                "categorical_columns": len(categorical),
+                "memory_mb": round(usage.sum() / 1e6, 3),
+                "largest_column": usage.drop("Index").idxmax() if len(df.columns) else "",
+            }
+        )
+    return pd.DataFrame(rows).sort_values("memory_mb", ascending=False, ignore_index=True)
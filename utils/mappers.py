@@ -0,0 +1,651 @@
+"""
+NOC dimension: one row of country metadata per National Olympic Committee.
+
+Continent, flag and ISO 3166 alpha-3 code are resolved here, once per NOC,
+from nocs.csv and the tables below, instead of per row on every rerun.
+``utils.data_ingest.load_noc_dimension`` builds the table once per process;
+fact frames get their ``continent`` column at ingest, and pages join the
+dimension onto aggregated results by NOC code.
+
+IOC codes differ from ISO codes for about a third of the NOCs (GER/DEU,
+NED/NLD...) and some collide with another country's ISO code (BRN is Bahrain
+for the IOC, Brunei for ISO), so ISO3 codes come from ``NOC_ISO3`` rather
+than from the NOC code. When ``pycountry`` is installed it validates the
+result and resolves NOCs missing from the table by name; without it the table
+alone is used.
+"""
+
+import pandas as pd
+
+try:
+    import pycountry
+
+    HAS_PYCOUNTRY = True
+except ImportError:
+    HAS_PYCOUNTRY = False
+
+CONTINENTS = ["Europe", "Asia", "Africa", "North America", "South America", "Oceania"]
+
+# Continent of NOCs that are not in CONTINENT_MAP (neutral, refugee and historic teams)
+OTHER_CONTINENT = "Other"
+
+# NOC code -> continent (Olympic continental associations; Türkiye and the Caucasus in Europe)
+CONTINENT_MAP = {
+    # Europe
+    "GBR": "Europe",
+    "FRA": "Europe",
+    "GER": "Europe",
+    "ITA": "Europe",
+    "ESP": "Europe",
+    "NED": "Europe",
+    "POL": "Europe",
+    "UKR": "Europe",
+    "BEL": "Europe",
+    "SWE": "Europe",
+    "NOR": "Europe",
+    "DEN": "Europe",
+    "FIN": "Europe",
+    "SUI": "Europe",
+    "AUT": "Europe",
+    "POR": "Europe",
+    "GRE": "Europe",
+    "CZE": "Europe",
+    "ROU": "Europe",
+    "HUN": "Europe",
+    "IRL": "Europe",
+    "SRB": "Europe",
+    "CRO": "Europe",
+    "SVK": "Europe",
+    "SLO": "Europe",
+    "BUL": "Europe",
+    "LTU": "Europe",
+    "LAT": "Europe",
+    "EST": "Europe",
+    "BLR": "Europe",
+    "MDA": "Europe",
+    "GEO": "Europe",
+    "ARM": "Europe",
+    "AZE": "Europe",
+    "KOS": "Europe",
+    "MKD": "Europe",
+    "ALB": "Europe",
+    "BIH": "Europe",
+    "MNE": "Europe",
+    "CYP": "Europe",
+    "MLT": "Europe",
+    "LUX": "Europe",
+    "ISL": "Europe",
+    "AND": "Europe",
+    "SMR": "Europe",
+    "MON": "Europe",
+    "LIE": "Europe",
+    "RUS": "Europe",
+    "TUR": "Europe",
+    # Asia
+    "CHN": "Asia",
+    "JPN": "Asia",
+    "KOR": "Asia",
+    "IND": "Asia",
+    "THA": "Asia",
+    "VIE": "Asia",
+    "MAS": "Asia",
+    "SGP": "Asia",
+    "INA": "Asia",
+    "PHI": "Asia",
+    "TPE": "Asia",
+    "HKG": "Asia",
+    "KAZ": "Asia",
+    "UZB": "Asia",
+    "IRI": "Asia",
+    "IRQ": "Asia",
+    "KSA": "Asia",
+    "UAE": "Asia",
+    "QAT": "Asia",
+    "KUW": "Asia",
+    "BRN": "Asia",
+    "OMA": "Asia",
+    "JOR": "Asia",
+    "LBN": "Asia",
+    "SYR": "Asia",
+    "PAK": "Asia",
+    "BAN": "Asia",
+    "SRI": "Asia",
+    "NEP": "Asia",
+    "MYA": "Asia",
+    "CAM": "Asia",
+    "LAO": "Asia",
+    "MGL": "Asia",
+    "PRK": "Asia",
+    "TJK": "Asia",
+    "TKM": "Asia",
+    "KGZ": "Asia",
+    "AFG": "Asia",
+    "MDV": "Asia",
+    "BHU": "Asia",
+    "BRU": "Asia",
+    "TLS": "Asia",
+    "ISR": "Asia",
+    "PLE": "Asia",
+    "YEM": "Asia",
+    # Africa
+    "RSA": "Africa",
+    "EGY": "Africa",
+    "NGR": "Africa",
+    "KEN": "Africa",
+    "ETH": "Africa",
+    "MAR": "Africa",
+    "ALG": "Africa",
+    "TUN": "Africa",
+    "GHA": "Africa",
+    "CIV": "Africa",
+    "CMR": "Africa",
+    "SEN": "Africa",
+    "UGA": "Africa",
+    "ZIM": "Africa",
+    "TAN": "Africa",
+    "NAM": "Africa",
+    "BOT": "Africa",
+    "ZAM": "Africa",
+    "MOZ": "Africa",
+    "ANG": "Africa",
+    "RWA": "Africa",
+    "BUR": "Africa",
+    "MLI": "Africa",
+    "NIG": "Africa",
+    "BEN": "Africa",
+    "TOG": "Africa",
+    "GAB": "Africa",
+    "CGO": "Africa",
+    "COD": "Africa",
+    "MAD": "Africa",
+    "MRI": "Africa",
+    "SEY": "Africa",
+    "CPV": "Africa",
+    "GAM": "Africa",
+    "GBS": "Africa",
+    "GUI": "Africa",
+    "LBR": "Africa",
+    "SLE": "Africa",
+    "SOM": "Africa",
+    "SSD": "Africa",
+    "SUD": "Africa",
+    "ERI": "Africa",
+    "DJI": "Africa",
+    "COM": "Africa",
+    "LBA": "Africa",
+    "MAW": "Africa",
+    "LES": "Africa",
+    "SWZ": "Africa",
+    "CAF": "Africa",
+    "CHA": "Africa",
+    "GEQ": "Africa",
+    "STP": "Africa",
+    "BDI": "Africa",
+    "MTN": "Africa",
+    # North America
+    "USA": "North America",
+    "CAN": "North America",
+    "MEX": "North America",
+    "CUB": "North America",
+    "JAM": "North America",
+    "PUR": "North America",
+    "DOM": "North America",
+    "HAI": "North America",
+    "TTO": "North America",
+    "BAH": "North America",
+    "BAR": "North America",
+    "GRN": "North America",
+    "SKN": "North America",
+    "LCA": "North America",
+    "VIN": "North America",
+    "ANT": "North America",
+    "DMA": "North America",
+    "BIZ": "North America",
+    "GUA": "North America",
+    "HON": "North America",
+    "ESA": "North America",
+    "NCA": "North America",
+    "CRC": "North America",
+    "PAN": "North America",
+    "BER": "North America",
+    "CAY": "North America",
+    "IVB": "North America",
+    "ISV": "North America",
+    "AHO": "North America",
+    "ARU": "North America",
+    # South America
+    "BRA": "South America",
+    "ARG": "South America",
+    "COL": "South America",
+    "CHI": "South America",
+    "PER": "South America",
+    "VEN": "South America",
+    "ECU": "South America",
+    "URU": "South America",
+    "PAR": "South America",
+    "BOL": "South America",
+    "GUY": "South America",
+    "SUR": "South America",
+    # Oceania
+    "AUS": "Oceania",
+    "NZL": "Oceania",
+    "FIJ": "Oceania",
+    "PNG": "Oceania",
+    "SAM": "Oceania",
+    "TGA": "Oceania",
+    "VAN": "Oceania",
+    "SOL": "Oceania",
+    "FSM": "Oceania",
+    "PLW": "Oceania",
+    "MHL": "Oceania",
+    "KIR": "Oceania",
+    "NRU": "Oceania",
+    "TUV": "Oceania",
+    "COK": "Oceania",
+    "ASA": "Oceania",
+    "GUM": "Oceania",
+}
+
+# NOC code -> emoji flag
+NOC_FLAGS = {
+    # Europe
+    "GBR": "🇬🇧",
+    "FRA": "🇫🇷",
+    "GER": "🇩🇪",
+    "ITA": "🇮🇹",
+    "ESP": "🇪🇸",
+    "RUS": "🇷🇺",
+    "NED": "🇳🇱",
+    "SWE": "🇸🇪",
+    "NOR": "🇳🇴",
+    "DEN": "🇩🇰",
+    "FIN": "🇫🇮",
+    "BEL": "🇧🇪",
+    "SUI": "🇨🇭",
+    "AUT": "🇦🇹",
+    "POL": "🇵🇱",
+    "HUN": "🇭🇺",
+    "CZE": "🇨🇿",
+    "SVK": "🇸🇰",
+    "ROU": "🇷🇴",
+    "BUL": "🇧🇬",
+    "GRE": "🇬🇷",
+    "POR": "🇵🇹",
+    "IRL": "🇮🇪",
+    "CRO": "🇭🇷",
+    "SRB": "🇷🇸",
+    "SLO": "🇸🇮",
+    "BIH": "🇧🇦",
+    "MKD": "🇲🇰",
+    "ALB": "🇦🇱",
+    "MNE": "🇲🇪",
+    "CYP": "🇨🇾",
+    "MLT": "🇲🇹",
+    "LUX": "🇱🇺",
+    "MON": "🇲🇨",
+    "AND": "🇦🇩",
+    "LIE": "🇱🇮",
+    "SMR": "🇸🇲",
+    "ISL": "🇮🇸",
+    "LTU": "🇱🇹",
+    "LAT": "🇱🇻",
+    "EST": "🇪🇪",
+    "BLR": "🇧🇾",
+    "UKR": "🇺🇦",
+    "MDA": "🇲🇩",
+    "KOS": "🇽🇰",
+    "TUR": "🇹🇷",
+    "GEO": "🇬🇪",
+    "ARM": "🇦🇲",
+    "AZE": "🇦🇿",
+    # Asia
+    "CHN": "🇨🇳",
+    "JPN": "🇯🇵",
+    "KOR": "🇰🇷",
+    "IND": "🇮🇳",
+    "IRI": "🇮🇷",
+    "THA": "🇹🇭",
+    "KAZ": "🇰🇿",
+    "UZB": "🇺🇿",
+    "TPE": "🇹🇼",
+    "PHI": "🇵🇭",
+    "MAS": "🇲🇾",
+    "SGP": "🇸🇬",
+    "VIE": "🇻🇳",
+    "INA": "🇮🇩",
+    "PAK": "🇵🇰",
+    "BAN": "🇧🇩",
+    "SRI": "🇱🇰",
+    "NEP": "🇳🇵",
+    "MGL": "🇲🇳",
+    "PRK": "🇰🇵",
+    "HKG": "🇭🇰",
+    "BRN": "🇧🇭",
+    "QAT": "🇶🇦",
+    "KSA": "🇸🇦",
+    "UAE": "🇦🇪",
+    "KUW": "🇰🇼",
+    "OMA": "🇴🇲",
+    "JOR": "🇯🇴",
+    "SYR": "🇸🇾",
+    "LBN": "🇱🇧",
+    "ISR": "🇮🇱",
+    "AFG": "🇦🇫",
+    "KGZ": "🇰🇬",
+    "TJK": "🇹🇯",
+    "TKM": "🇹🇲",
+    "YEM": "🇾🇪",
+    "LAO": "🇱🇦",
+    "CAM": "🇰🇭",
+    "MYA": "🇲🇲",
+    "BHU": "🇧🇹",
+    "MDV": "🇲🇻",
+    "BRU": "🇧🇳",
+    "TLS": "🇹🇱",
+    "IRQ": "🇮🇶",
+    "PLE": "🇵🇸",
+    # Africa
+    "RSA": "🇿🇦",
+    "EGY": "🇪🇬",
+    "NGR": "🇳🇬",
+    "KEN": "🇰🇪",
+    "ETH": "🇪🇹",
+    "MAR": "🇲🇦",
+    "ALG": "🇩🇿",
+    "TUN": "🇹🇳",
+    "GHA": "🇬🇭",
+    "CIV": "🇨🇮",
+    "SEN": "🇸🇳",
+    "CMR": "🇨🇲",
+    "UGA": "🇺🇬",
+    "ZIM": "🇿🇼",
+    "ZAM": "🇿🇲",
+    "ANG": "🇦🇴",
+    "MOZ": "🇲🇿",
+    "TAN": "🇹🇿",
+    "RWA": "🇷🇼",
+    "BDI": "🇧🇮",
+    "BEN": "🇧🇯",
+    "BUR": "🇧🇫",
+    "BOT": "🇧🇼",
+    "CAF": "🇨🇫",
+    "CHA": "🇹🇩",
+    "COM": "🇰🇲",
+    "CGO": "🇨🇬",
+    "COD": "🇨🇩",
+    "DJI": "🇩🇯",
+    "ERI": "🇪🇷",
+    "SWZ": "🇸🇿",
+    "GAB": "🇬🇦",
+    "GAM": "🇬🇲",
+    "GBS": "🇬🇼",
+    "GUI": "🇬🇳",
+    "GEQ": "🇬🇶",
+    "LES": "🇱🇸",
+    "LBR": "🇱🇷",
+    "LBA": "🇱🇾",
+    "MAD": "🇲🇬",
+    "MAW": "🇲🇼",
+    "MLI": "🇲🇱",
+    "MTN": "🇲🇷",
+    "MRI": "🇲🇺",
+    "NAM": "🇳🇦",
+    "NIG": "🇳🇪",
+    "STP": "🇸🇹",
+    "SEY": "🇸🇨",
+    "SLE": "🇸🇱",
+    "SOM": "🇸🇴",
+    "SSD": "🇸🇸",
+    "SUD": "🇸🇩",
+    "TOG": "🇹🇬",
+    "CPV": "🇨🇻",
+    # North America
+    "USA": "🇺🇸",
+    "CAN": "🇨🇦",
+    "MEX": "🇲🇽",
+    "CUB": "🇨🇺",
+    "JAM": "🇯🇲",
+    "PUR": "🇵🇷",
+    "DOM": "🇩🇴",
+    "HAI": "🇭🇹",
+    "TTO": "🇹🇹",
+    "BAH": "🇧🇸",
+    "BAR": "🇧🇧",
+    "GRN": "🇬🇩",
+    "SKN": "🇰🇳",
+    "LCA": "🇱🇨",
+    "VIN": "🇻🇨",
+    "ANT": "🇦🇬",
+    "DMA": "🇩🇲",
+    "BIZ": "🇧🇿",
+    "GUA": "🇬🇹",
+    "HON": "🇭🇳",
+    "ESA": "🇸🇻",
+    "NCA": "🇳🇮",
+    "CRC": "🇨🇷",
+    "PAN": "🇵🇦",
+    "BER": "🇧🇲",
+    "CAY": "🇰🇾",
+    "IVB": "🇻🇬",
+    "ISV": "🇻🇮",
+    "AHO": "🇳🇱",
+    "ARU": "🇦🇼",  # AHO was Netherlands Antilles
+    # South America
+    "BRA": "🇧🇷",
+    "ARG": "🇦🇷",
+    "COL": "🇨🇴",
+    "CHI": "🇨🇱",
+    "PER": "🇵🇪",
+    "VEN": "🇻🇪",
+    "ECU": "🇪🇨",
+    "URU": "🇺🇾",
+    "PAR": "🇵🇾",
+    "BOL": "🇧🇴",
+    "GUY": "🇬🇾",
+    "SUR": "🇸🇷",
+    # Oceania
+    "AUS": "🇦🇺",
+    "NZL": "🇳🇿",
+    "FIJ": "🇫🇯",
+    "PNG": "🇵🇬",
+    "SAM": "🇼🇸",
+    "TGA": "🇹🇴",
+    "VAN": "🇻🇺",
+    "SOL": "🇸🇧",
+    "FSM": "🇫🇲",
+    "PLW": "🇵🇼",
+    "MHL": "🇲🇭",
+    "KIR": "🇰🇮",
+    "NRU": "🇳🇷",
+    "TUV": "🇹🇻",
+    "COK": "🇨🇰",
+    "ASA": "🇦🇸",
+    "GUM": "🇬🇺",
+}
+
+
+# NOC code -> ISO 3166 alpha-3, for NOCs whose code is not their ISO code
+NOC_ISO3 = {
+    "ALG": "DZA",
+    "ANG": "AGO",
+    "ANT": "ATG",
+    "ARU": "ABW",
+    "ASA": "ASM",
+    "BAH": "BHS",
+    "BAN": "BGD",
+    "BAR": "BRB",
+    "BER": "BMU",
+    "BHU": "BTN",
+    "BIZ": "BLZ",
+    "BOT": "BWA",
+    "BRN": "BHR",
+    "BRU": "BRN",
+    "BUL": "BGR",
+    "BUR": "BFA",
+    "CAM": "KHM",
+    "CAY": "CYM",
+    "CGO": "COG",
+    "CHA": "TCD",
+    "CHI": "CHL",
+    "CRC": "CRI",
+    "CRO": "HRV",
+    "DEN": "DNK",
+    "ESA": "SLV",
+    "FIJ": "FJI",
+    "GAM": "GMB",
+    "GBS": "GNB",
+    "GEQ": "GNQ",
+    "GER": "DEU",
+    "GRE": "GRC",
+    "GRN": "GRD",
+    "GUA": "GTM",
+    "GUI": "GIN",
+    "HAI": "HTI",
+    "HON": "HND",
+    "INA": "IDN",
+    "IRI": "IRN",
+    "ISV": "VIR",
+    "IVB": "VGB",
+    "KOS": "XKX",
+    "KSA": "SAU",
+    "KUW": "KWT",
+    "LAT": "LVA",
+    "LBA": "LBY",
+    "LES": "LSO",
+    "MAD": "MDG",
+    "MAS": "MYS",
+    "MAW": "MWI",
+    "MGL": "MNG",
+    "MON": "MCO",
+    "MRI": "MUS",
+    "MTN": "MRT",
+    "MYA": "MMR",
+    "NCA": "NIC",
+    "NED": "NLD",
+    "NEP": "NPL",
+    "NGR": "NGA",
+    "NIG": "NER",
+    "OMA": "OMN",
+    "PAR": "PRY",
+    "PHI": "PHL",
+    "PLE": "PSE",
+    "POR": "PRT",
+    "PUR": "PRI",
+    "RSA": "ZAF",
+    "SAM": "WSM",
+    "SEY": "SYC",
+    "SKN": "KNA",
+    "SLO": "SVN",
+    "SOL": "SLB",
+    "SRI": "LKA",
+    "SUD": "SDN",
+    "SUI": "CHE",
+    "TAN": "TZA",
+    "TGA": "TON",
+    "TOG": "TGO",
+    "TPE": "TWN",
+    "UAE": "ARE",
+    "URU": "URY",
+    "VAN": "VUT",
+    "VIE": "VNM",
+    "VIN": "VCT",
+    "ZAM": "ZMB",
+    "ZIM": "ZWE",
+}
+
+# NOCs with no territory of their own (neutral, refugee and historic teams)
+NO_TERRITORY = {
+    "AIN",
+    "EOR",
+    "IOA",
+    "IOP",
+    "ROT",
+    "OAR",
+    "ROC",
+    "CIS",
+    "EUN",
+    "COR",
+    "BOC",
+    "FRG",
+    "GDR",
+    "SCG",
+    "TCH",
+    "URS",
+    "YUG",
+    "AHO",
+}
+
+
+def get_continent_from_noc(noc: str) -> str:
+    """Continent of a NOC code ("Other" for teams without one)."""
+    return CONTINENT_MAP.get(noc, OTHER_CONTINENT)
+
+
+def get_flag(noc: str) -> str:
+    """Emoji flag of a NOC code, or an empty string."""
+    return NOC_FLAGS.get(noc, "")
+
+
+def get_iso3(noc: str, names=()) -> str:
+    """
+    ISO 3166 alpha-3 code of a NOC, or an empty string.
+
+    With ``pycountry`` the code is checked against the ISO registry and,
+    failing that, resolved from the NOC's ``names`` (e.g. country and long
+    country name from nocs.csv).
+    """
+    if noc in NO_TERRITORY:
+        return ""
+    iso3 = NOC_ISO3.get(noc, noc)
+    if not HAS_PYCOUNTRY or iso3 == "XKX":  # Kosovo has a user-assigned code, not in the ISO registry
+        return iso3
+    if pycountry.countries.get(alpha_3=iso3) is not None:
+        return iso3
+    for name in names:
+        try:
+            return pycountry.countries.lookup(name).alpha_3
+        except LookupError:
+            continue
+    return ""
+
+
+def build_noc_dimension(nocs: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per NOC code: noc, country, country_long, continent, flag, iso3.
+
+    Continent is a categorical over ``CONTINENTS`` plus "Other".
+    """
+    if nocs.empty or "code" not in nocs.columns:
+        return pd.DataFrame(columns=["noc", "country", "country_long", "continent", "flag", "iso3"])
+    codes = nocs["code"].astype(str)
+    country = nocs["country"].astype(str) if "country" in nocs.columns else codes
+    country_long = nocs["country_long"].astype(str) if "country_long" in nocs.columns else country
+    dimension = pd.DataFrame(
+        {
+            "noc": codes.to_numpy(),
+            "country": country.to_numpy(),
+            "country_long": country_long.to_numpy(),
+            "continent": pd.Categorical(
+                [get_continent_from_noc(code) for code in codes], categories=CONTINENTS + [OTHER_CONTINENT]
+            ),
+            "flag": [get_flag(code) for code in codes],
+            "iso3": [get_iso3(code, (long, short)) for code, long, short in zip(codes, country_long, country)],
+        }
+    )
+    return dimension.drop_duplicates("noc", ignore_index=True)
+
+
+def continent_codes(nocs: pd.Series) -> pd.Categorical:
+    """
+    ``continent`` column for a NOC column, resolved once per distinct NOC.
+
+    Categorical NOC columns are resolved through their categories and integer
+    codes, so the cost does not depend on the number of rows.
+    """
+    nocs = nocs if isinstance(nocs.dtype, pd.CategoricalDtype) else nocs.astype("category")
+    per_category = pd.Categorical(
+        [get_continent_from_noc(noc) for noc in nocs.cat.categories] + [OTHER_CONTINENT],
+        categories=CONTINENTS + [OTHER_CONTINENT],
+    )
+    # Missing NOCs (code -1) pick the trailing "Other"
+    return per_category.take(nocs.cat.codes.to_numpy())
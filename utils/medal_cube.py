@@ -0,0 +1,196 @@
+"""
+Pre-materialised medal tally cube.
+
+Medal counts are aggregated once per process into a dense NumPy array indexed
+by (noc, discipline, medal type, medal day). Every tally the pages show -
+filtered standings, per-day standings, per-sport summaries, continent rollups -
+is a boolean slice of that array followed by a sum, instead of a groupby over
+the raw medal rows on each rerun.
+
+Daily standings are additionally kept as a (day, noc, medal) array together
+with its prefix sum over days, so "medals won on day D" and "standings after
+day D" are both a single row lookup.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import load_medals
+from utils.mappers import get_continent_from_noc
+
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]
+
+# Axis positions in MedalCube.counts
+NOC_AXIS, DISCIPLINE_AXIS, MEDAL_AXIS, DAY_AXIS = range(4)
+
+
+class MedalCube:
+    """Dense medal counts over noc x discipline x medal type x day."""
+
+    def __init__(self, medals: pd.DataFrame):
+        rows = medals.dropna(subset=["noc", "discipline", "medal", "medal_date"]) if not medals.empty else medals
+        rows = rows[rows["medal"].isin(MEDAL_TYPES)] if not rows.empty else rows
+
+        if rows.empty:
+            self.nocs = np.array([], dtype=object)
+            self.disciplines = np.array([], dtype=object)
+            self.days = pd.DatetimeIndex([])
+            self.counts = np.zeros((0, 0, len(MEDAL_TYPES), 0), dtype=np.int32)
+        else:
+            noc_codes, self.nocs = pd.factorize(rows["noc"].astype(str), sort=True)
+            discipline_codes, self.disciplines = pd.factorize(rows["discipline"].astype(str), sort=True)
+            day_codes, self.days = pd.factorize(rows["medal_date"].dt.normalize(), sort=True)
+            medal_codes = pd.Index(MEDAL_TYPES).get_indexer(rows["medal"].astype(str))
+            self.nocs = np.asarray(self.nocs, dtype=object)
+            self.disciplines = np.asarray(self.disciplines, dtype=object)
+            self.days = pd.DatetimeIndex(self.days)
+
+            self.counts = np.zeros(
+                (len(self.nocs), len(self.disciplines), len(MEDAL_TYPES), len(self.days)), dtype=np.int32
+            )
+            np.add.at(self.counts, (noc_codes, discipline_codes, medal_codes, day_codes), 1)
+
+        self.continents = np.array([get_continent_from_noc(noc) for noc in self.nocs], dtype=object)
+        self.counts.setflags(write=False)
+
+        # (day, noc, medal) counts and their running totals over the Games
+        self.daily_counts = self.counts.sum(axis=DISCIPLINE_AXIS).transpose(2, 0, 1).copy()
+        self.cumulative_counts = np.cumsum(self.daily_counts, axis=0)
+        self.daily_counts.setflags(write=False)
+        self.cumulative_counts.setflags(write=False)
+        self.day_positions = {day.date(): position for position, day in enumerate(self.days)}
+
+    # ------------------------------------------------------------------
+    # Slicing
+    # ------------------------------------------------------------------
+    def _axis_masks(self, filters: dict = None, day=None) -> tuple:
+        """Translate a global filter dict (and optional day) into one boolean mask per axis."""
+        filters = filters or {}
+        noc_mask = np.ones(len(self.nocs), dtype=bool)
+        if filters.get("countries"):
+            noc_mask &= np.isin(self.nocs, list(filters["countries"]))
+        if filters.get("continents"):
+            noc_mask &= np.isin(self.continents, list(filters["continents"]))
+
+        discipline_mask = np.ones(len(self.disciplines), dtype=bool)
+        if filters.get("sports"):
+            discipline_mask &= np.isin(self.disciplines, list(filters["sports"]))
+
+        medal_mask = np.ones(len(MEDAL_TYPES), dtype=bool)
+        if filters.get("medal_types"):
+            medal_mask &= np.isin(MEDAL_TYPES, list(filters["medal_types"]))
+
+        day_mask = np.ones(len(self.days), dtype=bool)
+        if day is not None:
+            day_mask &= self.days == pd.Timestamp(day).normalize()
+        return noc_mask, discipline_mask, medal_mask, day_mask
+
+    def select(self, filters: dict = None, day=None) -> np.ndarray:
+        """Return the sub-cube matching the filters; de-selected cells are zeroed, shape is kept."""
+        masks = self._axis_masks(filters, day)
+        if all(mask.all() for mask in masks):
+            return self.counts
+        keep = np.ix_(*masks)
+        sub = np.zeros_like(self.counts)
+        sub[keep] = self.counts[keep]
+        return sub
+
+    # ------------------------------------------------------------------
+    # Tallies
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _tally_frame(labels, counts: np.ndarray, label_col: str) -> pd.DataFrame:
+        """Build a Gold/Silver/Bronze/Total frame from an (n, 3) count matrix, dropping empty rows."""
+        df = pd.DataFrame(counts, columns=MEDAL_TYPES)
+        df.insert(0, label_col, labels)
+        df["Total"] = counts.sum(axis=1)
+        return df[df["Total"] > 0].reset_index(drop=True)
+
+    def tally(self, filters: dict = None, day=None) -> pd.DataFrame:
+        """Medal table per NOC (noc, Gold, Silver, Bronze, Total), ranked gold-first."""
+        counts = self.select(filters, day).sum(axis=(DISCIPLINE_AXIS, DAY_AXIS))
+        df = self._tally_frame(self.nocs, counts, "noc")
+        return df.sort_values(["Gold", "Silver", "Bronze"], ascending=False, ignore_index=True)
+
+    def day_position(self, day) -> int:
+        """Position of a date on the day axis, or None if no medals were awarded that day."""
+        return self.day_positions.get(pd.Timestamp(day).date())
+
+    def _standings_frame(self, counts: np.ndarray) -> pd.DataFrame:
+        """Rank an (noc, 3) count matrix: gold first, then total."""
+        df = self._tally_frame(self.nocs, counts, "noc")
+        return df.sort_values(["Gold", "Total"], ascending=False, kind="stable", ignore_index=True)
+
+    def daily_standings(self, day) -> pd.DataFrame:
+        """Medals won on one day per NOC (read from the precomputed daily array)."""
+        position = self.day_position(day)
+        if position is None:
+            return self._standings_frame(np.zeros((len(self.nocs), len(MEDAL_TYPES)), dtype=np.int32))
+        return self._standings_frame(self.daily_counts[position])
+
+    def standings_as_of(self, day) -> pd.DataFrame:
+        """Cumulative medal table after the given day (read from the prefix sums)."""
+        position = int(np.searchsorted(self.days, pd.Timestamp(day).normalize(), side="right")) - 1
+        if position < 0:
+            return self._standings_frame(np.zeros((len(self.nocs), len(MEDAL_TYPES)), dtype=np.int32))
+        return self._standings_frame(self.cumulative_counts[position])
+
+    def sport_summary(self, filters: dict = None, day=None) -> pd.DataFrame:
+        """Medal table per discipline (discipline, Gold, Silver, Bronze, Total)."""
+        counts = self.select(filters, day).sum(axis=(NOC_AXIS, DAY_AXIS))
+        return self._tally_frame(self.disciplines, counts, "discipline")
+
+    def continent_tally(self, filters: dict = None, day=None) -> pd.DataFrame:
+        """Medal table per continent (Continent, Gold, Silver, Bronze, Total)."""
+        per_noc = self.select(filters, day).sum(axis=(DISCIPLINE_AXIS, DAY_AXIS))
+        labels, codes = np.unique(self.continents, return_inverse=True)
+        counts = np.zeros((len(labels), len(MEDAL_TYPES)), dtype=per_noc.dtype)
+        np.add.at(counts, codes, per_noc)
+        return self._tally_frame(labels, counts, "Continent")
+
+    def noc_discipline_counts(self, filters: dict = None) -> pd.DataFrame:
+        """Long frame of non-zero medal counts per (noc, discipline)."""
+        counts = self.select(filters).sum(axis=(MEDAL_AXIS, DAY_AXIS))
+        noc_idx, discipline_idx = np.nonzero(counts)
+        return pd.DataFrame(
+            {
+                "noc": self.nocs[noc_idx],
+                "discipline": self.disciplines[discipline_idx],
+                "Medals": counts[noc_idx, discipline_idx],
+            }
+        )
+
+    def sport_medal_counts(self, filters: dict = None) -> pd.DataFrame:
+        """Long frame of non-zero medal counts per (discipline, medal)."""
+        counts = self.select(filters).sum(axis=(NOC_AXIS, DAY_AXIS))
+        discipline_idx, medal_idx = np.nonzero(counts)
+        return pd.DataFrame(
+            {
+                "discipline": self.disciplines[discipline_idx],
+                "medal": np.asarray(MEDAL_TYPES, dtype=object)[medal_idx],
+                "Count": counts[discipline_idx, medal_idx],
+            }
+        )
+
+
+def medal_counts(df: pd.DataFrame, by) -> pd.DataFrame:
+    """
+    Gold/Silver/Bronze/Total per group for frames outside the cube (e.g. per athlete).
+
+    A single vectorised size() + unstack replaces one Python lambda per medal type.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    if df.empty:
+        return pd.DataFrame(columns=by + MEDAL_TYPES + ["Total"])
+    counts = df.groupby(by + ["medal"], observed=True).size().unstack("medal", fill_value=0)
+    counts = counts.reindex(columns=MEDAL_TYPES, fill_value=0)
+    counts.columns = list(counts.columns)
+    counts["Total"] = counts.sum(axis=1)
+    return counts.reset_index()
+
+
+@st.cache_resource
+def load_medal_cube() -> MedalCube:
+    """Build the medal cube once per server process."""
+    return MedalCube(load_medals())
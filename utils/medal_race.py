@@ -0,0 +1,111 @@
+"""
+Animated medal race built from the medal cube's cumulative standings.
+
+Every day's standings after that day are already a row of
+``MedalCube.cumulative_counts``; this module ranks them once per process and
+turns them into Plotly figures whose animation frames hold the whole Games.
+The browser plays and scrubs the race on its own, so moving through the days
+costs no server reruns.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from utils.medal_cube import MEDAL_TYPES, MedalCube, load_medal_cube
+
+# NOCs shown per frame in the bar race and lines drawn in the bump chart
+RACE_TOP_N = 10
+
+
+def cumulative_rankings(cube: MedalCube) -> pd.DataFrame:
+    """
+    Long frame of standings after each medal day: day, noc, Gold, Silver, Bronze, Total, rank.
+
+    Ranks follow the official table (gold, then silver, then bronze); only NOCs
+    with at least one medal by that day are included.
+    """
+    if not len(cube.days) or not len(cube.nocs):
+        return pd.DataFrame(columns=["day", "noc"] + MEDAL_TYPES + ["Total", "rank"])
+
+    counts = cube.cumulative_counts.astype(np.int64)  # (day, noc, medal)
+    n_days, n_nocs = counts.shape[:2]
+    # One sortable score per (day, noc); a medal type never exceeds 1000 per NOC
+    score = counts[:, :, 0] * 1_000_000 + counts[:, :, 1] * 1_000 + counts[:, :, 2]
+    order = np.argsort(-score, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, n_nocs + 1)[None, :].repeat(n_days, axis=0), axis=1)
+
+    df = pd.DataFrame(
+        {
+            "day": np.repeat(cube.days.strftime("%b %d").to_numpy(), n_nocs),
+            "noc": np.tile(cube.nocs, n_days),
+            "Gold": counts[:, :, 0].ravel(),
+            "Silver": counts[:, :, 1].ravel(),
+            "Bronze": counts[:, :, 2].ravel(),
+            "Total": counts.sum(axis=2).ravel(),
+            "rank": ranks.ravel(),
+        }
+    )
+    return df[df["Total"] > 0].reset_index(drop=True)
+
+
+def medal_race_bar(rankings: pd.DataFrame, top_n: int = RACE_TOP_N):
+    """Bar-chart race: the top ``top_n`` NOCs per day, one animation frame per day."""
+    top = rankings[rankings["rank"] <= top_n]
+    fig = px.bar(
+        top,
+        x="Gold",
+        y="rank",
+        orientation="h",
+        text="noc",
+        color="noc",
+        animation_frame="day",
+        animation_group="noc",
+        hover_data={"Silver": True, "Bronze": True, "Total": True, "rank": False},
+        range_x=[0, max(int(top["Gold"].max()) if not top.empty else 0, 1) * 1.1],
+        range_y=[top_n + 0.5, 0.5],
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        height=500,
+        showlegend=False,
+        xaxis_title="Gold Medals (cumulative)",
+        yaxis_title="Rank",
+        yaxis=dict(dtick=1),
+    )
+    return fig
+
+
+def medal_race_bump(rankings: pd.DataFrame, top_n: int = RACE_TOP_N):
+    """Rank bump chart for the NOCs that finish in the top ``top_n``."""
+    if rankings.empty:
+        finalists = []
+    else:
+        final_day = rankings["day"].iloc[-1]
+        final = rankings[rankings["day"] == final_day]
+        finalists = final.loc[final["rank"] <= top_n, "noc"].tolist()
+    fig = px.line(
+        rankings[rankings["noc"].isin(finalists)],
+        x="day",
+        y="rank",
+        color="noc",
+        markers=True,
+        hover_data=["Gold", "Silver", "Bronze", "Total"],
+    )
+    fig.update_layout(
+        height=500,
+        xaxis_title="Day",
+        yaxis_title="Rank",
+        yaxis=dict(autorange="reversed", dtick=1),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3),
+    )
+    return fig
+
+
+@st.cache_resource
+def load_medal_race_figures() -> dict:
+    """Build both race figures once per server process; sessions only receive the serialised frames."""
+    rankings = cumulative_rankings(load_medal_cube())
+    return {"bar": medal_race_bar(rankings), "bump": medal_race_bump(rankings)}
@@ -0,0 +1,90 @@
+"""
+Read-only DataFrames for the shared data catalog.
+
+Catalog frames are single objects shared by every session, so an in-place
+write on one page would leak into everybody else's view. ``freeze`` wraps a
+frame in ``ReadOnlyFrame``, which rejects column assignment, ``.loc``/``.iloc``
+writes and ``inplace=True`` operations, while every derived frame (slices,
+``assign``, ``groupby`` results...) is an ordinary, writable DataFrame.
+
+Together with pandas Copy-on-Write this means pages can slice and derive
+freely without defensive ``.copy()`` calls: derived frames share memory with
+the catalog until one of them is written to.
+"""
+
+import pandas as pd
+
+
+class ReadOnlyFrameError(TypeError):
+    """Raised when code tries to modify a shared catalog frame in place."""
+
+
+def enable_copy_on_write() -> None:
+    """Turn on pandas Copy-on-Write (always on, and no longer configurable, from pandas 3)."""
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+def _reject(*args, **kwargs):
+    raise ReadOnlyFrameError(
+        "Catalog frames are shared across sessions and read-only; "
+        "derive a new frame (e.g. df.assign(...)) instead of modifying it in place."
+    )
+
+
+class _ReadOnlyIndexer:
+    """Wraps a .loc/.iloc/.at/.iat indexer, allowing reads only."""
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __call__(self, axis=None):
+        return _ReadOnlyIndexer(self._indexer(axis))
+
+    __setitem__ = _reject
+
+
+class ReadOnlyFrame(pd.DataFrame):
+    """DataFrame that refuses in-place modification; anything derived from it is a plain DataFrame."""
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    @property
+    def loc(self):
+        return _ReadOnlyIndexer(super().loc)
+
+    @property
+    def iloc(self):
+        return _ReadOnlyIndexer(super().iloc)
+
+    @property
+    def at(self):
+        return _ReadOnlyIndexer(super().at)
+
+    @property
+    def iat(self):
+        return _ReadOnlyIndexer(super().iat)
+
+    def __setattr__(self, name, value):
+        if name in ("columns", "index"):
+            _reject()
+        super().__setattr__(name, value)
+
+    __setitem__ = _reject
+    __delitem__ = _reject
+    insert = _reject
+    pop = _reject
+    update = _reject
+    _update_inplace = _reject
+
+
+def freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a read-only view of ``df`` (no data is copied under Copy-on-Write)."""
+    if isinstance(df, ReadOnlyFrame):
+        return df
+    return ReadOnlyFrame(df)
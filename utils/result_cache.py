@@ -0,0 +1,214 @@
+"""
+Filter-keyed result cache shared by every session.
+
+Most traffic lands on a handful of filter states (the default "all medals"
+view, a popular country or sport), yet every session used to rebuild the same
+tallies and Plotly figures for them. ``cached_result`` stores those results
+once per process under a key made of
+
+- the result name (e.g. ``"overview.donut"``),
+- a canonical hash of the ``render_global_filters`` dict (key and list order
+  do not matter),
+- any extra page inputs that shape the result (a radio choice, a slider), and
+- ``dataset_token()``, the content hash of the loaded sources, so results
+  never outlive the data they were computed from.
+
+Entries are evicted least-recently-used once their estimated size exceeds the
+byte budget, and expire after a TTL. Both are set with the
+``LA28_RESULT_CACHE_MB`` and ``LA28_RESULT_CACHE_TTL`` (seconds) environment
+variables.
+
+``versioned_cache`` puts functions of scalar arguments (an athlete row, a
+sport, a day) in the same store, keyed on ``dataset_token()`` and the
+arguments. The frames they need are resolved from the catalog inside the
+function rather than passed in, so a lookup hashes a few scalars instead of
+whole DataFrames.
+
+Cached values are shared between sessions: DataFrames are stored read-only
+(see ``utils.readonly``) and figures must not be modified after they are
+returned.
+"""
+
+import datetime
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import dataset_token
+from utils.readonly import freeze
+
+RESULT_CACHE_MB = float(os.environ.get("LA28_RESULT_CACHE_MB", 256))
+RESULT_CACHE_TTL = float(os.environ.get("LA28_RESULT_CACHE_TTL", 3600))
+
+_MISSING = object()
+
+# Argument types versioned_cache keys on (tuples and frozensets of them too)
+SCALAR_TYPES = (str, bytes, int, float, bool, type(None), datetime.date, datetime.time, np.generic)
+
+
+def canonical_filters(filters: dict) -> str:
+    """Hash of a filter dict that ignores key order and the order of selected values."""
+    canonical = {
+        key: sorted(map(str, value)) if isinstance(value, (list, tuple, set)) else value
+        for key, value in (filters or {}).items()
+    }
+    return hashlib.sha1(json.dumps(canonical, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def estimate_nbytes(value) -> int:
+    """Approximate in-memory size of a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item) for item in value.values())
+    try:
+        # Figures and other objects: their serialised size
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def _shareable(value):
+    """Read-only version of a value about to be shared between sessions."""
+    if isinstance(value, pd.DataFrame):
+        return freeze(value)
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    return value
+
+
+class ResultCache:
+    """Thread-safe LRU cache with a byte budget and a time-to-live."""
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, nbytes, expires_at)
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _drop(self, key) -> None:
+        _, nbytes, _ = self._entries.pop(key)
+        self.nbytes -= nbytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value) -> None:
+        nbytes = estimate_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, nbytes, time.monotonic() + self.ttl)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute: Callable):
+        """Cached value for ``key``; on a miss, ``compute()`` is stored (read-only) and returned."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Concurrent misses on one key may both compute; the results are identical
+            value = _shareable(compute())
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_mb": round(self.nbytes / 2**20, 2),
+                "budget_mb": round(self.max_bytes / 2**20, 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+@st.cache_resource
+def load_result_cache() -> ResultCache:
+    """The process-wide result cache, shared by every session."""
+    return ResultCache(int(RESULT_CACHE_MB * 2**20), RESULT_CACHE_TTL)
+
+
+def cached_result(name: str, filters: dict, compute: Callable, *args):
+    """
+    Return ``compute()`` for this result name, filter state and extra inputs, computing it at most once.
+
+    ``args`` are the page inputs other than the global filters that change
+    the result; they must be JSON-serialisable (or have a stable ``str``).
+    """
+    extra = json.dumps(args, default=str)
+    key = (name, dataset_token(), canonical_filters(filters), extra)
+    return load_result_cache().get_or_compute(key, compute)
+
+
+def _is_scalar(value) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_scalar(item) for item in value)
+    return isinstance(value, SCALAR_TYPES)
+
+
+def versioned_cache(func: Callable) -> Callable:
+    """
+    Decorator caching ``func`` in the shared result cache, keyed on ``dataset_token()`` and its arguments.
+
+    Arguments must be scalars (see ``SCALAR_TYPES``) or tuples of them; a
+    DataFrame, Series or list raises ``TypeError``. Look frames up from the
+    catalog inside the function instead of passing them in.
+    """
+    # Page scripts all run as __main__, so the file tells same-named functions apart
+    name = f"{func.__code__.co_filename}:{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for value in (*args, *kwargs.values()):
+            if not _is_scalar(value):
+                raise TypeError(
+                    f"{func.__qualname__}() is cached on scalar arguments, got {type(value).__name__}; "
+                    "resolve frames from the catalog inside the function"
+                )
+        key = (name, dataset_token(), args, tuple(sorted(kwargs.items())))
+        return load_result_cache().get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,143 @@
+"""
+Level-of-detail Gantt chart for the competition schedule.
+
+Zoomed out, sessions are collapsed into one band per (discipline, day) that
+spans the day's first start to its last end, so the whole Games fits in a few
+hundred bars. A narrower time window or a single sport switches to individual
+sessions. Either way the chart is a single horizontal ``go.Bar`` trace (bar
+base = start, length = duration) with per-bar colours, instead of the one
+trace per colour and per-bar metadata that ``px.timeline`` emits.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from utils.schedule_index import ScheduleIndex, load_schedule_index
+
+# Windows with more sessions than this are drawn as per-discipline day bands
+DETAIL_MAX_SESSIONS = 500
+
+_PALETTE = px.colors.qualitative.Plotly + px.colors.qualitative.D3 + px.colors.qualitative.Set3
+
+
+def discipline_day_bands(index: ScheduleIndex) -> pd.DataFrame:
+    """One row per (discipline, day): discipline, day, start, end, sessions, medal_sessions."""
+    sessions = index.sessions
+    if sessions.empty:
+        # Typed, so the band figure and day-window filters work on an empty schedule too
+        times, counts = pd.Series(dtype="datetime64[ns]"), pd.Series(dtype="int64")
+        return pd.DataFrame(
+            {
+                "discipline": pd.Series(dtype=object),
+                "day": times,
+                "start": times,
+                "end": times,
+                "sessions": counts,
+                "medal_sessions": counts,
+            }
+        )
+
+    starts = sessions["start_date"].dt.tz_localize(None) if index.tz is not None else sessions["start_date"]
+    ends = sessions["end_date"].dt.tz_localize(None) if index.tz is not None else sessions["end_date"]
+    medal = sessions["event_medal"].fillna(0) > 0 if "event_medal" in sessions.columns else False
+    frame = pd.DataFrame(
+        {
+            "discipline": sessions["discipline"],
+            "day": starts.dt.normalize(),
+            "start": starts,
+            "end": ends,
+            "medal": medal,
+        }
+    )
+    bands = frame.groupby(["discipline", "day"], observed=True).agg(
+        start=("start", "min"), end=("end", "max"), sessions=("start", "size"), medal_sessions=("medal", "sum")
+    )
+    return bands.reset_index()
+
+
+def _colours(labels: pd.Series) -> list:
+    codes = pd.Categorical(labels.astype(str)).codes
+    return [_PALETTE[code % len(_PALETTE)] for code in codes]
+
+
+def _local(times: pd.Series) -> pd.Series:
+    return times.dt.tz_localize(None) if times.dt.tz is not None else times
+
+
+def gantt_bars(y, start: pd.Series, end: pd.Series, colour_by: pd.Series, customdata, hovertemplate: str, height: int):
+    """Single-trace Gantt: bars start at ``start`` and are ``end - start`` long (in ms)."""
+    start, end = _local(pd.Series(start)), _local(pd.Series(end))
+    duration_ms = ((end - start).dt.total_seconds() * 1000).to_numpy()
+    fig = go.Figure(
+        go.Bar(
+            y=np.asarray(y, dtype=object),
+            base=start.dt.strftime("%Y-%m-%d %H:%M").to_numpy(),
+            x=duration_ms,
+            orientation="h",
+            marker=dict(color=_colours(colour_by)),
+            customdata=customdata,
+            hovertemplate=hovertemplate,
+            showlegend=False,
+        )
+    )
+    fig.update_layout(height=height, xaxis=dict(type="date", title="Date"), yaxis_title="", barmode="overlay")
+    fig.update_yaxes(categoryorder="category descending")
+    return fig
+
+
+def band_figure(bands: pd.DataFrame):
+    """Zoomed-out view: one bar per discipline and day."""
+    customdata = (
+        np.column_stack(
+            [
+                bands["day"].dt.strftime("%b %d").to_numpy(),
+                bands["sessions"].to_numpy(),
+                bands["medal_sessions"].to_numpy(),
+                bands["start"].dt.strftime("%H:%M").to_numpy(),
+                bands["end"].dt.strftime("%H:%M").to_numpy(),
+            ]
+        )
+        if not bands.empty
+        else None
+    )
+    hovertemplate = (
+        "<b>%{y}</b> - %{customdata[0]}<br>%{customdata[1]} sessions (%{customdata[2]} medal)"
+        "<br>%{customdata[3]} - %{customdata[4]}<extra></extra>"
+    )
+    rows = bands["discipline"].nunique()
+    return gantt_bars(
+        bands["discipline"],
+        bands["start"],
+        bands["end"],
+        bands["discipline"],
+        customdata,
+        hovertemplate,
+        height=max(450, 16 * rows),
+    )
+
+
+def session_figure(sessions: pd.DataFrame, y_col: str):
+    """Zoomed-in view: one bar per session."""
+    columns = [column for column in ("event", "phase", "venue") if column in sessions.columns]
+    customdata = sessions[columns].astype(str).to_numpy() if columns else None
+    lines = "".join(f"<br>%{{customdata[{i}]}}" for i in range(len(columns)))
+    hovertemplate = f"<b>%{{y}}</b>{lines}<br>%{{base|%b %d %H:%M}}<extra></extra>"
+    rows = sessions[y_col].nunique()
+    return gantt_bars(
+        sessions[y_col],
+        sessions["start_date"],
+        sessions["end_date"],
+        sessions["discipline"],
+        customdata,
+        hovertemplate,
+        height=max(450, min(16 * rows, 1600)),
+    )
+
+
+@st.cache_resource
+def load_schedule_bands() -> pd.DataFrame:
+    """Per-discipline day bands, computed once per server process."""
+    return discipline_day_bands(load_schedule_index())
@@ -0,0 +1,187 @@
+"""
+Time index over the competition schedule.
+
+schedules.csv is sorted once per process by session start, so every session
+of a given day is a contiguous block of rows. The day -> (start, stop) row
+range of each block is found with a binary search over the start times, which
+turns "what happens on day D" into a slice instead of a ``.dt.date``
+comparison over the whole schedule.
+
+Start/end times are also kept as int64 arrays (local venue time), globally and
+per venue and per discipline. Interval queries - sessions overlapping a time
+window, a venue's sessions on a day, the next medal session - are a couple of
+binary searches bounded by the longest session, then a small vectorised check.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import load_schedules
+from utils.readonly import freeze
+
+_NS_PER_DAY = 86_400 * 10**9
+
+
+class _IntervalGroup:
+    """Sessions of one group (all, a venue, a discipline) as start-sorted int64 arrays."""
+
+    def __init__(self, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        self.rows = rows
+        self.starts = starts
+        self.ends = ends
+        # Longest session bounds how far before t0 an overlapping session can start
+        self.max_duration = int((ends - starts).max()) if len(rows) else 0
+
+    def overlapping(self, t0: int, t1: int) -> np.ndarray:
+        """Row positions of sessions with start < t1 and end > t0."""
+        lo = np.searchsorted(self.starts, t0 - self.max_duration, side="left")
+        hi = np.searchsorted(self.starts, t1, side="left")
+        window = slice(lo, hi)
+        return self.rows[window][self.ends[window] > t0]
+
+    def starting_between(self, t0: int, t1: int) -> np.ndarray:
+        """Row positions of sessions with t0 <= start < t1."""
+        lo, hi = np.searchsorted(self.starts, [t0, t1], side="left")
+        return self.rows[lo:hi]
+
+    def first_starting_from(self, t: int):
+        """Row position of the first session starting at or after ``t``, or None."""
+        position = np.searchsorted(self.starts, t, side="left")
+        return int(self.rows[position]) if position < len(self.rows) else None
+
+    def subset(self, keep: np.ndarray) -> "_IntervalGroup":
+        """Group restricted by a boolean mask over its sessions (order is preserved)."""
+        return _IntervalGroup(self.rows[keep], self.starts[keep], self.ends[keep])
+
+
+_EMPTY = _IntervalGroup(*(np.array([], dtype=np.int64),) * 3)
+
+
+class ScheduleIndex:
+    """Schedule sessions sorted by start time, with day, venue, discipline and time-window lookups."""
+
+    def __init__(self, schedules: pd.DataFrame):
+        if schedules.empty or not {"start_date", "end_date"} <= set(schedules.columns):
+            self.sessions = freeze(schedules.iloc[0:0])
+            self.tz = None
+            self.days = pd.DatetimeIndex([])
+            self.day_ranges = {}
+            self.all = _EMPTY
+            self.by_venue = {}
+            self.by_discipline = {}
+            self.medal_sessions = _EMPTY
+            self.medal_sessions_by_discipline = {}
+            return
+
+        sessions = schedules.dropna(subset=["start_date", "end_date"]).sort_values("start_date", kind="stable")
+        self.sessions = freeze(sessions.reset_index(drop=True))
+
+        # Local (venue) times as naive int64 nanoseconds: day boundaries fall at local midnight
+        self.tz = self.sessions["start_date"].dt.tz
+        starts = self._local_ns(self.sessions["start_date"])
+        ends = self._local_ns(self.sessions["end_date"])
+        rows = np.arange(len(self.sessions), dtype=np.int64)
+        self.all = _IntervalGroup(rows, starts, ends)
+
+        self.days = pd.DatetimeIndex(np.unique(starts - starts % _NS_PER_DAY))
+        day_ns = self.days.asi8
+        day_starts = np.searchsorted(starts, day_ns, side="left")
+        day_stops = np.searchsorted(starts, day_ns + _NS_PER_DAY, side="left")
+        self.day_ranges = {
+            day.date(): (int(start), int(stop)) for day, start, stop in zip(self.days, day_starts, day_stops)
+        }
+
+        # Per-group positions keep the global start order, so each group's arrays stay sorted
+        self.by_venue = self._groups("venue", rows, starts, ends)
+        self.by_discipline = self._groups("discipline", rows, starts, ends)
+        if "event_medal" in self.sessions.columns:
+            medal = self.sessions["event_medal"].fillna(0).to_numpy() > 0
+        else:
+            medal = np.zeros(len(rows), dtype=bool)
+        self.medal_sessions = self.all.subset(medal)
+        self.medal_sessions_by_discipline = {
+            discipline: group.subset(medal[group.rows]) for discipline, group in self.by_discipline.items()
+        }
+
+    def _groups(self, column: str, rows: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> dict:
+        if column not in self.sessions.columns:
+            return {}
+        values = self.sessions[column].astype(object)
+        return {
+            key: _IntervalGroup(rows[positions], starts[positions], ends[positions])
+            for key, positions in values.groupby(values).indices.items()
+        }
+
+    @staticmethod
+    def _local_ns(times: pd.Series) -> np.ndarray:
+        if times.dt.tz is not None:
+            times = times.dt.tz_localize(None)
+        return times.astype("datetime64[ns]").to_numpy().view(np.int64)
+
+    def _to_ns(self, when) -> int:
+        """Local int64 nanoseconds for a timestamp; naive timestamps are taken as local venue time."""
+        when = pd.Timestamp(when)
+        if when.tzinfo is not None and self.tz is not None:
+            when = when.tz_convert(self.tz).tz_localize(None)
+        elif when.tzinfo is not None:
+            when = when.tz_localize(None)
+        return when.as_unit("ns").value
+
+    def _group(self, venue: str = None, discipline: str = None) -> _IntervalGroup:
+        if venue is not None:
+            return self.by_venue.get(venue, _EMPTY)
+        if discipline is not None:
+            return self.by_discipline.get(discipline, _EMPTY)
+        return self.all
+
+    def _rows(self, positions: np.ndarray, discipline: str = None) -> pd.DataFrame:
+        result = self.sessions.iloc[positions]
+        if discipline is not None:
+            result = result[result["discipline"] == discipline]
+        return result
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def day_range(self, day) -> tuple:
+        """(start, stop) row positions of the sessions starting on ``day``; empty if none."""
+        return self.day_ranges.get(pd.Timestamp(day).date(), (0, 0))
+
+    def sessions_on(self, day) -> pd.DataFrame:
+        """Sessions starting on ``day``, in start order."""
+        start, stop = self.day_range(day)
+        return self.sessions.iloc[start:stop]
+
+    def for_discipline(self, discipline: str) -> pd.DataFrame:
+        """All sessions of one discipline, in start order."""
+        return self.sessions.iloc[self._group(discipline=discipline).rows]
+
+    def overlapping(self, t0, t1, venue: str = None, discipline: str = None) -> pd.DataFrame:
+        """Sessions running at any point in [t0, t1), optionally at one venue and/or of one discipline."""
+        positions = self._group(venue, discipline).overlapping(self._to_ns(t0), self._to_ns(t1))
+        return self._rows(positions, discipline if venue is not None else None)
+
+    def at_venue(self, venue: str, day) -> pd.DataFrame:
+        """Sessions starting at ``venue`` on ``day``, in start order."""
+        day_ns = self._to_ns(pd.Timestamp(day).normalize())
+        return self.sessions.iloc[self._group(venue=venue).starting_between(day_ns, day_ns + _NS_PER_DAY)]
+
+    def on_now(self, now, venue: str = None, discipline: str = None) -> pd.DataFrame:
+        """Sessions in progress at ``now``."""
+        return self.overlapping(now, pd.Timestamp(now) + pd.Timedelta(nanoseconds=1), venue, discipline)
+
+    def next_medal_session(self, after, discipline: str = None):
+        """First medal session starting at or after ``after`` (optionally of one discipline) as a row, or None."""
+        if discipline is None:
+            group = self.medal_sessions
+        else:
+            group = self.medal_sessions_by_discipline.get(discipline, _EMPTY)
+        position = group.first_starting_from(self._to_ns(after))
+        return None if position is None else self.sessions.iloc[position]
+
+
+@st.cache_resource
+def load_schedule_index() -> ScheduleIndex:
+    """Build the schedule index once per server process."""
+    return ScheduleIndex(load_schedules())
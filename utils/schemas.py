@@ -0,0 +1,256 @@
+"""
+Schema registry for the CSV sources in ``data/``.
+
+Each source declares the columns the dashboard loads and their dtypes, its
+clock-time and calendar-date columns (with their exact formats), local
+categoricals, list-encoded columns and the columns deferred out of the main
+frame. ``utils.data_ingest`` reads every file through its schema: only the
+declared columns are parsed, with fixed dtypes and no type inference, using
+the pyarrow CSV engine when it is installed. Files are checked against their
+schema on ingest (see ``validate_header``).
+
+To load a new column, or describe a new LA28 file, add it here; nothing else
+in the ingest layer needs to change.
+"""
+
+from dataclasses import dataclass, field
+
+OFFSET_FORMAT = "%Y-%m-%dT%H:%M:%S%z"  # 2024-07-24T15:00:00+02:00
+UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"  # 2024-07-25T07:30:00Z
+DATE_FORMAT = "%Y-%m-%d"  # 2024-07-27
+
+# Sources whose dimension columns share one category dictionary (names after renaming)
+SHARED_DIMENSION_SOURCES = ("athletes.csv", "medals.csv", "medallists.csv", "teams.csv", "coaches.csv")
+SHARED_DIMENSIONS = ("noc", "country", "country_long", "discipline", "event", "medal", "gender")
+
+# Dtype used for text columns, including timestamp/date columns before parsing
+TEXT = "str"
+
+
+@dataclass(frozen=True)
+class CsvSchema:
+    """Columns loaded from one CSV and how they are typed."""
+
+    columns: dict  # column -> dtype as read, for the main frame (raw CSV names)
+    required: tuple = ()  # without these the frame is unusable and is served empty
+    timestamps: dict = field(default_factory=dict)  # clock-time column -> exact format
+    dates: tuple = ()  # calendar-date columns (DATE_FORMAT, naive)
+    categoricals: tuple = ()  # low-cardinality columns with their own categories
+    list_columns: tuple = ()  # Python-list-encoded columns (see utils.bridges)
+    deferred: dict = field(default_factory=dict)  # column -> dtype, read on demand only
+    ignored: tuple = ()  # known columns the dashboard does not load
+
+    def dtypes(self, native_datetimes: bool = False) -> dict:
+        """
+        Dtypes to read the main columns with.
+
+        Local categoricals are dictionary-encoded by the parser itself. With
+        ``native_datetimes`` (the pyarrow engine, a strict ISO-8601 parser) clock
+        times and dates are parsed by the reader too; otherwise they are read as
+        text and parsed with their declared format.
+        """
+        dtypes = {
+            column: "category" if column in self.categoricals else dtype for column, dtype in self.columns.items()
+        }
+        if native_datetimes:
+            dtypes.update({column: "datetime64[ns, UTC]" for column in self.timestamps})
+            dtypes.update({column: "datetime64[ns]" for column in self.dates})
+        return dtypes
+
+
+def _text(*columns) -> dict:
+    return {column: TEXT for column in columns}
+
+
+SCHEMAS = {
+    "athletes.csv": CsvSchema(
+        columns={
+            "code": "int64",
+            **_text("name", "gender", "function", "category", "country_code", "country", "country_long"),
+            **_text("disciplines", "events", "birth_date", "coach"),
+            "height": "float64",
+            "weight": "float64",
+        },
+        required=("code", "name", "country_code"),
+        dates=("birth_date",),
+        list_columns=("disciplines", "events", "coach"),
+        ignored=(
+            "current",
+            "name_short",
+            "name_tv",
+            "nationality",
+            "nationality_full",
+            "nationality_code",
+            "birth_place",
+            "birth_country",
+            "residence_place",
+            "residence_country",
+            "nickname",
+            "hobbies",
+            "occupation",
+            "education",
+            "family",
+            "lang",
+            "reason",
+            "hero",
+            "influence",
+            "philosophy",
+            "sporting_relatives",
+            "ritual",
+            "other_sports",
+        ),
+    ),
+    "medals.csv": CsvSchema(
+        columns={
+            **_text("medal_type"),
+            "medal_code": "float64",
+            **_text("medal_date", "name", "gender", "discipline", "event", "event_type", "code"),
+            **_text("country_code", "country", "country_long"),
+        },
+        required=("medal_type", "medal_date", "discipline", "country_code"),
+        dates=("medal_date",),
+        categoricals=("event_type",),
+        deferred=_text("url_event"),
+    ),
+    "medals_total.csv": CsvSchema(
+        columns={
+            **_text("country_code", "country", "country_long"),
+            "Gold Medal": "int64",
+            "Silver Medal": "int64",
+            "Bronze Medal": "int64",
+            "Total": "int64",
+        },
+        required=("country_code", "Total"),
+    ),
+    "medallists.csv": CsvSchema(
+        columns={
+            **_text("medal_date", "medal_type", "name", "gender", "country_code", "country", "country_long"),
+            **_text("team", "team_gender", "discipline", "event", "event_type", "birth_date"),
+            "code_athlete": "int64",
+        },
+        required=("medal_type", "name", "discipline", "country_code"),
+        dates=("medal_date", "birth_date"),
+        categoricals=("team_gender", "event_type"),
+        deferred=_text("url_event"),
+        ignored=("medal_code", "nationality_code", "nationality", "nationality_long", "code_team", "is_medallist"),
+    ),
+    "events.csv": CsvSchema(
+        columns=_text("event", "tag", "sport", "sport_code", "sport_url"),
+        required=("event", "sport"),
+        categoricals=("tag", "sport", "sport_code", "sport_url"),
+    ),
+    "nocs.csv": CsvSchema(
+        columns=_text("code", "country", "country_long", "tag", "note"),
+        required=("code", "country"),
+        categoricals=("note",),
+    ),
+    "coaches.csv": CsvSchema(
+        columns={
+            "code": "int64",
+            **_text("name", "gender", "function", "category", "country_code", "country", "country_long"),
+            **_text("disciplines", "events", "birth_date"),
+        },
+        required=("code", "name"),
+        dates=("birth_date",),
+        categoricals=("function", "category"),
+        ignored=("current",),
+    ),
+    "teams.csv": CsvSchema(
+        columns={
+            **_text("code", "team", "team_gender", "country_code", "country", "country_long", "discipline"),
+            **_text("events", "athletes", "coaches", "athletes_codes", "coaches_codes"),
+        },
+        required=("code", "discipline", "country_code"),
+        categoricals=("team_gender",),
+        list_columns=("athletes", "coaches", "athletes_codes", "coaches_codes"),
+        ignored=("current", "disciplines_code", "num_athletes", "num_coaches"),
+    ),
+    "schedules.csv": CsvSchema(
+        columns={
+            **_text("start_date", "end_date", "day", "status", "discipline", "discipline_code", "event"),
+            "event_medal": "int64",
+            **_text("phase", "gender", "event_type", "venue", "venue_code"),
+            **_text("location_description", "location_code"),
+        },
+        required=("start_date", "end_date", "discipline"),
+        timestamps={"start_date": OFFSET_FORMAT, "end_date": OFFSET_FORMAT},
+        categoricals=(
+            "status",
+            "discipline",
+            "discipline_code",
+            "event",
+            "phase",
+            "gender",
+            "event_type",
+            "venue",
+            "venue_code",
+            "location_description",
+            "location_code",
+        ),
+        deferred=_text("url"),
+    ),
+    "schedules_preliminary.csv": CsvSchema(
+        columns={
+            **_text("date_start_utc", "date_end_utc"),
+            "estimated": "bool",
+            "estimated_start": "bool",
+            **_text("start_text"),
+            "medal": "float64",
+            **_text("venue_code", "description", "venue_code_other", "discription_other"),
+            **_text("team_1_code", "team_1", "team_2_code", "team_2", "tag", "sport", "sport_code"),
+        },
+        required=("date_start_utc", "date_end_utc", "sport"),
+        timestamps={"date_start_utc": UTC_FORMAT, "date_end_utc": UTC_FORMAT},
+        categoricals=("venue_code", "tag", "sport", "sport_code"),
+        deferred=_text("sport_url"),
+    ),
+    "venues.csv": CsvSchema(
+        columns=_text("venue", "sports", "date_start", "date_end", "tag", "url"),
+        required=("venue",),
+        timestamps={"date_start": UTC_FORMAT, "date_end": UTC_FORMAT},
+        list_columns=("sports",),
+    ),
+    "technical_officials.csv": CsvSchema(
+        columns={
+            "code": "int64",
+            **_text("name", "gender", "function", "category", "organisation_code", "organisation"),
+            **_text("organisation_long", "disciplines", "birth_date"),
+        },
+        required=("code", "name"),
+        dates=("birth_date",),
+        categoricals=("function", "category", "organisation_code", "organisation", "organisation_long"),
+        list_columns=("disciplines",),
+        ignored=("current",),
+    ),
+    "torch_route.csv": CsvSchema(
+        columns={**_text("title", "city", "date_start", "date_end", "tag", "url"), "stage_number": "float64"},
+        required=("date_start", "date_end"),
+        timestamps={"date_start": UTC_FORMAT, "date_end": UTC_FORMAT},
+    ),
+}
+
+
+def validate_header(filename: str, header: list) -> tuple:
+    """
+    Compare a CSV header with its schema.
+
+    Returns ``(issues, missing_required)``: ``(severity, message)`` pairs
+    describing schema drift - missing declared columns ("error" if required,
+    "warning" otherwise), undeclared new columns ("info") - and whether a
+    required column is absent.
+    """
+    schema = SCHEMAS[filename]
+    present = set(header)
+    declared = set(schema.columns) | set(schema.deferred) | set(schema.ignored)
+    issues = []
+    missing = [column for column in schema.columns if column not in present]
+    missing_required = [column for column in schema.required if column not in present]
+    if missing_required:
+        issues.append(("error", f"{filename}: missing required column(s) {', '.join(missing_required)}"))
+    optional = [column for column in missing if column not in missing_required]
+    if optional:
+        issues.append(("warning", f"{filename}: missing column(s) {', '.join(optional)}"))
+    extra = [column for column in header if column not in declared]
+    if extra:
+        issues.append(("info", f"{filename}: unknown column(s) {', '.join(extra)} (not loaded)"))
+    return issues, bool(missing_required)
@@ -0,0 +1,186 @@
+"""
+Ingest validation report.
+
+One pass over the data catalog, run once per loaded dataset (see
+``utils.data_ingest.dataset_token``) and cached for the process:
+
+- files missing from ``data/``, unreadable or empty;
+- schema drift and parse problems found while ingesting (``ingest_issues``);
+- null rates per column;
+- NOC codes used by fact tables but absent from nocs.csv;
+- duplicate medal awards.
+
+Issues are logged when the report is built, shown on the Diagnostics page,
+and pages call ``render_data_warnings`` for the sources they depend on, so a
+missing file is reported instead of silently rendering empty charts.
+"""
+
+import logging
+
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import CATALOG, dataset_token, ingest_issues
+from utils.schemas import SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+SEVERITIES = ("error", "warning", "info")
+
+# Fact tables whose NOC codes must exist in nocs.csv
+NOC_COLUMNS = {
+    "athletes": "noc",
+    "medals": "noc",
+    "medals_total": "noc",
+    "medallists": "noc",
+    "teams": "noc",
+    "coaches": "noc",
+}
+
+# Columns identifying one award; a repeated key is a duplicate medal
+MEDAL_KEYS = {
+    "medals": ["discipline", "event", "medal", "code"],
+    "medallists": ["discipline", "event", "medal", "code_athlete"],
+}
+
+
+class IngestReport:
+    """Validation results for every catalog frame."""
+
+    def __init__(self, frames: dict, issues: dict, version: str = ""):
+        self.version = version
+        self.null_rates = self._null_rates(frames)
+        self.orphan_nocs = self._orphan_nocs(frames)
+        self.duplicate_medals = self._duplicate_medals(frames)
+
+        # Cross-file findings; per-file issues were already logged as the files were read
+        findings = []
+        for source, orphans in self.orphan_nocs.groupby("source", sort=False):
+            findings.append(
+                (
+                    "warning",
+                    f"{source}.csv",
+                    f"{source}.csv: {len(orphans)} NOC code(s) not in nocs.csv ({', '.join(orphans['noc'].head(10))})",
+                )
+            )
+        for source, duplicates in self.duplicate_medals.groupby("source", sort=False):
+            findings.append(("warning", f"{source}.csv", f"{source}.csv: {len(duplicates)} duplicate medal award(s)"))
+        self.findings = findings
+
+        rows = [
+            (severity, filename, message)
+            for filename, source_issues in issues.items()
+            for severity, message in source_issues
+        ]
+        self.issues = pd.DataFrame(rows + findings, columns=["severity", "source", "message"])
+        self.issues = self.issues.sort_values(
+            "severity", key=lambda s: s.map(SEVERITIES.index), kind="stable", ignore_index=True
+        )
+        self.files = self._files(frames)
+
+    @staticmethod
+    def _null_rates(frames: dict) -> pd.DataFrame:
+        rows = []
+        for name, df in frames.items():
+            if df.empty:
+                continue
+            nulls = df.isna().sum()
+            for column, count in nulls.items():
+                rows.append((name, column, int(count), round(count / len(df), 4)))
+        return pd.DataFrame(rows, columns=["source", "column", "nulls", "null_rate"])
+
+    @staticmethod
+    def _orphan_nocs(frames: dict) -> pd.DataFrame:
+        nocs = frames.get("nocs", pd.DataFrame())
+        if nocs.empty or "code" not in nocs.columns:
+            return pd.DataFrame(columns=["source", "noc", "rows"])
+        known = set(nocs["code"].dropna().astype(str))
+        parts = []
+        for name, column in NOC_COLUMNS.items():
+            df = frames.get(name, pd.DataFrame())
+            if df.empty or column not in df.columns:
+                continue
+            codes = df[column].dropna().astype(str)
+            orphans = codes[~codes.isin(known)].value_counts()
+            if len(orphans):
+                parts.append(pd.DataFrame({"source": name, "noc": orphans.index, "rows": orphans.to_numpy()}))
+        if not parts:
+            return pd.DataFrame(columns=["source", "noc", "rows"])
+        return pd.concat(parts, ignore_index=True)
+
+    @staticmethod
+    def _duplicate_medals(frames: dict) -> pd.DataFrame:
+        parts = []
+        for name, keys in MEDAL_KEYS.items():
+            df = frames.get(name, pd.DataFrame())
+            if df.empty or not set(keys) <= set(df.columns):
+                continue
+            duplicated = df[df.duplicated(keys, keep=False)]
+            if not duplicated.empty:
+                counts = duplicated.groupby(keys, observed=True, dropna=False).size().reset_index(name="copies")
+                parts.append(counts.assign(source=name))
+        if not parts:
+            return pd.DataFrame(columns=["source", "copies"])
+        return pd.concat(parts, ignore_index=True)
+
+    def _files(self, frames: dict) -> pd.DataFrame:
+        rows = []
+        for filename in SCHEMAS:
+            df = frames.get(filename.removesuffix(".csv"), pd.DataFrame())
+            source_issues = self.issues[self.issues["source"] == filename]
+            errors = int((source_issues["severity"] == "error").sum())
+            warnings = int((source_issues["severity"] == "warning").sum())
+            if source_issues["message"].str.contains("file not found").any():
+                status = "missing"
+            elif errors:
+                status = "error"
+            elif df.empty:
+                status = "empty"
+            elif warnings:
+                status = "warning"
+            else:
+                status = "ok"
+            rows.append((filename, status, len(df), len(df.columns), errors, warnings))
+        return pd.DataFrame(rows, columns=["source", "status", "rows", "columns", "errors", "warnings"])
+
+    @property
+    def has_errors(self) -> bool:
+        return bool((self.issues["severity"] == "error").any())
+
+    def unusable(self, filenames) -> pd.DataFrame:
+        """Rows of ``files`` for the given sources that are missing, invalid or empty."""
+        files = self.files[self.files["source"].isin(list(filenames))]
+        return files[files["status"].isin(["missing", "error", "empty"])]
+
+    def log(self) -> None:
+        """Log a one-line summary plus the cross-file findings."""
+        counts = self.issues["severity"].value_counts()
+        logger.info(
+            "Ingest report for dataset %s: %d error(s), %d warning(s)",
+            self.version,
+            counts.get("error", 0),
+            counts.get("warning", 0),
+        )
+        for _, _, message in self.findings:
+            logger.warning(message)
+
+
+@st.cache_resource(max_entries=2)
+def _build_report(version: str) -> IngestReport:
+    frames = {name: loader() for name, loader in CATALOG.items()}
+    report = IngestReport(frames, ingest_issues(), version)
+    report.log()
+    return report
+
+
+def load_ingest_report() -> IngestReport:
+    """The validation report for the loaded dataset (built and logged once per dataset)."""
+    return _build_report(dataset_token())
+
+
+def render_data_warnings(*filenames) -> None:
+    """Warn on a page when a source it depends on is missing, invalid or empty."""
+    for row in load_ingest_report().unusable(filenames).itertuples(index=False):
+        st.warning(
+            f"**{row.source}** is {row.status}: charts based on it are empty. See the Diagnostics page for details."
+        )
@@ -0,0 +1,172 @@
+"""
+Per-venue, per-hour occupancy from a sweep-line over the schedule.
+
+Every session contributes a +1 event at its start and a -1 event at its end.
+Venues are laid side by side on one time axis (each in its own lane), so a
+single sort and cumulative sum over all events gives the number of concurrent
+sessions at every venue, at every instant. From that step function:
+
+- busy minutes per hour come from interpolating the running "time with at
+  least one session" at the hour boundaries;
+- peak concurrent sessions per hour is the level at the start of the hour,
+  raised by any event that falls inside it.
+
+Venue names in schedules.csv are shortened or split into courts ("La Concorde
+1", "South Paris Arena 4"), so each schedule venue is matched to a venues.csv
+row by shared sports and then name similarity, to attach its sports and
+operating dates.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_ingest import load_venues, parse_list
+from utils.schedule_index import ScheduleIndex, load_schedule_index
+
+_NS_PER_HOUR = 3_600 * 10**9
+_NS_PER_MINUTE = 60 * 10**9
+
+
+def _name_tokens(name: str) -> set:
+    return set(re.sub(r"[^a-z0-9 ]", " ", str(name).lower()).split())
+
+
+def match_venues(schedules: pd.DataFrame, venues: pd.DataFrame) -> dict:
+    """Map each schedule venue name to the venues.csv row position that best describes it (or None)."""
+    if venues.empty or "venue" not in venues.columns:
+        return {}
+    venue_sports = [set(parse_list(sports)) for sports in venues.get("sports", pd.Series([""] * len(venues)))]
+    venue_tokens = [_name_tokens(name) for name in venues["venue"]]
+
+    matches = {}
+    for name, disciplines in schedules.groupby("venue", observed=True)["discipline"]:
+        disciplines = set(disciplines.dropna().astype(str))
+        tokens = _name_tokens(name)
+
+        def score(position):
+            shared = len(tokens & venue_tokens[position]) / max(len(tokens | venue_tokens[position]), 1)
+            return (bool(disciplines & venue_sports[position]), shared)
+
+        best = max(range(len(venues)), key=score)
+        matches[str(name)] = best if score(best)[1] > 0 else None
+    return matches
+
+
+class VenueOccupancy:
+    """Hourly busy minutes and peak concurrent sessions per venue over the whole Games."""
+
+    def __init__(self, index: ScheduleIndex, venues: pd.DataFrame):
+        sessions = index.sessions
+        if sessions.empty or "venue" not in sessions.columns:
+            self.venues = np.array([], dtype=object)
+            self.hours = pd.DatetimeIndex([])
+            self.busy_minutes = np.zeros((0, 0))
+            self.peak_sessions = np.zeros((0, 0), dtype=np.int64)
+            self.venue_info = pd.DataFrame(columns=["venue", "sports", "open_from", "open_until"])
+            return
+
+        # Zero-length sessions (placeholders with start == end) occupy no time
+        has_venue = sessions["venue"].notna().to_numpy() & (index.all.ends > index.all.starts)
+        venue_codes, self.venues = pd.factorize(sessions["venue"].astype(object)[has_venue], sort=True)
+        self.venues = np.asarray(self.venues, dtype=object)
+        starts = index.all.starts[has_venue]
+        ends = index.all.ends[has_venue]
+
+        # Hour grid covering the Games, shared by every venue
+        first = starts.min() - starts.min() % _NS_PER_HOUR
+        n_hours = int(-(-(ends.max() - first) // _NS_PER_HOUR))
+        self.hours = pd.DatetimeIndex(first + np.arange(n_hours, dtype=np.int64) * _NS_PER_HOUR)
+        # One lane per venue, with an empty hour of padding so lanes never touch
+        lane = (n_hours + 1) * _NS_PER_HOUR
+        n_venues = len(self.venues)
+
+        times = np.concatenate([venue_codes * lane + (starts - first), venue_codes * lane + (ends - first)])
+        deltas = np.concatenate([np.ones(len(starts), dtype=np.int64), -np.ones(len(ends), dtype=np.int64)])
+        # Ends sort before starts at the same instant: back-to-back sessions are not concurrent
+        order = np.lexsort((deltas, times))
+        times, deltas = times[order], deltas[order]
+        level = np.cumsum(deltas)
+
+        # Running time with at least one session in progress, evaluated at every hour boundary
+        busy_so_far = np.concatenate([[0], np.cumsum(np.diff(times) * (level[:-1] > 0))])
+        edges = (np.arange(n_venues)[:, None] * lane + np.arange(n_hours + 1)[None, :] * _NS_PER_HOUR).ravel()
+        busy_at_edges = np.interp(edges, times, busy_so_far).reshape(n_venues, n_hours + 1)
+        self.busy_minutes = np.diff(busy_at_edges, axis=1) / _NS_PER_MINUTE
+
+        # Peak concurrency: level in force at each hour start, then every event inside the hour
+        hour_starts = edges.reshape(n_venues, n_hours + 1)[:, :-1].ravel()
+        before = np.searchsorted(times, hour_starts, side="right") - 1
+        peak = np.where(before >= 0, level[np.maximum(before, 0)], 0)
+        # Only the level after the last of several simultaneous events is ever in force
+        settled = np.append(times[1:] != times[:-1], True)
+        event_hour = (times % lane) // _NS_PER_HOUR
+        inside = settled & (event_hour < n_hours)
+        np.maximum.at(peak, (times[inside] // lane) * n_hours + event_hour[inside], level[inside])
+        self.peak_sessions = peak.reshape(n_venues, n_hours)
+
+        self.busy_minutes.setflags(write=False)
+        self.peak_sessions.setflags(write=False)
+        self.venue_info = self._venue_info(sessions, venues)
+
+    def _venue_info(self, sessions: pd.DataFrame, venues: pd.DataFrame) -> pd.DataFrame:
+        """Sports and operating window (local time) of each venue, from the matched venues.csv row."""
+        matches = match_venues(sessions, venues)
+        rows = [matches.get(str(venue)) for venue in self.venues]
+        info = pd.DataFrame({"venue": self.venues})
+        if venues.empty:
+            info["sports"], info["open_from"], info["open_until"] = "", pd.NaT, pd.NaT
+            return info
+
+        # Unmatched venues point one past the end, which reindexes to a missing value
+        positions = [len(venues) if row is None else row for row in rows]
+
+        def column(name):
+            if name not in venues.columns:
+                return pd.Series([None] * len(positions))
+            return venues[name].reset_index(drop=True).reindex(positions).reset_index(drop=True)
+
+        info["sports"] = [", ".join(parse_list(sports)) for sports in column("sports")]
+        for target, source in (("open_from", "date_start"), ("open_until", "date_end")):
+            times = column(source)
+            info[target] = times.dt.tz_localize(None) if hasattr(times, "dt") else pd.NaT
+        return info
+
+    def day_matrix(self, day, metric: str = "busy_minutes") -> np.ndarray:
+        """(venue, hour of day) matrix for one local day."""
+        values = getattr(self, metric)
+        on_day = self.hours.normalize() == pd.Timestamp(day).normalize()
+        matrix = np.zeros((len(self.venues), 24), dtype=float)
+        matrix[:, self.hours.hour[on_day]] = values[:, on_day]
+        return matrix
+
+    def hour_of_day_profile(self, metric: str = "busy_minutes") -> np.ndarray:
+        """
+        (venue, hour of day) matrix over the whole Games.
+
+        Busy minutes are averaged over the days each venue is in use; peak
+        sessions is the maximum over all days.
+        """
+        values = getattr(self, metric)
+        day_codes, _ = pd.factorize(self.hours.normalize())
+        hour_of_day = self.hours.hour.to_numpy()
+
+        profile = np.zeros((len(self.venues), 24), dtype=float)
+        if metric == "peak_sessions":
+            np.maximum.at(profile.T, hour_of_day, values.T)
+            return profile
+        np.add.at(profile.T, hour_of_day, values.T)
+
+        # Days with at least one session at the venue
+        busy_per_day = np.zeros((len(self.venues), day_codes.max() + 1 if len(day_codes) else 0))
+        np.add.at(busy_per_day.T, day_codes, self.busy_minutes.T)
+        active_days = np.maximum((busy_per_day > 0).sum(axis=1), 1)
+        return profile / active_days[:, None]
+
+
+@st.cache_resource
+def load_venue_occupancy() -> VenueOccupancy:
+    """Run the sweep-line once per server process."""
+    return VenueOccupancy(load_schedule_index(), load_venues())
@@ -0,0 +1,202 @@
+"""
+Plotly figure builders for the filter-dependent charts.
+
+Each builder takes an already aggregated frame and returns a finished figure,
+so pages can store it in the shared result cache (``utils.result_cache``) and
+hand the same figure to every session with the same filters. Returned figures
+are shared: do not update them after they come out of the cache.
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Medal colours of the Overview page
+OVERVIEW_MEDAL_COLOURS = {"Gold": "#E50914", "Silver": "#AFAFAF", "Bronze": "#8B4513"}
+
+# Medal colours of the athlete and sport charts
+MEDAL_COLOURS = {"Gold": "#FFD700", "Silver": "#C0C0C0", "Bronze": "#CD7F32"}
+
+GENDER_COLOURS = {"Male": "#3498db", "Female": "#e74c3c"}
+
+
+def _stacked_medal_bars(fig: go.Figure, y: pd.Series, counts: pd.DataFrame, colours: dict) -> go.Figure:
+    """Bronze, Silver then Gold horizontal bars, stacked in that order."""
+    for medal in ("Bronze", "Silver", "Gold"):
+        fig.add_trace(
+            go.Bar(
+                y=y,
+                x=counts[medal],
+                name=medal,
+                orientation="h",
+                marker_color=colours[medal],
+                text=counts[medal],
+                textposition="inside",
+            )
+        )
+    return fig
+
+
+def create_medal_donut(totals: pd.DataFrame) -> go.Figure:
+    """Donut of Gold/Silver/Bronze shares in a medal tally."""
+    medal_data = pd.DataFrame(
+        {
+            "Medal": ["Gold", "Silver", "Bronze"],
+            "Count": [int(totals["Gold"].sum()), int(totals["Silver"].sum()), int(totals["Bronze"].sum())],
+        }
+    )
+    fig = px.pie(
+        medal_data,
+        values="Count",
+        names="Medal",
+        hole=0.4,
+        color="Medal",
+        color_discrete_map=OVERVIEW_MEDAL_COLOURS,
+    )
+    fig.update_traces(
+        textposition="inside",
+        textinfo="percent+label+value",
+        hovertemplate="<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>",
+    )
+    fig.update_layout(
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2),
+        height=400,
+        margin=dict(t=20, b=60, l=20, r=20),
+    )
+    return fig
+
+
+def create_top10_standings(totals: pd.DataFrame) -> go.Figure:
+    """Stacked horizontal bars for the first ten rows of a tally (sorted by the caller)."""
+    top10 = totals.head(10).sort_values("Total", ascending=True)
+    fig = _stacked_medal_bars(go.Figure(), top10["country"], top10, OVERVIEW_MEDAL_COLOURS)
+    fig.update_layout(
+        barmode="stack",
+        height=400,
+        margin=dict(t=20, b=20, l=20, r=20),
+        xaxis_title="Total Medals",
+        yaxis_title="",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2),
+        hovermode="y unified",
+    )
+    return fig
+
+
+def create_world_medal_map(totals: pd.DataFrame) -> go.Figure:
+    """Choropleth of total medals per country (``iso_alpha`` locations)."""
+    fig = px.choropleth(
+        totals,
+        locations="iso_alpha",
+        color="Total",
+        hover_name="Country",
+        hover_data=["Gold", "Silver", "Bronze", "Total"],
+        color_continuous_scale="Plasma",
+        projection="natural earth",
+        title=None,
+    )
+    fig.update_layout(height=600, margin=dict(t=20, b=0, l=0, r=0))
+    return fig
+
+
+def create_age_box(athletes: pd.DataFrame) -> go.Figure:
+    """Athlete age distribution by gender."""
+    fig = px.box(
+        athletes,
+        x="gender",
+        y="age",
+        color="gender",
+        color_discrete_map=GENDER_COLOURS,
+        title="Age Distribution by Gender",
+    )
+    fig.update_layout(height=400, showlegend=False, xaxis_title="", yaxis_title="Age")
+    return fig
+
+
+def create_age_violin(athletes: pd.DataFrame) -> go.Figure:
+    """Athlete age distribution by continent (``Continent`` column)."""
+    fig = px.violin(
+        athletes, x="Continent", y="age", color="Continent", box=True, title="Age Distribution by Continent"
+    )
+    fig.update_layout(height=400, showlegend=False, xaxis_title="", yaxis_title="Age")
+    return fig
+
+
+def create_top_athletes_bar(athlete_medals: pd.DataFrame) -> go.Figure:
+    """Stacked medal bars per athlete (``name`` plus medal count columns)."""
+    fig = _stacked_medal_bars(go.Figure(), athlete_medals["name"], athlete_medals, MEDAL_COLOURS)
+    fig.update_layout(
+        barmode="stack",
+        height=450,
+        xaxis_title="Total Medals",
+        yaxis_title="",
+        yaxis=dict(categoryorder="total ascending"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02),
+        title="Top 10 Athletes by Medal Count",
+    )
+    return fig
+
+
+def create_sport_treemap(sport_medals: pd.DataFrame) -> go.Figure:
+    """Treemap of medal counts by discipline and medal type."""
+    fig = px.treemap(
+        sport_medals,
+        path=["discipline", "medal"],
+        values="Count",
+        color="medal",
+        color_discrete_map=MEDAL_COLOURS,
+    )
+    fig.update_layout(
+        height=500,
+        margin=dict(t=20, b=20, l=20, r=20),
+    )
+    fig.update_traces(textinfo="label+value", hovertemplate="<b>%{label}</b><br>Count: %{value}<extra></extra>")
+    return fig
+
+
+def _hierarchy_figure(builder, agg: pd.DataFrame, **kwargs) -> go.Figure:
+    fig = builder(agg, path=["Continent", "Country", "discipline"], values="Medals", **kwargs)
+    fig.update_layout(height=550, margin=dict(t=30))
+    return fig
+
+
+def create_hierarchy_sunburst(agg: pd.DataFrame) -> go.Figure:
+    """Sunburst of medals by continent, country and discipline (``Medals`` per row)."""
+    return _hierarchy_figure(px.sunburst, agg, color="Continent", color_discrete_sequence=px.colors.qualitative.Vivid)
+
+
+def create_hierarchy_treemap(agg: pd.DataFrame) -> go.Figure:
+    """Treemap of medals by continent, country and discipline, coloured by medal count."""
+    return _hierarchy_figure(px.treemap, agg, color="Medals", color_continuous_scale="Turbo")
+
+
+def _grouped_medal_bars(counts: pd.DataFrame, x: str) -> go.Figure:
+    """Gold/Silver/Bronze bars side by side per ``x`` value."""
+    melted = counts.melt(id_vars=x, value_vars=["Gold", "Silver", "Bronze"], var_name="Medal", value_name="Count")
+    fig = px.bar(
+        melted,
+        x=x,
+        y="Count",
+        color="Medal",
+        barmode="group",
+        text="Count",
+        color_discrete_map=OVERVIEW_MEDAL_COLOURS,
+    )
+    fig.update_traces(textposition="outside")
+    return fig
+
+
+def create_continent_medal_bars(totals: pd.DataFrame) -> go.Figure:
+    """Medals per continent, from a per-country tally with a ``Continent`` column."""
+    continents = totals.groupby("Continent", observed=True)[["Gold", "Silver", "Bronze"]].sum().reset_index()
+    fig = _grouped_medal_bars(continents, "Continent")
+    fig.update_layout(height=500)
+    return fig
+
+
+def create_top20_medal_bars(totals: pd.DataFrame) -> go.Figure:
+    """Medals of the 20 countries with the most medals (``Country`` column)."""
+    top20 = totals.sort_values("Total", ascending=False).head(20)
+    fig = _grouped_medal_bars(top20, "Country")
+    fig.update_layout(xaxis_tickangle=-45, height=550)
+    return fig
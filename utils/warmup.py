@@ -0,0 +1,201 @@
+"""
+Boot-time cache warm-up and readiness signal.
+
+    python -m utils.warmup -- --server.port=$PORT --server.headless=true
+
+runs in the server process, before the port is opened:
+
+1. ``load_catalog`` reads every source (from the bundle when it is built);
+2. each dashboard page is executed headlessly with the default filters and
+   with the most popular single-dimension filter states (each continent, the
+   top medal-winning countries and disciplines, Gold only) and, for the
+   default filters, with every section selected, which fills the
+   process-wide caches: indexes, the medal cube, and the tallies and figures
+   in the shared result cache (``utils.result_cache``);
+3. a readiness file is written (``LA28_READY_FILE``, default
+   ``data/.cache/ready``) with the dataset token and warm-up timings;
+4. Streamlit is started in the same process, with the remaining arguments, so
+   the first visitors hit warm caches.
+
+Streamlit's ``/_stcore/health`` endpoint only answers once the server is up,
+i.e. after the warm-up, so a load balancer can poll either it or the file.
+The file is removed when a warm-up starts; a failed page run is logged and
+does not block the server from starting. ``--no-serve`` only warms and writes
+the file. The number of countries and disciplines warmed is set with
+``--top`` or ``LA28_WARMUP_TOP``.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from utils.data_ingest import CACHE_PATH, dataset_token, load_catalog, load_medals, load_medals_total
+from utils.mappers import CONTINENTS
+from utils.shared_filters import noc_with_flag
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+MAIN_SCRIPT = APP_ROOT / "Overview.py"
+
+# Pages whose results are warmed, in order
+WARMUP_PAGES = ["Overview.py", "pages/Global_Analysis.py", "pages/Sports_and_Events.py", "pages/Athlete_Performance.py"]
+
+WARMUP_TOP = int(os.environ.get("LA28_WARMUP_TOP", 5))
+READY_FILE = Path(os.environ.get("LA28_READY_FILE", CACHE_PATH / "ready"))
+PAGE_TIMEOUT = 120
+
+# Sidebar filter widgets by label: ``render_global_filters`` and Global Analysis' own sidebar
+FILTER_LABELS = {
+    "🌍 Continent": "continents",
+    "🏳️ Country (NOC)": "countries",
+    "Country (NOC)": "countries",
+    "🏃 Sport": "sports",
+    "Sport": "sports",
+    "Medal Type": "medal_types",
+}
+MEDAL_CHECKBOXES = {"🥇Gold": "Gold", "🥈Silver": "Silver", "🥉Bronze": "Bronze"}
+MEDAL_TYPES = list(MEDAL_CHECKBOXES.values())
+
+# Section selectors of the pages that render one section at a time
+SECTION_RADIOS = ["overview_section", "global_section"]
+
+
+def popular_filter_states(top: int = WARMUP_TOP) -> list:
+    """(label, selection) for every filter state to warm, default first; a selection names one filtered value."""
+    states = [("default", {})]
+    states += [(continent, {"continents": continent}) for continent in CONTINENTS]
+
+    medals_total = load_medals_total()
+    if not medals_total.empty:
+        states += [(noc, {"countries": noc}) for noc in medals_total.nlargest(top, "Total")["noc"]]
+
+    medals = load_medals()
+    if not medals.empty:
+        disciplines = medals["discipline"].value_counts().head(top).index
+        states += [(discipline, {"sports": discipline}) for discipline in disciplines]
+
+    states.append(("Gold", {"medal_types": "Gold"}))
+    return states
+
+
+def _set_filters(at: AppTest, selection: dict) -> None:
+    """Select one filter state in the sidebar (every other filter back to its default)."""
+    medal_types = [selection["medal_types"]] if "medal_types" in selection else MEDAL_TYPES
+    for multiselect in at.sidebar.multiselect:
+        dimension = FILTER_LABELS.get(multiselect.label)
+        if dimension is None:
+            continue
+        if dimension == "medal_types":
+            multiselect.set_value(medal_types)
+        elif dimension in selection:
+            # Country options carry a flag on some pages and are plain NOC codes on others
+            value = selection[dimension]
+            candidates = [noc_with_flag(value), value] if dimension == "countries" else [value]
+            multiselect.set_value([option for option in candidates if option in multiselect.options][:1])
+        else:
+            multiselect.set_value([])
+    for checkbox in at.sidebar.checkbox:
+        if checkbox.label in MEDAL_CHECKBOXES:
+            checkbox.set_value(MEDAL_CHECKBOXES[checkbox.label] in medal_types)
+
+
+def _run(at: AppTest, page: str, label: str) -> bool:
+    """Rerun the page; True when it ran without raising."""
+    try:
+        at.run()
+    except Exception:
+        logger.exception("Warm-up of %s (%s) failed", page, label)
+        return False
+    if at.exception:
+        logger.warning("Warm-up of %s (%s) raised: %s", page, label, at.exception[0].value)
+        return False
+    return True
+
+
+def warm_sections(at: AppTest, page: str) -> None:
+    """Render every section of the page once (current filters), then go back to the first one."""
+    for radio in at.radio:
+        if radio.key not in SECTION_RADIOS:
+            continue
+        for option in radio.options[1:]:
+            at.radio(key=radio.key).set_value(option)
+            _run(at, page, option)
+        at.radio(key=radio.key).set_value(radio.options[0])
+
+
+def warm_page(page: str, states: list) -> int:
+    """Run one page headlessly for every filter state (the first one is the default); return the clean runs."""
+    # AppTest executes the page script in this process, so every cache it fills is the server's
+    at = AppTest.from_file(str(APP_ROOT / page), default_timeout=PAGE_TIMEOUT)
+    clean = 0
+    for position, (label, selection) in enumerate(states):
+        if position:
+            _set_filters(at, selection)
+        clean += _run(at, page, label)
+        if not position:
+            # Popular states warm the first section only; every section is warmed for the default filters
+            warm_sections(at, page)
+    return clean
+
+
+def warm_up(top: int = WARMUP_TOP) -> dict:
+    """Load every source, run each page for the popular filter states and write the readiness file."""
+    READY_FILE.unlink(missing_ok=True)
+    started = time.perf_counter()
+
+    timings = load_catalog()
+    states = popular_filter_states(top)
+    pages = {}
+    for page in WARMUP_PAGES:
+        page_started = time.perf_counter()
+        clean = warm_page(page, states)
+        pages[page] = {"runs": clean, "seconds": round(time.perf_counter() - page_started, 2)}
+        logger.info("Warmed %s: %d/%d filter states in %.1fs", page, clean, len(states), pages[page]["seconds"])
+
+    status = {
+        "dataset": dataset_token(),
+        "pid": os.getpid(),
+        "sources": len(timings),
+        "filter_states": [label for label, _ in states],
+        "pages": pages,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+    READY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = READY_FILE.with_name(f".{READY_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(status, indent=2))
+    os.replace(tmp, READY_FILE)
+    logger.info("Warm-up finished in %.1fs; ready file %s", status["seconds"], READY_FILE)
+    return status
+
+
+def serve(streamlit_args: list) -> int:
+    """Start the Streamlit server in this process, so it serves from the caches just warmed."""
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", str(MAIN_SCRIPT), *streamlit_args]
+    return stcli.main()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.warmup", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=WARMUP_TOP, help="countries and disciplines to warm")
+    parser.add_argument("--no-serve", action="store_true", help="warm up and write the ready file, then exit")
+    parser.add_argument("streamlit_args", nargs="*", help="passed to `streamlit run` (after --)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    warm_up(args.top)
+    if args.no_serve:
+        return 0
+    return serve(args.streamlit_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())